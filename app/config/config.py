@@ -1,5 +1,5 @@
 import os
-from typing import List
+from typing import List, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -8,9 +8,34 @@ load_dotenv()
 class Settings:
     JWT_SECRET: str = os.getenv("JWT_SECRET", "amangirdharamangirdhar123123")
     JWT_EXPIRATION_HOURS: int = 24
+    TOKEN_CACHE_MAX_ENTRIES: int = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "10000"))
+
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
 
     AWS_REGION: str = os.getenv("AWS_REGION", "us-east-1")
     DYNAMODB_TABLE_NAME: str = os.getenv("TABLE_NAME", "MeetingRoomSystem")
+    PARTITION_SHARD_COUNT: int = int(os.getenv("PARTITION_SHARD_COUNT", "1"))
+
+    # "boto3" runs the SDK on a thread pool, "async" uses the native asyncio
+    # client and "memory" keeps the table in-process for tests and benchmarks
+    DYNAMODB_BACKEND: str = os.getenv("DYNAMODB_BACKEND", "boto3")
+    DYNAMODB_ENDPOINT_URL: Optional[str] = os.getenv("DYNAMODB_ENDPOINT_URL") or None
+    DYNAMODB_ASYNC_MAX_CONNECTIONS: int = int(
+        os.getenv("DYNAMODB_ASYNC_MAX_CONNECTIONS", "512")
+    )
+    MEMORY_DYNAMODB_LATENCY_MS: float = float(
+        os.getenv("MEMORY_DYNAMODB_LATENCY_MS", "0")
+    )
+    DYNAMODB_MAX_WORKERS: int = int(os.getenv("DYNAMODB_MAX_WORKERS", "32"))
+    DYNAMODB_MAX_POOL_CONNECTIONS: int = int(
+        os.getenv("DYNAMODB_MAX_POOL_CONNECTIONS", "32")
+    )
+    DYNAMODB_RETRY_MODE: str = os.getenv("DYNAMODB_RETRY_MODE", "standard")
+    DYNAMODB_MAX_ATTEMPTS: int = int(os.getenv("DYNAMODB_MAX_ATTEMPTS", "3"))
+    DYNAMODB_CONNECT_TIMEOUT: float = float(os.getenv("DYNAMODB_CONNECT_TIMEOUT", "2"))
+    DYNAMODB_READ_TIMEOUT: float = float(os.getenv("DYNAMODB_READ_TIMEOUT", "5"))
 
     CORS_ALLOWED_ORIGINS: List[str] = [
         "http://localhost:4200",
@@ -21,8 +46,32 @@ class Settings:
         "admin@example.com",
     ]
 
+    CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+    CACHE_TTL_SECONDS: float = float(os.getenv("CACHE_TTL_SECONDS", "30"))
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    # Per-request DynamoDB traces are logged; DEBUG also returns them in a
+    # Server-Timing header
+    REQUEST_TRACE_ENABLED: bool = (
+        os.getenv("REQUEST_TRACE_ENABLED", "true").lower() == "true"
+    )
+    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
+    PROFILE_MAX_SECONDS: float = float(os.getenv("PROFILE_MAX_SECONDS", "60"))
+
     SERVER_PORT: int = int(os.getenv("SERVER_PORT", "8000"))
     MAX_BOOKING_DAYS_IN_FUTURE: int = int(os.getenv("MAX_BOOKING_DAYS_IN_FUTURE", "10"))
+    MAX_BOOKING_DURATION_HOURS: int = int(os.getenv("MAX_BOOKING_DURATION_HOURS", "12"))
+    BOOKING_SLOT_MINUTES: int = int(os.getenv("BOOKING_SLOT_MINUTES", "15"))
+    AVAILABILITY_INDEX_TTL_SECONDS: float = float(
+        os.getenv("AVAILABILITY_INDEX_TTL_SECONDS", "60")
+    )
+    MAX_BULK_BOOKINGS: int = int(os.getenv("MAX_BULK_BOOKINGS", "200"))
+    MAX_SCHEDULE_GRID_DAYS: int = int(os.getenv("MAX_SCHEDULE_GRID_DAYS", "31"))
+    MAX_SCHEDULE_GRID_ROOMS: int = int(os.getenv("MAX_SCHEDULE_GRID_ROOMS", "100"))
+    CASCADE_DELETE_PAGE_SIZE: int = int(os.getenv("CASCADE_DELETE_PAGE_SIZE", "100"))
+    JOB_LEASE_SECONDS: int = int(os.getenv("JOB_LEASE_SECONDS", "60"))
+    JOB_RETENTION_DAYS: int = int(os.getenv("JOB_RETENTION_DAYS", "7"))
 
 
 settings = Settings()
@@ -1,9 +1,13 @@
 from typing import Dict
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from app.models.pydantic_models import LoginUserRequest, LoginUserResponse, UserDTO
 from app.services.auth_service import AuthService
-from app.dependencies.dependencies import get_auth_service, AuthServiceInstance
-from app.utils.errors import InvalidInputError, UnauthorizedError
+from app.dependencies.dependencies import (
+    get_auth_service,
+    AuthServiceInstance,
+    MetricsInstance,
+)
+from app.utils.errors import InvalidInputError, NotFoundError, UnauthorizedError
 
 
 auth_router: APIRouter = APIRouter(tags=["Authentication"])
@@ -24,3 +28,12 @@ async def login(
 @auth_router.get("/health")
 async def health_check() -> Dict[str, str]:
     return {"status": "ok"}
+
+
+@auth_router.get("/metrics", include_in_schema=False)
+async def get_metrics(metrics: MetricsInstance) -> Response:
+    if metrics is None:
+        raise NotFoundError("Metrics are disabled")
+    return Response(
+        content=metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
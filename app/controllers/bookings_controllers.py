@@ -1,16 +1,23 @@
-from fastapi import APIRouter, Depends, Query, Request
-from typing import List
-from app.models.models import Booking
+from fastapi import APIRouter, Depends, Query, Request, Response
+from typing import List, Optional
+from app.models.models import Booking, Page
 from app.models.pydantic_models import (
     CreateBookingRequest,
+    BulkCreateBookingRequest,
+    BulkCreateBookingResponse,
+    BulkBookingResultDTO,
     BookingDTO,
     GenericResponse,
     RoomScheduleResponse as RoomScheduleDTO,
+    ScheduleGridResponse,
+    ScheduleGridRoomDTO,
     ScheduleSlotDTO,
 )
 from app.services.bookings_service import BookingService
 from app.dependencies.dependencies import get_booking_service, BookingServiceInstance
 from app.middleware.auth_middleware import set_current_user, require_admin_state
+from app.utils.conditional import make_etag, not_modified, set_validators
+from app.utils.responses import trusted_list_response
 from app.utils.errors import (
     InvalidInputError,
     NotFoundError,
@@ -43,13 +50,65 @@ async def create_booking(
     return GenericResponse(message="booking created successfully")
 
 
+@bookings_router.post("/bookings/bulk", response_model=BulkCreateBookingResponse)
+async def create_bookings_bulk(
+    req: Request,
+    request: BulkCreateBookingRequest,
+    booking_service: BookingServiceInstance,
+) -> BulkCreateBookingResponse:
+    results = await booking_service.create_bookings_bulk(
+        req.state.user.get("user_id"), request.bookings
+    )
+    created = sum(1 for r in results if r.status == "created")
+    return BulkCreateBookingResponse(
+        created=created,
+        failed=len(results) - created,
+        results=[BulkBookingResultDTO(**r.model_dump()) for r in results],
+    )
+
+
+@bookings_router.get("/bookings/my", response_model=List[BookingDTO])
+async def get_bookings_by_user_id(
+    req: Request,
+    booking_service: BookingServiceInstance,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    next_token: Optional[str] = Query(None),
+) -> Response:
+    user_id: str = req.state.user.get("user_id")
+    watermark = await booking_service.get_user_bookings_watermark(user_id)
+    etag = make_etag("bookings", user_id, watermark.version, req.url.query)
+    cached = not_modified(req, etag, watermark.updated_at)
+    if cached:
+        return cached
+
+    page: Page[Booking] = await booking_service.get_bookings_by_user_id(
+        user_id, limit, next_token
+    )
+    return set_validators(
+        trusted_list_response(
+            BookingDTO,
+            ({**b.__dict__, "status": b.status.lower()} for b in page.items),
+            page.next_token,
+        ),
+        etag,
+        watermark.updated_at,
+    )
+
+
 @bookings_router.get("/bookings/{booking_id}", response_model=BookingDTO)
 async def get_booking_by_id(
     req: Request,
+    response: Response,
     booking_id: str,
     booking_service: BookingServiceInstance,
 ) -> BookingDTO:
     booking: Booking = await booking_service.get_booking_by_id(booking_id)
+    etag = make_etag("booking", *booking.__dict__.values())
+    cached = not_modified(req, etag, booking.updated_at)
+    if cached:
+        return cached
+
+    set_validators(response, etag, booking.updated_at)
     return BookingDTO(**{**booking.model_dump(), "status": booking.status.lower()})
 
 
@@ -67,15 +126,23 @@ async def cancel_booking(
 async def get_all_bookings(
     req: Request,
     booking_service: BookingServiceInstance,
-) -> List[BookingDTO]:
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    next_token: Optional[str] = Query(None),
+) -> Response:
     if req.state.user.get("role") == "admin":
-        bookings: List[Booking] = await booking_service.get_all_bookings()
+        page: Page[Booking] = await booking_service.get_all_bookings(
+            limit, next_token
+        )
     else:
         user_id: str = req.state.user.get("user_id")
-        bookings = await booking_service.get_bookings_by_user_id(user_id)
-    return [
-        BookingDTO(**{**b.model_dump(), "status": b.status.lower()}) for b in bookings
-    ]
+        page = await booking_service.get_bookings_by_user_id(
+            user_id, limit, next_token
+        )
+    return trusted_list_response(
+        BookingDTO,
+        ({**b.__dict__, "status": b.status.lower()} for b in page.items),
+        page.next_token,
+    )
 
 
 @bookings_router.get("/rooms/{room_id}/bookings", response_model=List[BookingDTO])
@@ -83,28 +150,62 @@ async def get_bookings_by_room_id(
     req: Request,
     room_id: str,
     booking_service: BookingServiceInstance,
-) -> List[BookingDTO]:
-    bookings: List[Booking] = await booking_service.get_bookings_by_room_id(room_id)
-    return [
-        BookingDTO(**{**b.model_dump(), "status": b.status.lower()}) for b in bookings
-    ]
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    next_token: Optional[str] = Query(None),
+) -> Response:
+    page: Page[Booking] = await booking_service.get_bookings_by_room_id(
+        room_id, limit, next_token
+    )
+    return trusted_list_response(
+        BookingDTO,
+        ({**b.__dict__, "status": b.status.lower()} for b in page.items),
+        page.next_token,
+    )
 
 
-@bookings_router.get("/bookings/my", response_model=List[BookingDTO])
-async def get_bookings_by_user_id(
+@bookings_router.get("/rooms/schedule-grid", response_model=ScheduleGridResponse)
+async def get_schedule_grid(
     req: Request,
+    response: Response,
     booking_service: BookingServiceInstance,
-) -> List[BookingDTO]:
-    user_id: str = req.state.user.get("user_id")
-    bookings: List[Booking] = await booking_service.get_bookings_by_user_id(user_id)
-    return [
-        BookingDTO(**{**b.model_dump(), "status": b.status.lower()}) for b in bookings
-    ]
+    start_date: str = Query(..., description="Date in YYYY-MM-DD format"),
+    days: int = Query(7, ge=1),
+    room_id: Optional[List[str]] = Query(None),
+    floor: Optional[int] = Query(None, ge=0),
+) -> ScheduleGridResponse:
+    try:
+        from datetime import datetime, timezone
+
+        date_obj = datetime.strptime(start_date, "%Y-%m-%d")
+        unix_timestamp = int(date_obj.replace(tzinfo=timezone.utc).timestamp())
+    except (ValueError, AttributeError):
+        raise InvalidInputError("Invalid date format. Use YYYY-MM-DD")
+
+    grid = await booking_service.get_schedule_grid(
+        unix_timestamp, days, room_ids=room_id, floor=floor
+    )
+    etag = make_etag(
+        "grid",
+        req.url.query,
+        *grid.versions,
+        *((room.room_id, room.room_name, room.room_number) for room in grid.rooms),
+    )
+    cached = not_modified(req, etag, grid.updated_at)
+    if cached:
+        return cached
+
+    set_validators(response, etag, grid.updated_at)
+    return ScheduleGridResponse(
+        start=grid.start,
+        days=grid.days,
+        rooms=[ScheduleGridRoomDTO(**room.model_dump()) for room in grid.rooms],
+    )
 
 
 @bookings_router.get("/rooms/{room_id}/schedule", response_model=RoomScheduleDTO)
 async def get_room_schedule_by_date(
     req: Request,
+    response: Response,
     room_id: str,
     booking_service: BookingServiceInstance,
     date: str = Query(..., description="Date in YYYY-MM-DD format"),
@@ -118,7 +219,19 @@ async def get_room_schedule_by_date(
         raise InvalidInputError("Invalid date format. Use YYYY-MM-DD")
 
     schedule = await booking_service.get_room_schedule_by_date(room_id, unix_timestamp)
+    etag = make_etag(
+        "schedule",
+        room_id,
+        unix_timestamp,
+        schedule.version,
+        schedule.room_name,
+        schedule.room_number,
+    )
+    cached = not_modified(req, etag, schedule.updated_at)
+    if cached:
+        return cached
 
+    set_validators(response, etag, schedule.updated_at)
     return RoomScheduleDTO(
         room_id=schedule.room_id,
         room_name=schedule.room_name,
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, Request
+from app.models.models import Job
+from app.models.pydantic_models import JobDTO
+from app.dependencies.dependencies import JobServiceInstance
+from app.middleware.auth_middleware import set_current_user, require_admin_state
+
+
+jobs_router: APIRouter = APIRouter(
+    prefix="/api",
+    tags=["Jobs"],
+    dependencies=[Depends(set_current_user), Depends(require_admin_state)],
+)
+
+
+@jobs_router.get("/jobs/{job_id}", response_model=JobDTO)
+async def get_job(
+    req: Request,
+    job_id: str,
+    job_service: JobServiceInstance,
+) -> JobDTO:
+    job: Job = await job_service.get_job(job_id)
+    return JobDTO(**job.model_dump(exclude={"checkpoint"}))
@@ -0,0 +1,28 @@
+import time
+from fastapi import APIRouter, Depends, Query, Request, Response
+from app.dependencies.dependencies import ProfilerInstance
+from app.middleware.auth_middleware import set_current_user, require_admin_state
+
+
+profiling_router: APIRouter = APIRouter(
+    prefix="/api",
+    tags=["Profiling"],
+    dependencies=[Depends(set_current_user), Depends(require_admin_state)],
+)
+
+
+@profiling_router.post("/profile")
+async def profile(
+    req: Request,
+    profiler: ProfilerInstance,
+    seconds: float = Query(10, description="How long to sample"),
+    interval_ms: float = Query(10, description="Time between samples"),
+) -> Response:
+    collapsed: str = await profiler.profile(seconds, interval_ms / 1000)
+    return Response(
+        content=collapsed,
+        media_type="text/plain; charset=utf-8",
+        headers={
+            "Content-Disposition": f'attachment; filename="profile-{int(time.time())}.folded"'
+        },
+    )
@@ -1,15 +1,19 @@
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Query, Request, Response
 from typing import Optional, List
-from app.models.models import Room
+from app.models.models import Room, Page
 from app.models.pydantic_models import (
     AddRoomRequest,
     UpdateRoomRequest,
     RoomDTO,
+    RoomSearchResultDTO,
+    TimeSlotDTO,
     GenericResponse,
 )
 from app.services.rooms_service import RoomService
 from app.dependencies.dependencies import get_room_service, RoomServiceInstance
 from app.middleware.auth_middleware import set_current_user, require_admin_state
+from app.utils.conditional import make_etag, not_modified, set_validators
+from app.utils.responses import trusted_list_response
 from app.utils.errors import InvalidInputError, NotFoundError, ConflictError
 
 
@@ -47,19 +51,95 @@ async def add_room(
 
 @rooms_router.get("/rooms", response_model=List[RoomDTO], dependencies=[])
 async def get_all_rooms(
+    req: Request,
     room_service: RoomServiceInstance,
-) -> List[RoomDTO]:
-    rooms: List[Room] = await room_service.get_all_rooms()
-    return [RoomDTO(**{**r.model_dump(), "status": r.status.lower()}) for r in rooms]
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    next_token: Optional[str] = Query(None),
+    floor: Optional[int] = Query(None, ge=0),
+    min_capacity: Optional[int] = Query(None, ge=1),
+    status: Optional[str] = Query(None, pattern="^(available|unavailable|maintenance)$"),
+    amenity: Optional[List[str]] = Query(None),
+) -> Response:
+    # The watermark is read before the rooms, so a concurrent write can only
+    # pair a newer body with an older ETag, which the next request refetches.
+    watermark = await room_service.get_rooms_watermark()
+    etag = make_etag("rooms", watermark.version, req.url.query)
+    cached = not_modified(req, etag, watermark.updated_at)
+    if cached:
+        return cached
+
+    page: Page[Room] = await room_service.get_all_rooms(
+        limit,
+        next_token,
+        floor=floor,
+        min_capacity=min_capacity,
+        status=status,
+        amenities=amenity,
+    )
+    return set_validators(
+        trusted_list_response(
+            RoomDTO,
+            ({**r.__dict__, "status": r.status.lower()} for r in page.items),
+            page.next_token,
+        ),
+        etag,
+        watermark.updated_at,
+    )
+
+
+@rooms_router.get("/rooms/search", response_model=List[RoomSearchResultDTO])
+async def search_rooms(
+    room_service: RoomServiceInstance,
+    start_time: Optional[int] = Query(None, gt=0),
+    end_time: Optional[int] = Query(None, gt=0),
+    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format"),
+    duration_minutes: Optional[int] = Query(None, ge=1, le=1440),
+    min_capacity: Optional[int] = Query(None, ge=1),
+    floor: Optional[int] = Query(None, ge=0),
+    amenities: Optional[List[str]] = Query(None),
+) -> List[RoomSearchResultDTO]:
+    day: Optional[int] = None
+    if date:
+        try:
+            from datetime import datetime, timezone
+
+            date_obj = datetime.strptime(date, "%Y-%m-%d")
+            day = int(date_obj.replace(tzinfo=timezone.utc).timestamp())
+        except (ValueError, AttributeError):
+            raise InvalidInputError("Invalid date format. Use YYYY-MM-DD")
+
+    results = await room_service.search_available_rooms(
+        start_time=start_time,
+        end_time=end_time,
+        date=day,
+        duration=duration_minutes * 60 if duration_minutes else None,
+        min_capacity=min_capacity,
+        floor=floor,
+        amenities=amenities,
+    )
+    return [
+        RoomSearchResultDTO(
+            **{**r.room.model_dump(), "status": r.room.status.lower()},
+            free_slots=[TimeSlotDTO(**slot.model_dump()) for slot in r.free_slots],
+        )
+        for r in results
+    ]
 
 
 @rooms_router.get("/rooms/{id}", response_model=RoomDTO)
 async def get_room_by_id(
     req: Request,
+    response: Response,
     id: str,
     room_service: RoomServiceInstance,
 ) -> RoomDTO:
     room: Room = await room_service.get_room_by_id(id)
+    etag = make_etag("room", *room.__dict__.values())
+    cached = not_modified(req, etag, room.updated_at)
+    if cached:
+        return cached
+
+    set_validators(response, etag, room.updated_at)
     return RoomDTO(**{**room.model_dump(), "status": room.status.lower()})
 
 
@@ -1,15 +1,17 @@
-from fastapi import APIRouter, Depends, Request
-from typing import List
-from app.models.models import User
+from fastapi import APIRouter, Depends, Query, Request, Response
+from typing import List, Optional
+from app.models.models import User, Page
 from app.models.pydantic_models import (
     RegisterUserRequest,
     UpdateUserRequest,
     UserDTO,
+    UserDeletionResponse,
     GenericResponse,
 )
 from app.services.users_service import UserService
 from app.dependencies.dependencies import get_user_service, UserServiceInstance
 from app.middleware.auth_middleware import set_current_user, require_admin_state
+from app.utils.responses import trusted_list_response
 from app.utils.errors import InvalidInputError, NotFoundError, ConflictError
 
 
@@ -47,9 +49,14 @@ async def register(
 async def get_all_users(
     req: Request,
     user_service: UserServiceInstance,
-) -> List[UserDTO]:
-    users: List[User] = await user_service.get_all_users()
-    return [UserDTO(**u.model_dump(exclude={"password"})) for u in users]
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    next_token: Optional[str] = Query(None),
+) -> Response:
+    page: Page[User] = await user_service.get_all_users(limit, next_token)
+    # Rows are projected onto UserDTO's fields, which omit the password hash.
+    return trusted_list_response(
+        UserDTO, (u.__dict__ for u in page.items), page.next_token
+    )
 
 
 @users_router.get("/users/{user_id}", response_model=UserDTO)
@@ -79,14 +86,21 @@ async def update_user(
 
 @users_router.delete(
     "/users/{id}",
-    response_model=GenericResponse,
+    response_model=UserDeletionResponse,
+    status_code=202,
     dependencies=[Depends(require_admin_state)],
 )
 async def delete_user_by_id(
     req: Request,
+    response: Response,
     id: str,
     user_service: UserServiceInstance,
-) -> GenericResponse:
+) -> UserDeletionResponse:
     current_user_id: str = req.state.user.get("user_id")
-    await user_service.delete_user_by_id(id, current_user_id)
-    return GenericResponse(message="user deleted successfully")
+    job = await user_service.delete_user_by_id(id, current_user_id)
+    if job is None:
+        response.status_code = 200
+        return UserDeletionResponse(message="user deleted successfully")
+    return UserDeletionResponse(
+        message="user deleted; bookings are being removed", job_id=job.id
+    )
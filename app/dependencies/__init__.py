@@ -1,33 +1,221 @@
 import boto3
+from botocore.config import Config
 
 from app.config.config import settings
 from app.repositories.users_repo import UserRepository
 from app.repositories.rooms_repo import RoomRepository
 from app.repositories.bookings_repo import BookingRepository
+from app.repositories.jobs_repo import JobRepository
+from app.repositories.async_dynamodb import (
+    AsyncDynamoDBClient,
+    AsyncDynamoDBResource,
+)
+from app.repositories.memory_dynamodb import MemoryDynamoDB
+from app.repositories.cached_repos import CachedRoomRepository, CachedUserRepository
+from app.repositories.instrumented_repos import InstrumentedRepository
+from app.middleware.auth_middleware import token_cache
 from app.services.auth_service import AuthService
 from app.services.users_service import UserService
 from app.services.rooms_service import RoomService
 from app.services.bookings_service import BookingService
+from app.services.jobs_service import JobService
+from app.utils.availability_index import AvailabilityIndex
+from app.utils.dynamo_executor import DynamoExecutor
+from app.utils.metrics import Metrics
+from app.utils.password_utils import PasswordHasher
+from app.utils.profiler import SamplingProfiler
+from app.utils.ttl_cache import TTLCache
 
 
 def init_app_state(app_state):
-    app_state.db_client = boto3.resource("dynamodb", region_name=settings.AWS_REGION)
+    app_state.metrics = Metrics() if settings.METRICS_ENABLED else None
+    if settings.DYNAMODB_BACKEND == "async":
+        app_state.db_client = AsyncDynamoDBResource(
+            AsyncDynamoDBClient(
+                settings.AWS_REGION,
+                endpoint_url=settings.DYNAMODB_ENDPOINT_URL,
+                max_connections=settings.DYNAMODB_ASYNC_MAX_CONNECTIONS,
+                connect_timeout=settings.DYNAMODB_CONNECT_TIMEOUT,
+                read_timeout=settings.DYNAMODB_READ_TIMEOUT,
+                max_attempts=settings.DYNAMODB_MAX_ATTEMPTS,
+            )
+        )
+        app_state.dynamo_executor = DynamoExecutor(metrics=app_state.metrics)
+    elif settings.DYNAMODB_BACKEND == "memory":
+        app_state.db_client = MemoryDynamoDB(
+            latency_seconds=settings.MEMORY_DYNAMODB_LATENCY_MS / 1000
+        )
+        app_state.dynamo_executor = DynamoExecutor(
+            settings.DYNAMODB_MAX_WORKERS, metrics=app_state.metrics
+        )
+    else:
+        app_state.db_client = boto3.resource(
+            "dynamodb",
+            region_name=settings.AWS_REGION,
+            endpoint_url=settings.DYNAMODB_ENDPOINT_URL,
+            config=Config(
+                max_pool_connections=settings.DYNAMODB_MAX_POOL_CONNECTIONS,
+                retries={
+                    "mode": settings.DYNAMODB_RETRY_MODE,
+                    "max_attempts": settings.DYNAMODB_MAX_ATTEMPTS,
+                },
+                connect_timeout=settings.DYNAMODB_CONNECT_TIMEOUT,
+                read_timeout=settings.DYNAMODB_READ_TIMEOUT,
+            ),
+        )
+        app_state.dynamo_executor = DynamoExecutor(
+            settings.DYNAMODB_MAX_WORKERS, metrics=app_state.metrics
+        )
     app_state.user_repo = UserRepository(
-        app_state.db_client, settings.DYNAMODB_TABLE_NAME
+        app_state.db_client,
+        settings.DYNAMODB_TABLE_NAME,
+        shard_count=settings.PARTITION_SHARD_COUNT,
+        executor=app_state.dynamo_executor,
     )
     app_state.room_repo = RoomRepository(
-        app_state.db_client, settings.DYNAMODB_TABLE_NAME
+        app_state.db_client,
+        settings.DYNAMODB_TABLE_NAME,
+        shard_count=settings.PARTITION_SHARD_COUNT,
+        executor=app_state.dynamo_executor,
     )
     app_state.booking_repo = BookingRepository(
-        app_state.db_client, settings.DYNAMODB_TABLE_NAME
+        app_state.db_client,
+        settings.DYNAMODB_TABLE_NAME,
+        shard_count=settings.PARTITION_SHARD_COUNT,
+        executor=app_state.dynamo_executor,
+        max_booking_duration=settings.MAX_BOOKING_DURATION_HOURS * 3600,
+        slot_seconds=settings.BOOKING_SLOT_MINUTES * 60,
+    )
+    if app_state.metrics or settings.REQUEST_TRACE_ENABLED:
+        # Instrument below the caches so only DynamoDB round trips are timed.
+        app_state.user_repo = InstrumentedRepository(
+            app_state.user_repo, "UserRepository", app_state.metrics
+        )
+        app_state.room_repo = InstrumentedRepository(
+            app_state.room_repo, "RoomRepository", app_state.metrics
+        )
+        app_state.booking_repo = InstrumentedRepository(
+            app_state.booking_repo, "BookingRepository", app_state.metrics
+        )
+    if settings.CACHE_ENABLED:
+        app_state.user_cache = TTLCache(
+            settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS
+        )
+        app_state.room_cache = TTLCache(
+            settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS
+        )
+        app_state.user_repo = CachedUserRepository(
+            app_state.user_repo, app_state.user_cache
+        )
+        app_state.room_repo = CachedRoomRepository(
+            app_state.room_repo, app_state.room_cache
+        )
+    app_state.password_hasher = PasswordHasher(
+        rounds=settings.BCRYPT_ROUNDS,
+        max_workers=settings.PASSWORD_HASH_WORKERS,
+        max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+        metrics=app_state.metrics,
+    )
+    app_state.auth_service = AuthService(
+        user_repository=app_state.user_repo,
+        password_hasher=app_state.password_hasher,
+    )
+    app_state.job_repo = JobRepository(
+        app_state.db_client,
+        settings.DYNAMODB_TABLE_NAME,
+        executor=app_state.dynamo_executor,
+        retention_seconds=settings.JOB_RETENTION_DAYS * 86400,
+    )
+    if app_state.metrics or settings.REQUEST_TRACE_ENABLED:
+        app_state.job_repo = InstrumentedRepository(
+            app_state.job_repo, "JobRepository", app_state.metrics
+        )
+    app_state.availability_index = AvailabilityIndex(
+        app_state.booking_repo.get_by_date_range,
+        ttl_seconds=settings.AVAILABILITY_INDEX_TTL_SECONDS,
+        max_days=settings.MAX_BOOKING_DAYS_IN_FUTURE + 2,
+    )
+    app_state.job_service = JobService(
+        job_repository=app_state.job_repo,
+        booking_repository=app_state.booking_repo,
+        user_repository=app_state.user_repo,
+        page_size=settings.CASCADE_DELETE_PAGE_SIZE,
+        lease_seconds=settings.JOB_LEASE_SECONDS,
+        availability_index=app_state.availability_index,
     )
-    app_state.auth_service = AuthService(user_repository=app_state.user_repo)
     app_state.user_service = UserService(
-        user_repository=app_state.user_repo, booking_repository=app_state.booking_repo
+        user_repository=app_state.user_repo,
+        booking_repository=app_state.booking_repo,
+        password_hasher=app_state.password_hasher,
+        job_service=app_state.job_service,
+    )
+    app_state.room_service = RoomService(
+        room_repository=app_state.room_repo,
+        availability_index=app_state.availability_index,
     )
-    app_state.room_service = RoomService(room_repository=app_state.room_repo)
     app_state.booking_service = BookingService(
         booking_repository=app_state.booking_repo,
         room_repository=app_state.room_repo,
         user_repository=app_state.user_repo,
+        availability_index=app_state.availability_index,
     )
+    app_state.profiler = SamplingProfiler(max_seconds=settings.PROFILE_MAX_SECONDS)
+    if app_state.metrics:
+        register_collectors(app_state)
+
+
+def register_collectors(app_state):
+    metrics: Metrics = app_state.metrics
+    executor: DynamoExecutor = app_state.dynamo_executor
+    hasher: PasswordHasher = app_state.password_hasher
+    caches = {"token": token_cache}
+    if settings.CACHE_ENABLED:
+        caches["user"] = app_state.user_cache
+        caches["room"] = app_state.room_cache
+
+    metrics.collector(
+        "dynamodb_executor_in_flight",
+        "DynamoDB calls currently running on the executor.",
+        lambda: [((), executor.in_flight)],
+    )
+    metrics.collector(
+        "dynamodb_executor_queue_depth",
+        "DynamoDB calls waiting for an executor thread.",
+        lambda: [((), executor.queue_depth)],
+    )
+    metrics.collector(
+        "password_hash_pending",
+        "bcrypt calls queued or running on the hashing pool.",
+        lambda: [((), hasher.pending)],
+    )
+    metrics.collector(
+        "cache_hits_total",
+        "Cache lookups that found a live entry.",
+        lambda: [((name,), cache.hits) for name, cache in caches.items()],
+        labelnames=("cache",),
+        type="counter",
+    )
+    metrics.collector(
+        "cache_misses_total",
+        "Cache lookups that found no entry or an expired one.",
+        lambda: [((name,), cache.misses) for name, cache in caches.items()],
+        labelnames=("cache",),
+        type="counter",
+    )
+    metrics.collector(
+        "cache_hit_ratio",
+        "Hits over lookups since startup.",
+        lambda: [
+            ((name,), cache.hits / max(cache.hits + cache.misses, 1))
+            for name, cache in caches.items()
+        ],
+        labelnames=("cache",),
+    )
+
+
+async def close_app_state(app_state):
+    await app_state.job_service.shutdown()
+    app_state.password_hasher.shutdown()
+    app_state.dynamo_executor.shutdown()
+    if isinstance(app_state.db_client, AsyncDynamoDBResource):
+        await app_state.db_client.close()
@@ -1,4 +1,4 @@
-from typing import Annotated, Any
+from typing import Annotated, Any, Optional
 from fastapi import Depends, Request
 from app.repositories.users_repo import UserRepository
 from app.repositories.rooms_repo import RoomRepository
@@ -7,6 +7,9 @@ from app.services.auth_service import AuthService
 from app.services.users_service import UserService
 from app.services.rooms_service import RoomService
 from app.services.bookings_service import BookingService
+from app.services.jobs_service import JobService
+from app.utils.metrics import Metrics
+from app.utils.profiler import SamplingProfiler
 
 
 def get_dynamodb_client(request: Request) -> Any:
@@ -41,6 +44,18 @@ def get_booking_service(request: Request) -> BookingService:
     return request.app.state.booking_service
 
 
+def get_job_service(request: Request) -> JobService:
+    return request.app.state.job_service
+
+
+def get_metrics(request: Request) -> Optional[Metrics]:
+    return getattr(request.app.state, "metrics", None)
+
+
+def get_profiler(request: Request) -> SamplingProfiler:
+    return request.app.state.profiler
+
+
 DynamoDBResource = Annotated[Any, Depends(get_dynamodb_client)]
 UserRepoInstance = Annotated[UserRepository, Depends(get_user_repository)]
 RoomRepoInstance = Annotated[RoomRepository, Depends(get_room_repository)]
@@ -49,3 +64,6 @@ AuthServiceInstance = Annotated[AuthService, Depends(get_auth_service)]
 UserServiceInstance = Annotated[UserService, Depends(get_user_service)]
 RoomServiceInstance = Annotated[RoomService, Depends(get_room_service)]
 BookingServiceInstance = Annotated[BookingService, Depends(get_booking_service)]
+JobServiceInstance = Annotated[JobService, Depends(get_job_service)]
+MetricsInstance = Annotated[Optional[Metrics], Depends(get_metrics)]
+ProfilerInstance = Annotated[SamplingProfiler, Depends(get_profiler)]
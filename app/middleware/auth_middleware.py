@@ -1,6 +1,17 @@
 from fastapi import HTTPException, Header, Depends, Request
 from typing import Optional, Dict, Any
+import hashlib
+import time
+from app.config.config import settings
 from app.utils import jwt_utils
+from app.utils.ttl_cache import TTLCache
+
+# Verified payloads keyed by token digest; entries expire at the token's exp,
+# so expired tokens fall through to validate_token and are rejected as before.
+token_cache: TTLCache = TTLCache(
+    max_entries=settings.TOKEN_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.JWT_EXPIRATION_HOURS * 3600,
+)
 
 
 def get_current_user(authorization: Optional[str] = Header(None)) -> Dict[str, Any]:
@@ -11,11 +22,18 @@ def get_current_user(authorization: Optional[str] = Header(None)) -> Dict[str, A
         raise HTTPException(status_code=401, detail="unauthorized")
 
     token: str = authorization.replace("Bearer ", "")
+    digest: str = hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    payload: Optional[Dict[str, Any]] = token_cache.get(digest)
+    if payload is not None:
+        return dict(payload)
 
-    payload: Optional[Dict[str, Any]] = jwt_utils.validate_token(token)
+    payload = jwt_utils.validate_token(token)
     if not payload:
         raise HTTPException(status_code=401, detail="unauthorized")
 
+    if "exp" in payload:
+        token_cache.set(digest, dict(payload), ttl=payload["exp"] - time.time())
     return payload
 
 
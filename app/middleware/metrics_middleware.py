@@ -0,0 +1,48 @@
+import time
+from typing import Any, Callable, Dict
+
+from app.utils.metrics import Metrics
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """Records request latency per route template in ``app.state.metrics``.
+
+    Plain ASGI rather than ``BaseHTTPMiddleware`` so the response body is not
+    re-streamed through an extra task. Routes are labelled by their template
+    (``/api/rooms/{room_id}``), keeping the series count bounded.
+    """
+
+    def __init__(self, app: Callable[..., Any]) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        metrics: Metrics = (
+            getattr(scope["app"].state, "metrics", None)
+            if scope["type"] == "http"
+            else None
+        )
+        if metrics is None:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            metrics.request_seconds.observe(
+                time.perf_counter() - start,
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                str(status),
+            )
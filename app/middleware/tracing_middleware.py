@@ -0,0 +1,56 @@
+import logging
+import time
+from typing import Any, Callable, Dict
+
+from app.utils.request_trace import RequestTrace, current_trace
+
+logger = logging.getLogger(__name__)
+
+
+class TracingMiddleware:
+    """Collects the DynamoDB calls of each request into a ``RequestTrace``.
+
+    Every request that reached DynamoDB is logged as one ``key=value`` line
+    with its call, item, scanned-item and capacity totals. With
+    ``server_timing`` the trace is also returned in a ``Server-Timing``
+    header, which browser dev tools display next to the request.
+    """
+
+    def __init__(self, app: Callable[..., Any], server_timing: bool = False) -> None:
+        self.app = app
+        self.server_timing: bool = server_timing
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = RequestTrace()
+        token = current_trace.set(trace)
+        status = 500
+
+        async def send_with_trace(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing and trace.calls:
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"server-timing", trace.server_timing().encode("latin-1"))
+                    ]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_trace)
+        finally:
+            current_trace.reset(token)
+            if trace.calls:
+                route = getattr(scope.get("route"), "path", scope["path"])
+                logger.info(
+                    "request method=%s route=%s status=%s duration_ms=%.1f %s",
+                    scope["method"],
+                    route,
+                    status,
+                    (time.perf_counter() - start) * 1000,
+                    trace.log_fields(),
+                )
@@ -1,6 +1,8 @@
-from typing import Optional, List
+from typing import Generic, Optional, List, TypeVar
 from pydantic import BaseModel
 
+T = TypeVar("T")
+
 
 class User(BaseModel):
     id: str = ""
@@ -40,12 +42,22 @@ class Booking(BaseModel):
     updated_at: int = 0
 
 
+class Watermark(BaseModel):
+    version: int = 0
+    updated_at: int = 0
+
+
 class TimeSlot(BaseModel):
     start_time: int
     end_time: int
     duration: int
 
 
+class RoomAvailability(BaseModel):
+    room: Room
+    free_slots: List[TimeSlot]
+
+
 class BookingWithDetails(BaseModel):
     id: str
     user_id: str
@@ -71,9 +83,72 @@ class ScheduleSlot(BaseModel):
     purpose: Optional[str] = None
 
 
+class RoomDay(BaseModel):
+    room_id: str
+    date: int
+    slots: List[ScheduleSlot] = []
+    version: int = 0
+    updated_at: int = 0
+
+
 class RoomScheduleResponse(BaseModel):
     room_id: str
     room_name: str
     room_number: int
     date: int
     bookings: List[ScheduleSlot]
+    version: int = 0
+    updated_at: int = 0
+
+
+class ScheduleGridRoom(BaseModel):
+    room_id: str
+    room_name: str
+    room_number: int
+    floor: int
+    starts: List[int] = []
+    ends: List[int] = []
+    booking_ids: List[str] = []
+    user_names: List[Optional[str]] = []
+    purposes: List[Optional[str]] = []
+
+
+class ScheduleGrid(BaseModel):
+    start: int
+    days: int
+    rooms: List[ScheduleGridRoom]
+    versions: List[int] = []
+    updated_at: int = 0
+
+
+class Job(BaseModel):
+    id: str = ""
+    type: str
+    target_id: str
+    status: str = "pending"
+    processed: int = 0
+    checkpoint: Optional[str] = None
+    error: Optional[str] = None
+    created_at: int = 0
+    updated_at: int = 0
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_token: Optional[str] = None
+
+
+class Recurrence(BaseModel):
+    frequency: str
+    count: int
+
+
+class BulkBookingResult(BaseModel):
+    index: int
+    occurrence: int
+    room_id: str
+    start_time: int
+    end_time: int
+    status: str
+    booking_id: Optional[str] = None
+    error: Optional[str] = None
@@ -128,6 +128,46 @@ class CreateBookingRequest(BaseModel):
         return v
 
 
+class TimeSlotDTO(BaseModel):
+    start_time: int = Field(gt=0)
+    end_time: int = Field(gt=0)
+    duration: int = Field(gt=0)
+
+
+class RoomSearchResultDTO(RoomDTO):
+    free_slots: List[TimeSlotDTO] = Field(default_factory=list)
+
+
+class RecurrenceRule(BaseModel):
+    frequency: str = Field(pattern="^(daily|weekly)$")
+    count: int = Field(ge=1, le=100)
+
+
+class BulkBookingItem(CreateBookingRequest):
+    recurrence: Optional[RecurrenceRule] = None
+
+
+class BulkCreateBookingRequest(BaseModel):
+    bookings: List[BulkBookingItem] = Field(min_length=1, max_length=100)
+
+
+class BulkBookingResultDTO(BaseModel):
+    index: int = Field(ge=0)
+    occurrence: int = Field(ge=0)
+    room_id: str = Field(min_length=1)
+    start_time: int
+    end_time: int
+    status: str = Field(pattern="^(created|conflict|invalid|not_found)$")
+    booking_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkCreateBookingResponse(BaseModel):
+    created: int = Field(ge=0)
+    failed: int = Field(ge=0)
+    results: List[BulkBookingResultDTO] = Field(default_factory=list)
+
+
 class ScheduleSlotDTO(BaseModel):
     start_time: int = Field(gt=0)
     end_time: int = Field(gt=0)
@@ -145,6 +185,40 @@ class RoomScheduleResponse(BaseModel):
     bookings: List[ScheduleSlotDTO] = Field(default_factory=list)
 
 
+class ScheduleGridRoomDTO(BaseModel):
+    room_id: str
+    room_name: str
+    room_number: int
+    floor: int
+    starts: List[int] = Field(default_factory=list)
+    ends: List[int] = Field(default_factory=list)
+    booking_ids: List[str] = Field(default_factory=list)
+    user_names: List[Optional[str]] = Field(default_factory=list)
+    purposes: List[Optional[str]] = Field(default_factory=list)
+
+
+class ScheduleGridResponse(BaseModel):
+    start: int
+    days: int
+    rooms: List[ScheduleGridRoomDTO] = Field(default_factory=list)
+
+
+class UserDeletionResponse(BaseModel):
+    message: str = Field(min_length=1)
+    job_id: Optional[str] = None
+
+
+class JobDTO(BaseModel):
+    id: str
+    type: str
+    target_id: str
+    status: str
+    processed: int
+    error: Optional[str] = None
+    created_at: int
+    updated_at: int
+
+
 class ErrorResponse(BaseModel):
     error: str = Field(min_length=1)
 
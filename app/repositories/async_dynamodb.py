@@ -0,0 +1,210 @@
+"""
+Native asyncio DynamoDB backend.
+
+Speaks the DynamoDB JSON protocol over a pooled ``httpx.AsyncClient`` and
+signs requests with botocore's SigV4 signer, so every in-flight call is a
+coroutine rather than an OS thread. Parameter and result handling reuses
+boto3's own resource-layer transformations, which means repositories can
+pass ``Key``/``Attr`` conditions and plain Python values exactly as they do
+with ``boto3.resource("dynamodb")``.
+"""
+
+import asyncio
+import copy
+import json
+import random
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+import boto3
+import httpx
+from boto3.dynamodb.transform import TransformationInjector
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+
+RETRYABLE_ERROR_CODES = {
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+    "InternalServerError",
+    "ServiceUnavailable",
+}
+
+
+def _json_body(response: httpx.Response) -> Optional[Dict[str, Any]]:
+    if not response.content:
+        return {}
+    if "json" not in response.headers.get("Content-Type", ""):
+        return None
+    try:
+        return response.json()
+    except ValueError:
+        return None
+
+
+class AsyncDynamoDBClient:
+
+    def __init__(
+        self,
+        region_name: str,
+        endpoint_url: Optional[str] = None,
+        max_connections: int = 512,
+        connect_timeout: float = 2.0,
+        read_timeout: float = 5.0,
+        max_attempts: int = 3,
+        session: Optional[boto3.Session] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.region_name: str = region_name
+        self.max_attempts: int = max_attempts
+        self._session = session or boto3.Session(region_name=region_name)
+        # The botocore client never sends a request; it supplies the service
+        # model, the resolved endpoint and the modeled exception classes.
+        botocore_client = self._session.client(
+            "dynamodb", region_name=region_name, endpoint_url=endpoint_url
+        )
+        self.exceptions = botocore_client.exceptions
+        self._service_model = botocore_client.meta.service_model
+        self._endpoint_url: str = botocore_client.meta.endpoint_url
+        self._credentials = None
+        self._transformer = TransformationInjector()
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            transport=transport,
+        )
+
+    async def query(self, **params: Any) -> Dict[str, Any]:
+        return await self._invoke("Query", params)
+
+    async def get_item(self, **params: Any) -> Dict[str, Any]:
+        return await self._invoke("GetItem", params)
+
+    async def put_item(self, **params: Any) -> Dict[str, Any]:
+        return await self._invoke("PutItem", params)
+
+    async def delete_item(self, **params: Any) -> Dict[str, Any]:
+        return await self._invoke("DeleteItem", params)
+
+    async def update_item(self, **params: Any) -> Dict[str, Any]:
+        return await self._invoke("UpdateItem", params)
+
+    async def batch_get_item(self, **params: Any) -> Dict[str, Any]:
+        return await self._invoke("BatchGetItem", params)
+
+    async def batch_write_item(self, **params: Any) -> Dict[str, Any]:
+        return await self._invoke("BatchWriteItem", params)
+
+    async def transact_write_items(self, **params: Any) -> Dict[str, Any]:
+        return await self._invoke("TransactWriteItems", params)
+
+    async def close(self) -> None:
+        await self._http.aclose()
+
+    async def _invoke(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        model = self._service_model.operation_model(operation)
+        params = copy.deepcopy(params)
+        self._transformer.inject_condition_expressions(params, model)
+        self._transformer.inject_attribute_value_input(params, model)
+        body = json.dumps(params).encode("utf-8")
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                parsed = await self._send(operation, body)
+                break
+            except httpx.TransportError:
+                if attempt >= self.max_attempts:
+                    raise
+            except self.exceptions.ClientError as e:
+                if (
+                    e.response["Error"]["Code"] not in RETRYABLE_ERROR_CODES
+                    or attempt >= self.max_attempts
+                ):
+                    raise
+            await asyncio.sleep(random.uniform(0, 0.05 * 2**attempt))
+
+        self._transformer.inject_attribute_value_output(parsed, model)
+        return parsed
+
+    async def _send(self, operation: str, body: bytes) -> Dict[str, Any]:
+        if self._credentials is None:
+            self._credentials = self._session.get_credentials()
+        request = AWSRequest(
+            method="POST",
+            url=self._endpoint_url,
+            data=body,
+            headers={
+                "Content-Type": "application/x-amz-json-1.0",
+                "X-Amz-Target": f"DynamoDB_20120810.{operation}",
+            },
+        )
+        SigV4Auth(
+            self._credentials.get_frozen_credentials(), "dynamodb", self.region_name
+        ).add_auth(request)
+
+        response = await self._http.post(
+            self._endpoint_url, content=body, headers=dict(request.headers.items())
+        )
+        data = _json_body(response)
+        if data is None:
+            # DynamoDB always answers in JSON; anything else comes from a
+            # proxy or load balancer and is retried as a server error.
+            data = {
+                "__type": "InternalServerError",
+                "message": f"Unexpected non-JSON response ({response.status_code})",
+            }
+        if response.status_code >= 400 or "__type" in data:
+            code = data.get("__type", "").rsplit("#", 1)[-1] or "InternalServerError"
+            error_response: Dict[str, Any] = {
+                "Error": {
+                    "Code": code,
+                    "Message": data.get("message") or data.get("Message", ""),
+                },
+                "ResponseMetadata": {"HTTPStatusCode": response.status_code},
+            }
+            if "CancellationReasons" in data:
+                error_response["CancellationReasons"] = data["CancellationReasons"]
+            raise self.exceptions.from_code(code)(error_response, operation)
+        return data
+
+
+class AsyncTable:
+    """Coroutine counterpart of ``boto3.resource("dynamodb").Table``."""
+
+    def __init__(self, client: AsyncDynamoDBClient, table_name: str) -> None:
+        self.name: str = table_name
+        self.table_name: str = table_name
+        self.meta = SimpleNamespace(client=client)
+
+    async def query(self, **params: Any) -> Dict[str, Any]:
+        return await self.meta.client.query(TableName=self.name, **params)
+
+    async def get_item(self, **params: Any) -> Dict[str, Any]:
+        return await self.meta.client.get_item(TableName=self.name, **params)
+
+    async def put_item(self, **params: Any) -> Dict[str, Any]:
+        return await self.meta.client.put_item(TableName=self.name, **params)
+
+    async def delete_item(self, **params: Any) -> Dict[str, Any]:
+        return await self.meta.client.delete_item(TableName=self.name, **params)
+
+    async def update_item(self, **params: Any) -> Dict[str, Any]:
+        return await self.meta.client.update_item(TableName=self.name, **params)
+
+
+class AsyncDynamoDBResource:
+    """Coroutine counterpart of ``boto3.resource("dynamodb")``."""
+
+    def __init__(self, client: AsyncDynamoDBClient) -> None:
+        self.meta = SimpleNamespace(client=client)
+
+    def Table(self, table_name: str) -> AsyncTable:
+        return AsyncTable(self.meta.client, table_name)
+
+    async def close(self) -> None:
+        await self.meta.client.close()
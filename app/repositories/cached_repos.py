@@ -0,0 +1,199 @@
+from typing import Any, Dict, List, Optional
+from app.models.models import Page, Room, User, Watermark
+from app.repositories.rooms_repo import RoomRepository
+from app.repositories.users_repo import UserRepository
+from app.utils.errors import NotFoundError
+from app.utils.ttl_cache import TTLCache
+
+ALL_ROOMS_KEY = "rooms:all"
+
+
+class CachedRoomRepository:
+    """RoomRepository with read-through caching and write-through invalidation.
+
+    Methods that are not overridden here are delegated to the wrapped
+    repository unchanged.
+    """
+
+    def __init__(self, room_repository: RoomRepository, cache: TTLCache) -> None:
+        self.repo: RoomRepository = room_repository
+        self.cache: TTLCache = cache
+        self._watermark_version: Optional[int] = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.repo, name)
+
+    async def get_watermark(self) -> Watermark:
+        # A moved watermark means another instance wrote a room; drop what we
+        # hold so the body served under the new ETag is current.
+        watermark = await self.repo.get_watermark()
+        if watermark.version != self._watermark_version:
+            if self._watermark_version is not None:
+                self.cache.clear()
+            self._watermark_version = watermark.version
+        return watermark
+
+    async def get_by_id(self, room_id: str, consistent_read: bool = False) -> Room:
+        key = f"room:{room_id}"
+        # Consistent reads skip the cache but still refresh it.
+        room: Optional[Room] = None if consistent_read else self.cache.get(key)
+        if room is None:
+            room = await self.repo.get_by_id(room_id, consistent_read)
+            self.cache.set(key, room)
+        return room.model_copy(deep=True)
+
+    async def get_many(
+        self, room_ids: List[str], consistent_read: bool = False
+    ) -> Dict[str, Room]:
+        rooms: Dict[str, Room] = {}
+        missing: List[str] = []
+        for room_id in dict.fromkeys(room_ids):
+            # Consistent reads skip the cache but still refresh it.
+            room: Optional[Room] = (
+                None if consistent_read else self.cache.get(f"room:{room_id}")
+            )
+            if room is None:
+                missing.append(room_id)
+            else:
+                rooms[room_id] = room.model_copy(deep=True)
+
+        if missing:
+            fetched = await self.repo.get_many(missing, consistent_read)
+            for room_id, room in fetched.items():
+                self.cache.set(f"room:{room_id}", room)
+                rooms[room_id] = room.model_copy(deep=True)
+        return rooms
+
+    async def get_all(self) -> List[Room]:
+        return (await self.get_all_page()).items
+
+    async def get_all_page(
+        self,
+        limit: Optional[int] = None,
+        next_token: Optional[str] = None,
+        **filters: Any,
+    ) -> Page[Room]:
+        filtered = any(value is not None for value in filters.values())
+        if limit is not None or next_token or filtered:
+            return await self.repo.get_all_page(limit, next_token, **filters)
+
+        page: Optional[Page[Room]] = self.cache.get(ALL_ROOMS_KEY)
+        if page is None:
+            page = await self.repo.get_all_page()
+            self.cache.set(ALL_ROOMS_KEY, page)
+        return page.model_copy(deep=True)
+
+    async def create(self, room: Room) -> None:
+        try:
+            await self.repo.create(room)
+        finally:
+            self.cache.invalidate(ALL_ROOMS_KEY)
+
+    async def update(self, room: Room) -> None:
+        try:
+            await self.repo.update(room)
+        finally:
+            self.cache.invalidate(f"room:{room.id}", ALL_ROOMS_KEY)
+
+    async def delete_by_id(self, room_id: str) -> None:
+        try:
+            await self.repo.delete_by_id(room_id)
+        finally:
+            self.cache.invalidate(f"room:{room_id}", ALL_ROOMS_KEY)
+
+    async def update_availability(self, room_id: str, status: str) -> None:
+        try:
+            await self.repo.update_availability(room_id, status)
+        finally:
+            self.cache.invalidate(f"room:{room_id}", ALL_ROOMS_KEY)
+
+
+class CachedUserRepository:
+    """UserRepository with read-through caching and write-through invalidation.
+
+    Emails are cached as pointers to user IDs, so a stale pointer is detected
+    when the cached user no longer carries that email.
+    """
+
+    def __init__(self, user_repository: UserRepository, cache: TTLCache) -> None:
+        self.repo: UserRepository = user_repository
+        self.cache: TTLCache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.repo, name)
+
+    async def get_by_id(self, user_id: str, consistent_read: bool = False) -> User:
+        key = f"user:{user_id}"
+        # Consistent reads skip the cache but still refresh it.
+        user: Optional[User] = None if consistent_read else self.cache.get(key)
+        if user is None:
+            user = await self.repo.get_by_id(user_id, consistent_read)
+            self.cache.set(key, user)
+        return user.model_copy(deep=True)
+
+    async def get_many(
+        self, user_ids: List[str], consistent_read: bool = False
+    ) -> Dict[str, User]:
+        users: Dict[str, User] = {}
+        missing: List[str] = []
+        for user_id in dict.fromkeys(user_ids):
+            # Consistent reads skip the cache but still refresh it.
+            user: Optional[User] = (
+                None if consistent_read else self.cache.get(f"user:{user_id}")
+            )
+            if user is None:
+                missing.append(user_id)
+            else:
+                users[user_id] = user.model_copy(deep=True)
+
+        if missing:
+            fetched = await self.repo.get_many(missing, consistent_read)
+            for user_id, user in fetched.items():
+                self.cache.set(f"user:{user_id}", user)
+                users[user_id] = user.model_copy(deep=True)
+        return users
+
+    async def find_by_email(self, email: str, consistent_read: bool = False) -> User:
+        # Consistent reads skip the cache but still refresh it.
+        user_id = None if consistent_read else self.cache.get(f"email:{email}")
+        if user_id:
+            try:
+                user = await self.get_by_id(user_id)
+                if user.email == email:
+                    return user
+            except NotFoundError:
+                pass
+            self.cache.invalidate(f"email:{email}")
+
+        user = await self.repo.find_by_email(email, consistent_read)
+        self.cache.set(f"email:{email}", user.id)
+        self.cache.set(f"user:{user.id}", user)
+        return user.model_copy(deep=True)
+
+    async def create(self, user: User) -> None:
+        try:
+            await self.repo.create(user)
+        finally:
+            self.cache.invalidate(f"user:{user.id}", f"email:{user.email}")
+
+    async def update(self, user: User, old_email: Optional[str] = None) -> None:
+        try:
+            await self.repo.update(user, old_email=old_email)
+        finally:
+            self.cache.invalidate(
+                f"user:{user.id}", f"email:{user.email}", f"email:{old_email}"
+            )
+
+    async def update_password(
+        self, user: User, old_password: str, new_password: str
+    ) -> bool:
+        try:
+            return await self.repo.update_password(user, old_password, new_password)
+        finally:
+            self.cache.invalidate(f"user:{user.id}", f"email:{user.email}")
+
+    async def delete_by_id(self, user_id: str) -> None:
+        try:
+            await self.repo.delete_by_id(user_id)
+        finally:
+            self.cache.invalidate(f"user:{user_id}")
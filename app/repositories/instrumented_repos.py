@@ -0,0 +1,47 @@
+import asyncio
+import time
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from app.utils.metrics import Metrics, repository_operation
+
+
+class InstrumentedRepository:
+    """Times every coroutine method of the wrapped repository.
+
+    The method name is also published in ``repository_operation`` while the
+    call runs, so the DynamoDB executor can attribute consumed capacity and
+    request-trace entries to it. Without ``metrics`` only the name is
+    published. Other attributes pass straight through.
+    """
+
+    def __init__(self, repo: Any, name: str, metrics: Optional[Metrics] = None) -> None:
+        self.repo = repo
+        self.name: str = name
+        self.metrics: Optional[Metrics] = metrics
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self.repo, attr)
+        if not asyncio.iscoroutinefunction(value):
+            return value
+        wrapped = self._instrument(attr, value)
+        # Later lookups find the wrapper without going through __getattr__.
+        setattr(self, attr, wrapped)
+        return wrapped
+
+    def _instrument(self, method: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        histogram = self.metrics.repository_seconds if self.metrics else None
+        operation = (self.name, method)
+
+        @wraps(fn)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            token = repository_operation.set(operation)
+            start = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                if histogram is not None:
+                    histogram.observe(time.perf_counter() - start, *operation)
+                repository_operation.reset(token)
+
+        return call
@@ -0,0 +1,168 @@
+from typing import Any, List, Optional
+from functools import partial
+import time
+from boto3.dynamodb.conditions import Attr, Key
+from app.models.models import Job
+from app.utils.dynamo_executor import DynamoExecutor
+from app.utils.errors import ConflictError, InvalidInputError, NotFoundError
+from app.utils.pagination import query_all
+
+UNFINISHED_STATUSES = ("pending", "running")
+
+
+class JobRepository:
+    """Background job records with a lease, so one instance runs each job.
+
+    A job is claimed by writing an owner and a lease expiry; every checkpoint
+    renews the lease on the condition that the caller still owns it. A job
+    whose owner died is claimable again once its lease runs out. Finished
+    jobs get an ``ExpiresAt`` for the table's TTL ``retention_seconds`` later.
+    """
+
+    def __init__(
+        self,
+        dynamodb_client: Any,
+        table_name: str,
+        executor: Optional[DynamoExecutor] = None,
+        retention_seconds: int = 7 * 86400,
+    ) -> None:
+        self.dynamodb: Any = dynamodb_client
+        self.table: Any = dynamodb_client.Table(table_name)
+        self.executor: DynamoExecutor = executor or DynamoExecutor()
+        self.retention_seconds: int = retention_seconds
+        self._query = partial(self.executor.run, self.table.query)
+
+    async def create(self, job: Job) -> None:
+        if not job:
+            raise InvalidInputError("Job is required")
+
+        await self.executor.run(
+            self.table.put_item,
+            Item={
+                **self._key(job.id),
+                "ID": job.id,
+                "Type": job.type,
+                "TargetID": job.target_id,
+                "Status": job.status,
+                "Processed": job.processed,
+                "CreatedAt": job.created_at,
+                "UpdatedAt": job.updated_at,
+            },
+            ConditionExpression="attribute_not_exists(PK)",
+        )
+
+    async def get_by_id(self, job_id: str) -> Job:
+        if not job_id:
+            raise InvalidInputError("Job ID is required")
+
+        response = await self.executor.run(
+            self.table.get_item, Key=self._key(job_id), ConsistentRead=True
+        )
+        if "Item" not in response:
+            raise NotFoundError("Job not found")
+        return self._unmarshal_job(response["Item"])
+
+    async def get_unfinished(self) -> List[Job]:
+        items = await query_all(
+            self._query,
+            KeyConditionExpression=Key("PK").eq("JOB"),
+            FilterExpression=Attr("Status").is_in(list(UNFINISHED_STATUSES)),
+        )
+        return [self._unmarshal_job(item) for item in items]
+
+    async def claim(self, job_id: str, owner: str, lease_seconds: int) -> bool:
+        now = int(time.time())
+        try:
+            await self.executor.run(
+                self.table.update_item,
+                Key=self._key(job_id),
+                UpdateExpression="SET #status = :running, #owner = :owner, "
+                "LeaseExpiresAt = :expires, UpdatedAt = :now",
+                ConditionExpression="#status IN (:pending, :running) AND "
+                "(attribute_not_exists(LeaseExpiresAt) OR LeaseExpiresAt < :now "
+                "OR #owner = :owner)",
+                ExpressionAttributeNames={"#status": "Status", "#owner": "Owner"},
+                ExpressionAttributeValues={
+                    ":pending": "pending",
+                    ":running": "running",
+                    ":owner": owner,
+                    ":expires": now + lease_seconds,
+                    ":now": now,
+                },
+            )
+            return True
+        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            return False
+
+    async def save_progress(self, job: Job, owner: str, lease_seconds: int) -> None:
+        """Checkpoint ``job`` and renew the lease; fails if the lease was lost."""
+        job.updated_at = int(time.time())
+        values = {
+            ":status": job.status,
+            ":processed": job.processed,
+            ":updated_at": job.updated_at,
+            ":expires": job.updated_at + lease_seconds,
+            ":owner": owner,
+        }
+        sets = [
+            "#status = :status",
+            "Processed = :processed",
+            "UpdatedAt = :updated_at",
+            "LeaseExpiresAt = :expires",
+        ]
+        if job.status not in UNFINISHED_STATUSES:
+            sets.append("ExpiresAt = :retain_until")
+            values[":retain_until"] = job.updated_at + self.retention_seconds
+        removes = []
+        for attribute, value in (("Checkpoint", job.checkpoint), ("Error", job.error)):
+            if value is None:
+                removes.append(attribute)
+            else:
+                sets.append(f"{attribute} = :{attribute.lower()}")
+                values[f":{attribute.lower()}"] = value
+
+        expression = "SET " + ", ".join(sets)
+        if removes:
+            expression += " REMOVE " + ", ".join(removes)
+        try:
+            await self.executor.run(
+                self.table.update_item,
+                Key=self._key(job.id),
+                UpdateExpression=expression,
+                ConditionExpression="#owner = :owner",
+                ExpressionAttributeNames={"#status": "Status", "#owner": "Owner"},
+                ExpressionAttributeValues=values,
+            )
+        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            raise ConflictError("Job is owned by another worker")
+
+    async def release(self, job_id: str, owner: str) -> bool:
+        """Give up ``owner``'s lease so another worker can claim the job now."""
+        try:
+            await self.executor.run(
+                self.table.update_item,
+                Key=self._key(job_id),
+                UpdateExpression="SET LeaseExpiresAt = :zero",
+                ConditionExpression="#owner = :owner",
+                ExpressionAttributeNames={"#owner": "Owner"},
+                ExpressionAttributeValues={":zero": 0, ":owner": owner},
+            )
+            return True
+        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            return False
+
+    def _key(self, job_id: str) -> dict:
+        return {"PK": "JOB", "SK": f"JOB#{job_id}"}
+
+    def _unmarshal_job(self, item: dict) -> Job:
+        return Job(
+            id=item["ID"],
+            type=item["Type"],
+            target_id=item["TargetID"],
+            status=item["Status"],
+            processed=int(item.get("Processed", 0)),
+            checkpoint=item.get("Checkpoint"),
+            error=item.get("Error"),
+            created_at=int(item["CreatedAt"]),
+            updated_at=int(item["UpdatedAt"]),
+        )
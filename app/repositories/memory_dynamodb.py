@@ -0,0 +1,796 @@
+"""
+In-memory stand-in for the MeetingRoomSystem DynamoDB table.
+
+``MemoryDynamoDB`` mimics the subset of ``boto3.resource("dynamodb")`` the
+repositories and tools use: ``Table(...).query/scan/get_item/put_item/
+delete_item/update_item`` plus ``meta.client.batch_get_item/batch_write_item/
+transact_write_items`` and the modeled exceptions. It keeps the production
+key schema and secondary indexes, evaluates ``Key``/``Attr`` conditions and
+the expression strings the repositories send, and can inject a fixed
+per-call latency so benchmarks see realistic round-trip costs without AWS.
+"""
+
+import copy
+import math
+import re
+import threading
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from boto3.dynamodb.conditions import ConditionBase
+from botocore.exceptions import ClientError
+
+# index name -> (partition key attribute, sort key attribute)
+TABLE_INDEXES: Dict[Optional[str], Tuple[str, str]] = {
+    None: ("PK", "SK"),
+    "RoomIDIndex": ("PK", "RoomID"),
+    "UserIDIndex": ("PK", "UserID"),
+    "DateIndex": ("PK", "Date"),
+    "LSI1": ("PK", "LSI1"),
+    "LSI2": ("PK", "LSI2"),
+    "RoomStartTimeIndex": ("RoomID", "StartTime"),
+}
+
+
+class ConditionalCheckFailedException(ClientError):
+    pass
+
+
+class TransactionCanceledException(ClientError):
+    pass
+
+
+class ResourceNotFoundException(ClientError):
+    pass
+
+
+def _client_error(cls: type, operation: str, message: str, **extra: Any) -> ClientError:
+    response = {"Error": {"Code": cls.__name__, "Message": message}, **extra}
+    return cls(response, operation)
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_normalize(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return {_normalize(v) for v in value}
+    return value
+
+
+def _compare(left: Any, op: str, right: Any) -> bool:
+    if left is None or right is None:
+        return op == "<>" and left != right
+    if isinstance(left, Decimal) != isinstance(right, Decimal):
+        return op == "<>"
+    if op == "=":
+        return left == right
+    if op == "<>":
+        return left != right
+    try:
+        if op == "<":
+            return left < right
+        if op == "<=":
+            return left <= right
+        if op == ">":
+            return left > right
+        if op == ">=":
+            return left >= right
+    except TypeError:
+        return False
+    raise ValueError(f"Unsupported operator {op}")
+
+
+def _item_size(item: Dict[str, Any]) -> int:
+    return sum(len(k) + len(str(v)) for k, v in item.items())
+
+
+class _Expression:
+    """Parser/evaluator for condition and update expression strings."""
+
+    TOKEN = re.compile(
+        r"\s*(<>|<=|>=|[=<>(),+\-]|[#:]?[A-Za-z_][A-Za-z0-9_.\-]*|\[\d+\])"
+    )
+
+    def __init__(
+        self,
+        expression: str,
+        names: Optional[Dict[str, str]],
+        values: Optional[Dict[str, Any]],
+    ) -> None:
+        self.tokens: List[str] = [
+            t for t in self.TOKEN.findall(expression) if t.strip()
+        ]
+        self.pos = 0
+        self.names = names or {}
+        self.values = _normalize(values or {})
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _next(self) -> str:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _expect(self, token: str) -> None:
+        actual = self._next()
+        if actual.upper() != token:
+            raise ValueError(f"Expected {token}, got {actual}")
+
+    def _name(self, token: str) -> str:
+        return self.names[token] if token.startswith("#") else token
+
+    # condition expressions
+
+    def evaluate(self, item: Dict[str, Any]) -> bool:
+        result = self._or(item)
+        if self._peek() is not None:
+            raise ValueError(f"Unexpected token {self._peek()}")
+        return result
+
+    def _or(self, item: Dict[str, Any]) -> bool:
+        result = self._and(item)
+        while self._peek() and self._peek().upper() == "OR":
+            self._next()
+            right = self._and(item)
+            result = result or right
+        return result
+
+    def _and(self, item: Dict[str, Any]) -> bool:
+        result = self._not(item)
+        while self._peek() and self._peek().upper() == "AND":
+            self._next()
+            right = self._not(item)
+            result = result and right
+        return result
+
+    def _not(self, item: Dict[str, Any]) -> bool:
+        if self._peek() and self._peek().upper() == "NOT":
+            self._next()
+            return not self._not(item)
+        return self._primary(item)
+
+    def _primary(self, item: Dict[str, Any]) -> bool:
+        token = self._peek()
+        if token == "(":
+            self._next()
+            result = self._or(item)
+            self._expect(")")
+            return result
+
+        lowered = token.lower()
+        if lowered in ("attribute_exists", "attribute_not_exists"):
+            self._next()
+            self._expect("(")
+            name = self._name(self._next())
+            self._expect(")")
+            exists = name in item
+            return exists if lowered == "attribute_exists" else not exists
+        if lowered in ("begins_with", "contains"):
+            self._next()
+            self._expect("(")
+            left = self._operand(item)
+            self._expect(",")
+            right = self._operand(item)
+            self._expect(")")
+            if left is None:
+                return False
+            if lowered == "begins_with":
+                return isinstance(left, str) and left.startswith(right)
+            return right in left
+
+        left = self._operand(item)
+        op = self._next()
+        if op.upper() == "BETWEEN":
+            low = self._operand(item)
+            self._expect("AND")
+            high = self._operand(item)
+            return _compare(left, ">=", low) and _compare(left, "<=", high)
+        if op.upper() == "IN":
+            self._expect("(")
+            options = [self._operand(item)]
+            while self._peek() == ",":
+                self._next()
+                options.append(self._operand(item))
+            self._expect(")")
+            return left in options
+        return _compare(left, op, self._operand(item))
+
+    def _operand(self, item: Dict[str, Any]) -> Any:
+        token = self._next()
+        if token.startswith(":"):
+            return self.values[token]
+        if token.lower() == "size":
+            self._expect("(")
+            value = item.get(self._name(self._next()))
+            self._expect(")")
+            return Decimal(len(value)) if value is not None else None
+        return item.get(self._name(token))
+
+    # update expressions
+
+    def apply_update(self, item: Dict[str, Any]) -> None:
+        while self._peek() is not None:
+            clause = self._next().upper()
+            while True:
+                if clause == "SET":
+                    name = self._name(self._next())
+                    self._expect("=")
+                    item[name] = self._set_value(item)
+                elif clause == "REMOVE":
+                    item.pop(self._name(self._next()), None)
+                elif clause == "ADD":
+                    name = self._name(self._next())
+                    value = self.values[self._next()]
+                    if isinstance(value, set):
+                        item[name] = set(item.get(name, set())) | value
+                    else:
+                        item[name] = item.get(name, Decimal(0)) + value
+                elif clause == "DELETE":
+                    name = self._name(self._next())
+                    value = self.values[self._next()]
+                    remaining = set(item.get(name, set())) - value
+                    if remaining:
+                        item[name] = remaining
+                    else:
+                        item.pop(name, None)
+                else:
+                    raise ValueError(f"Unsupported update clause {clause}")
+                if self._peek() != ",":
+                    break
+                self._next()
+
+    def _set_value(self, item: Dict[str, Any]) -> Any:
+        value = self._set_term(item)
+        while self._peek() in ("+", "-"):
+            op = self._next()
+            right = self._set_term(item)
+            value = value + right if op == "+" else value - right
+        return value
+
+    def _set_term(self, item: Dict[str, Any]) -> Any:
+        token = self._peek().lower()
+        if token == "if_not_exists":
+            self._next()
+            self._expect("(")
+            name = self._name(self._next())
+            self._expect(",")
+            default = self._set_value(item)
+            self._expect(")")
+            return item[name] if name in item else default
+        if token == "list_append":
+            self._next()
+            self._expect("(")
+            left = self._set_value(item)
+            self._expect(",")
+            right = self._set_value(item)
+            self._expect(")")
+            return list(left or []) + list(right or [])
+        return copy.deepcopy(self._operand(item))
+
+
+def _evaluate_condition(condition: Any, item: Dict[str, Any]) -> bool:
+    """Evaluate a boto3 ``Key``/``Attr`` condition object against ``item``."""
+    expression = condition.get_expression()
+    operator = expression["operator"]
+    values = expression["values"]
+
+    if operator == "AND":
+        return all(_evaluate_condition(v, item) for v in values)
+    if operator == "OR":
+        return any(_evaluate_condition(v, item) for v in values)
+    if operator == "NOT":
+        return not _evaluate_condition(values[0], item)
+
+    def resolve(value: Any) -> Any:
+        if hasattr(value, "name") and not isinstance(value, (str, bytes)):
+            return item.get(value.name)
+        return _normalize(value)
+
+    left = resolve(values[0])
+    if operator == "attribute_exists":
+        return values[0].name in item
+    if operator == "attribute_not_exists":
+        return values[0].name not in item
+    if operator == "BETWEEN":
+        return _compare(left, ">=", resolve(values[1])) and _compare(
+            left, "<=", resolve(values[2])
+        )
+    if operator == "begins_with":
+        return isinstance(left, str) and left.startswith(resolve(values[1]))
+    if operator == "contains":
+        return left is not None and resolve(values[1]) in left
+    if operator == "IN":
+        return left in [resolve(v) for v in values[1]]
+    if operator == "attribute_type":
+        raise ValueError("attribute_type is not supported by the memory table")
+    return _compare(left, operator, resolve(values[1]))
+
+
+def _find_hash_value(condition: Any, hash_key: str) -> Any:
+    expression = condition.get_expression()
+    if expression["operator"] == "AND":
+        for value in expression["values"]:
+            found = _find_hash_value(value, hash_key)
+            if found is not None:
+                return found
+        return None
+    if expression["operator"] == "=" and expression["values"][0].name == hash_key:
+        return _normalize(expression["values"][1])
+    return None
+
+
+class MemoryTable:
+
+    def __init__(self, database: "MemoryDynamoDB", table_name: str) -> None:
+        self.name: str = table_name
+        self.table_name: str = table_name
+        self._db = database
+        self.meta = SimpleNamespace(client=database.meta.client)
+
+    def query(self, **params: Any) -> Dict[str, Any]:
+        return self._db.query(self.name, **params)
+
+    def scan(self, **params: Any) -> Dict[str, Any]:
+        return self._db.scan(self.name, **params)
+
+    def get_item(self, **params: Any) -> Dict[str, Any]:
+        return self._db.get_item(self.name, **params)
+
+    def put_item(self, **params: Any) -> Dict[str, Any]:
+        return self._db.put_item(self.name, **params)
+
+    def delete_item(self, **params: Any) -> Dict[str, Any]:
+        return self._db.delete_item(self.name, **params)
+
+    def update_item(self, **params: Any) -> Dict[str, Any]:
+        return self._db.update_item(self.name, **params)
+
+
+class MemoryClient:
+
+    def __init__(self, database: "MemoryDynamoDB") -> None:
+        self._db = database
+        self.exceptions = SimpleNamespace(
+            ClientError=ClientError,
+            ConditionalCheckFailedException=ConditionalCheckFailedException,
+            TransactionCanceledException=TransactionCanceledException,
+            ResourceNotFoundException=ResourceNotFoundException,
+        )
+
+    def query(self, TableName: str, **params: Any) -> Dict[str, Any]:
+        return self._db.query(TableName, **params)
+
+    def get_item(self, TableName: str, **params: Any) -> Dict[str, Any]:
+        return self._db.get_item(TableName, **params)
+
+    def put_item(self, TableName: str, **params: Any) -> Dict[str, Any]:
+        return self._db.put_item(TableName, **params)
+
+    def delete_item(self, TableName: str, **params: Any) -> Dict[str, Any]:
+        return self._db.delete_item(TableName, **params)
+
+    def update_item(self, TableName: str, **params: Any) -> Dict[str, Any]:
+        return self._db.update_item(TableName, **params)
+
+    def batch_get_item(self, **params: Any) -> Dict[str, Any]:
+        return self._db.batch_get_item(**params)
+
+    def batch_write_item(self, **params: Any) -> Dict[str, Any]:
+        return self._db.batch_write_item(**params)
+
+    def transact_write_items(self, **params: Any) -> Dict[str, Any]:
+        return self._db.transact_write_items(**params)
+
+
+class MemoryDynamoDB:
+    """Thread-safe in-memory table store with the production key schema."""
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.0,
+        max_page_items: Optional[int] = None,
+        indexes: Optional[Dict[Optional[str], Tuple[str, str]]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.latency_seconds: float = latency_seconds
+        # Simulates DynamoDB's 1 MB page cut-off with an item count.
+        self.max_page_items: Optional[int] = max_page_items
+        self.indexes = indexes or TABLE_INDEXES
+        self.calls: Dict[str, int] = {}
+        self._sleep = sleep
+        self._lock = threading.RLock()
+        self._tables: Dict[str, Dict[Tuple[Any, Any], Dict[str, Any]]] = {}
+        self.meta = SimpleNamespace(client=None)
+        self.meta.client = MemoryClient(self)
+
+    def Table(self, table_name: str) -> MemoryTable:
+        return MemoryTable(self, table_name)
+
+    def items(self, table_name: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return copy.deepcopy(list(self._table(table_name).values()))
+
+    # helpers
+
+    def _table(self, table_name: str) -> Dict[Tuple[Any, Any], Dict[str, Any]]:
+        return self._tables.setdefault(table_name, {})
+
+    def _record(self, operation: str) -> None:
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+        if self.latency_seconds:
+            self._sleep(self.latency_seconds)
+
+    @staticmethod
+    def _primary(key: Dict[str, Any]) -> Tuple[Any, Any]:
+        return (_normalize(key["PK"]), _normalize(key["SK"]))
+
+    @staticmethod
+    def _check(
+        operation: str,
+        params: Dict[str, Any],
+        item: Optional[Dict[str, Any]],
+    ) -> bool:
+        condition = params.get("ConditionExpression")
+        if condition is None:
+            return True
+        current = item or {}
+        if isinstance(condition, ConditionBase):
+            return _evaluate_condition(condition, current)
+        return _Expression(
+            condition,
+            params.get("ExpressionAttributeNames"),
+            params.get("ExpressionAttributeValues"),
+        ).evaluate(current)
+
+    @staticmethod
+    def _filter(
+        items: List[Dict[str, Any]], params: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        filter_expression = params.get("FilterExpression")
+        if filter_expression is None:
+            return list(items)
+        if isinstance(filter_expression, ConditionBase):
+            return [i for i in items if _evaluate_condition(filter_expression, i)]
+        expression = _Expression(
+            filter_expression,
+            params.get("ExpressionAttributeNames"),
+            params.get("ExpressionAttributeValues"),
+        )
+        return [item for item in items if expression.evaluate(item)]
+
+    @staticmethod
+    def _project(item: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+        projection = params.get("ProjectionExpression")
+        if not projection:
+            return copy.deepcopy(item)
+        names = params.get("ExpressionAttributeNames") or {}
+        attributes = [names.get(a.strip(), a.strip()) for a in projection.split(",")]
+        return {a: copy.deepcopy(item[a]) for a in attributes if a in item}
+
+    @staticmethod
+    def _consumed(
+        table_name: str, params: Dict[str, Any], units: float
+    ) -> Dict[str, Any]:
+        if params.get("ReturnConsumedCapacity") in ("TOTAL", "INDEXES"):
+            return {"ConsumedCapacity": {"TableName": table_name, "CapacityUnits": units}}
+        return {}
+
+    @staticmethod
+    def _consumed_tables(
+        params: Dict[str, Any], units: Dict[str, float]
+    ) -> Dict[str, Any]:
+        # Batch and transaction calls report one entry per table.
+        if params.get("ReturnConsumedCapacity") in ("TOTAL", "INDEXES"):
+            return {
+                "ConsumedCapacity": [
+                    {"TableName": name, "CapacityUnits": total}
+                    for name, total in units.items()
+                ]
+            }
+        return {}
+
+    @staticmethod
+    def _read_units(size: int, consistent: bool) -> float:
+        units = max(1, math.ceil(size / 4096))
+        return float(units) if consistent else units / 2
+
+    @staticmethod
+    def _write_units(size: int) -> float:
+        return float(max(1, math.ceil(size / 1024)))
+
+    # operations
+
+    def query(self, table_name: str, **params: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._record("Query")
+            index_name = params.get("IndexName")
+            if index_name not in self.indexes:
+                raise _client_error(
+                    ResourceNotFoundException, "Query", f"Unknown index {index_name}"
+                )
+            hash_key, range_key = self.indexes[index_name]
+            key_condition = params["KeyConditionExpression"]
+            if not isinstance(key_condition, ConditionBase):
+                raise ValueError("The memory table expects Key() conditions")
+            hash_value = _find_hash_value(key_condition, hash_key)
+
+            candidates = [
+                item
+                for item in self._table(table_name).values()
+                if item.get(hash_key) == hash_value
+                and range_key in item
+                and _evaluate_condition(key_condition, item)
+            ]
+
+            def position(item: Dict[str, Any]) -> Tuple[Any, ...]:
+                return (item[range_key], item["PK"], item["SK"])
+
+            candidates.sort(key=position, reverse=not params.get("ScanIndexForward", True))
+
+            start_key = params.get("ExclusiveStartKey")
+            if start_key:
+                start = position(_normalize(start_key))
+                forward = params.get("ScanIndexForward", True)
+                candidates = [
+                    item
+                    for item in candidates
+                    if (position(item) > start if forward else position(item) < start)
+                ]
+
+            page_limit = params.get("Limit")
+            if self.max_page_items is not None:
+                page_limit = min(page_limit or self.max_page_items, self.max_page_items)
+            evaluated = candidates[:page_limit] if page_limit else candidates
+
+            matched = self._filter(evaluated, params)
+
+            response: Dict[str, Any] = {
+                "Count": len(matched),
+                "ScannedCount": len(evaluated),
+            }
+            if params.get("Select") != "COUNT":
+                response["Items"] = [self._project(item, params) for item in matched]
+            if page_limit and len(candidates) > len(evaluated):
+                last = evaluated[-1]
+                response["LastEvaluatedKey"] = copy.deepcopy(
+                    {k: last[k] for k in {"PK", "SK", hash_key, range_key}}
+                )
+            response.update(
+                self._consumed(
+                    table_name,
+                    params,
+                    self._read_units(
+                        sum(_item_size(i) for i in evaluated),
+                        bool(params.get("ConsistentRead")),
+                    ),
+                )
+            )
+            return response
+
+    def scan(self, table_name: str, **params: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._record("Scan")
+
+            def position(item: Dict[str, Any]) -> Tuple[Any, ...]:
+                return (item["PK"], item["SK"])
+
+            candidates = sorted(self._table(table_name).values(), key=position)
+            start_key = params.get("ExclusiveStartKey")
+            if start_key:
+                start = position(_normalize(start_key))
+                candidates = [item for item in candidates if position(item) > start]
+
+            page_limit = params.get("Limit")
+            if self.max_page_items is not None:
+                page_limit = min(page_limit or self.max_page_items, self.max_page_items)
+            evaluated = candidates[:page_limit] if page_limit else candidates
+            matched = self._filter(evaluated, params)
+
+            response: Dict[str, Any] = {
+                "Items": [self._project(item, params) for item in matched],
+                "Count": len(matched),
+                "ScannedCount": len(evaluated),
+            }
+            if page_limit and len(candidates) > len(evaluated):
+                last = evaluated[-1]
+                response["LastEvaluatedKey"] = {"PK": last["PK"], "SK": last["SK"]}
+            response.update(
+                self._consumed(
+                    table_name,
+                    params,
+                    self._read_units(
+                        sum(_item_size(i) for i in evaluated),
+                        bool(params.get("ConsistentRead")),
+                    ),
+                )
+            )
+            return response
+
+    def get_item(self, table_name: str, **params: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._record("GetItem")
+            item = self._table(table_name).get(self._primary(params["Key"]))
+            response: Dict[str, Any] = {}
+            if item is not None:
+                response["Item"] = self._project(item, params)
+            response.update(
+                self._consumed(
+                    table_name,
+                    params,
+                    self._read_units(
+                        _item_size(item or {}), bool(params.get("ConsistentRead"))
+                    ),
+                )
+            )
+            return response
+
+    def put_item(self, table_name: str, **params: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._record("PutItem")
+            item = _normalize(params["Item"])
+            key = self._primary(item)
+            existing = self._table(table_name).get(key)
+            if not self._check("PutItem", params, existing):
+                raise _client_error(
+                    ConditionalCheckFailedException,
+                    "PutItem",
+                    "The conditional request failed",
+                )
+            self._table(table_name)[key] = item
+            return self._consumed(table_name, params, self._write_units(_item_size(item)))
+
+    def delete_item(self, table_name: str, **params: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._record("DeleteItem")
+            key = self._primary(params["Key"])
+            existing = self._table(table_name).get(key)
+            if not self._check("DeleteItem", params, existing):
+                raise _client_error(
+                    ConditionalCheckFailedException,
+                    "DeleteItem",
+                    "The conditional request failed",
+                )
+            self._table(table_name).pop(key, None)
+            response: Dict[str, Any] = {}
+            if existing is not None and params.get("ReturnValues") == "ALL_OLD":
+                response["Attributes"] = copy.deepcopy(existing)
+            response.update(
+                self._consumed(
+                    table_name, params, self._write_units(_item_size(existing or {}))
+                )
+            )
+            return response
+
+    def update_item(self, table_name: str, **params: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._record("UpdateItem")
+            item = self._apply_update(table_name, "UpdateItem", params)
+            response: Dict[str, Any] = {}
+            if params.get("ReturnValues") in ("ALL_NEW", "UPDATED_NEW"):
+                response["Attributes"] = copy.deepcopy(item)
+            response.update(
+                self._consumed(table_name, params, self._write_units(_item_size(item)))
+            )
+            return response
+
+    def _apply_update(
+        self, table_name: str, operation: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        key = self._primary(params["Key"])
+        existing = self._table(table_name).get(key)
+        if not self._check(operation, params, existing):
+            raise _client_error(
+                ConditionalCheckFailedException,
+                operation,
+                "The conditional request failed",
+            )
+        item = copy.deepcopy(existing) if existing else _normalize(dict(params["Key"]))
+        _Expression(
+            params["UpdateExpression"],
+            params.get("ExpressionAttributeNames"),
+            params.get("ExpressionAttributeValues"),
+        ).apply_update(item)
+        self._table(table_name)[key] = item
+        return item
+
+    def batch_get_item(self, **params: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._record("BatchGetItem")
+            responses: Dict[str, List[Dict[str, Any]]] = {}
+            units: Dict[str, float] = {}
+            for table_name, request in params["RequestItems"].items():
+                found = []
+                units[table_name] = 0.0
+                for key in request["Keys"]:
+                    item = self._table(table_name).get(self._primary(key))
+                    if item is not None:
+                        found.append(self._project(item, request))
+                        units[table_name] += self._read_units(
+                            _item_size(item), bool(request.get("ConsistentRead"))
+                        )
+                responses[table_name] = found
+            return {
+                "Responses": responses,
+                "UnprocessedKeys": {},
+                **self._consumed_tables(params, units),
+            }
+
+    def batch_write_item(self, **params: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._record("BatchWriteItem")
+            units: Dict[str, float] = {}
+            for table_name, requests in params["RequestItems"].items():
+                table = self._table(table_name)
+                units[table_name] = 0.0
+                for request in requests:
+                    if "PutRequest" in request:
+                        item = _normalize(request["PutRequest"]["Item"])
+                        table[self._primary(item)] = item
+                    else:
+                        item = table.pop(
+                            self._primary(request["DeleteRequest"]["Key"]), None
+                        )
+                    units[table_name] += self._write_units(_item_size(item or {}))
+            return {"UnprocessedItems": {}, **self._consumed_tables(params, units)}
+
+    def transact_write_items(self, **params: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._record("TransactWriteItems")
+            actions = params["TransactItems"]
+
+            reasons = []
+            for action in actions:
+                (kind, request), = action.items()
+                table = self._table(request["TableName"])
+                key = self._primary(request["Item"] if kind == "Put" else request["Key"])
+                if self._check(kind, request, table.get(key)):
+                    reasons.append({"Code": "None"})
+                else:
+                    reasons.append(
+                        {
+                            "Code": "ConditionalCheckFailed",
+                            "Message": "The conditional request failed",
+                        }
+                    )
+            if any(reason["Code"] != "None" for reason in reasons):
+                raise _client_error(
+                    TransactionCanceledException,
+                    "TransactWriteItems",
+                    "Transaction cancelled",
+                    CancellationReasons=reasons,
+                )
+
+            units: Dict[str, float] = {}
+            for action in actions:
+                (kind, request), = action.items()
+                table = self._table(request["TableName"])
+                key = self._primary(request["Item"] if kind == "Put" else request["Key"])
+                size = _item_size(request.get("Item") or table.get(key) or {})
+                # Transactional writes cost twice the standard write units.
+                units[request["TableName"]] = units.get(
+                    request["TableName"], 0.0
+                ) + 2 * self._write_units(size)
+                if kind == "Put":
+                    item = _normalize(request["Item"])
+                    table[self._primary(item)] = item
+                elif kind == "Delete":
+                    table.pop(self._primary(request["Key"]), None)
+                elif kind == "Update":
+                    item = copy.deepcopy(table.get(self._primary(request["Key"])))
+                    item = item or _normalize(dict(request["Key"]))
+                    _Expression(
+                        request["UpdateExpression"],
+                        request.get("ExpressionAttributeNames"),
+                        request.get("ExpressionAttributeValues"),
+                    ).apply_update(item)
+                    table[self._primary(request["Key"])] = item
+            return self._consumed_tables(params, units)
@@ -1,25 +1,42 @@
-from typing import Optional, List, Any
+from typing import Dict, Optional, List, Any
+from functools import partial
 import uuid
 import time
-import asyncio
 from boto3.dynamodb.conditions import Key, Attr
-from app.models.models import Room
+from app.models.models import Room, Page, Watermark
+from app.utils.dynamo_batch import batch_get_items
+from app.utils.dynamo_executor import DynamoExecutor
 from app.utils.errors import NotFoundError, InvalidInputError, ConflictError
+from app.utils.pagination import query_partitions_page
+from app.utils.partition_keys import partition_key, partition_keys
+from app.utils.watermarks import (
+    parse_watermark,
+    rooms_watermark_key,
+    watermark_update,
+)
 
 
 class RoomRepository:
 
-    def __init__(self, dynamodb_client: Any, table_name: str) -> None:
+    def __init__(
+        self,
+        dynamodb_client: Any,
+        table_name: str,
+        shard_count: int = 1,
+        executor: Optional[DynamoExecutor] = None,
+    ) -> None:
         self.dynamodb: Any = dynamodb_client
         self.table: Any = dynamodb_client.Table(table_name)
+        self.shard_count: int = shard_count
+        self.executor: DynamoExecutor = executor or DynamoExecutor()
+        self._query = partial(self.executor.run, self.table.query)
 
     async def create(self, room: Room) -> None:
         if not room:
             raise InvalidInputError("Room is required")
 
         item = {
-            "PK": "ROOM",
-            "SK": f"ROOM#{room.id}",
+            **self._key(room.id),
             "LSI1": room.floor,
             "LSI2": room.capacity,
             "ID": room.id,
@@ -35,76 +52,128 @@ class RoomRepository:
             "UpdatedAt": room.updated_at,
         }
 
+        # The room-number item makes (floor, number) unique without reading
+        # the ROOM partition; both writes succeed or neither does.
         try:
-            await asyncio.to_thread(
-                self.table.put_item,
-                Item=item,
-                ConditionExpression="attribute_not_exists(PK) AND attribute_not_exists(SK)",
+            await self.executor.run(
+                self.dynamodb.meta.client.transact_write_items,
+                TransactItems=[
+                    {
+                        "Put": {
+                            "TableName": self.table.table_name,
+                            "Item": item,
+                            "ConditionExpression": "attribute_not_exists(PK) AND attribute_not_exists(SK)",
+                        }
+                    },
+                    {
+                        "Put": {
+                            "TableName": self.table.table_name,
+                            "Item": {
+                                **self._room_number_key(room.floor, room.room_number),
+                                "RoomID": room.id,
+                            },
+                            "ConditionExpression": "attribute_not_exists(PK)",
+                        }
+                    },
+                    self._watermark_update(room.updated_at),
+                ],
             )
-        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
-            raise ConflictError("Room already exists")
+        except self.dynamodb.meta.client.exceptions.TransactionCanceledException as e:
+            reasons = e.response.get("CancellationReasons", [])
+            codes = [reason.get("Code") for reason in reasons]
+            if len(codes) > 1 and codes[1] == "ConditionalCheckFailed":
+                raise ConflictError("Room number already exists on this floor")
+            if codes and codes[0] == "ConditionalCheckFailed":
+                raise ConflictError("Room already exists")
+            raise
 
     async def get_all(self) -> List[Room]:
-        response = await asyncio.to_thread(
-            self.table.query, KeyConditionExpression=Key("PK").eq("ROOM")
-        )
+        return (await self.get_all_page()).items
 
-        if not response.get("Items"):
-            return []
-
-        rooms = []
-        for item in response["Items"]:
-            rooms.append(
-                Room(
-                    id=item["ID"],
-                    name=item["Name"],
-                    room_number=int(item["RoomNumber"]),
-                    capacity=int(item["Capacity"]),
-                    floor=int(item["Floor"]),
-                    amenities=item.get("Amenities", []),
-                    status=item["Status"],
-                    location=item["Location"],
-                    description=item.get("Description"),
-                    created_at=int(item["CreatedAt"]),
-                    updated_at=int(item["UpdatedAt"]),
-                )
-            )
+    async def get_all_page(
+        self,
+        limit: Optional[int] = None,
+        next_token: Optional[str] = None,
+        floor: Optional[int] = None,
+        min_capacity: Optional[int] = None,
+        status: Optional[str] = None,
+        amenities: Optional[List[str]] = None,
+    ) -> Page[Room]:
+        """Rooms matching the filters, one page at a time.
+
+        Floor and capacity become key conditions on LSI1 (floor) or LSI2
+        (capacity) so only matching rooms are read; the remaining filters
+        are applied server-side as a FilterExpression.
+        """
+        query_kwargs: dict = {}
+        sort_key_condition: Any = None
+        filters: List[Any] = []
+        if floor is not None:
+            query_kwargs["IndexName"] = "LSI1"
+            sort_key_condition = Key("LSI1").eq(floor)
+            if min_capacity is not None:
+                filters.append(Attr("LSI2").gte(min_capacity))
+        elif min_capacity is not None:
+            query_kwargs["IndexName"] = "LSI2"
+            sort_key_condition = Key("LSI2").gte(min_capacity)
+        if status:
+            # Older rooms were stored with a capitalised status.
+            variants = list(dict.fromkeys([status.lower(), status.capitalize()]))
+            filters.append(Attr("Status").is_in(variants))
+        for amenity in amenities or []:
+            filters.append(Attr("Amenities").contains(amenity))
+        if filters:
+            filter_expression = filters[0]
+            for condition in filters[1:]:
+                filter_expression = filter_expression & condition
+            query_kwargs["FilterExpression"] = filter_expression
 
-        return rooms
+        items, token = await query_partitions_page(
+            self._query,
+            self._partition_queries(sort_key_condition, **query_kwargs),
+            limit,
+            next_token,
+        )
+        return Page(
+            items=[self._unmarshal_room(item) for item in items], next_token=token
+        )
 
-    async def get_by_id(self, room_id: str) -> Optional[Room]:
+    async def get_by_id(
+        self, room_id: str, consistent_read: bool = False
+    ) -> Optional[Room]:
         if not room_id:
             raise InvalidInputError("Room ID is required")
 
-        response = await asyncio.to_thread(
-            self.table.get_item, Key={"PK": "ROOM", "SK": f"ROOM#{room_id}"}
+        response = await self.executor.run(
+            self.table.get_item,
+            Key=self._key(room_id),
+            ConsistentRead=consistent_read,
         )
 
         if "Item" not in response:
             raise NotFoundError("Room not found")
 
-        item = response["Item"]
-        return Room(
-            id=item["ID"],
-            name=item["Name"],
-            room_number=int(item["RoomNumber"]),
-            capacity=int(item["Capacity"]),
-            floor=int(item["Floor"]),
-            amenities=item.get("Amenities", []),
-            status=item["Status"],
-            location=item["Location"],
-            description=item.get("Description"),
-            created_at=int(item["CreatedAt"]),
-            updated_at=int(item["UpdatedAt"]),
+        return self._unmarshal_room(response["Item"])
+
+    async def get_many(
+        self, room_ids: List[str], consistent_read: bool = False
+    ) -> Dict[str, Room]:
+        unique_ids = list(dict.fromkeys(room_ids))
+        items = await batch_get_items(
+            self.executor,
+            self.dynamodb,
+            self.table.table_name,
+            [self._key(room_id) for room_id in unique_ids],
+            consistent_read=consistent_read,
         )
+        return {item["ID"]: self._unmarshal_room(item) for item in items}
 
     async def update(self, room: Room) -> None:
         if not room:
             raise InvalidInputError("Room is required")
 
         item = {
-            "PK": "ROOM",
-            "SK": f"ROOM#{room.id}",
+            **self._key(room.id),
             "LSI1": room.floor,
             "LSI2": room.capacity,
             "ID": room.id,
@@ -120,57 +189,137 @@ class RoomRepository:
             "UpdatedAt": room.updated_at,
         }
 
-        try:
-            await asyncio.to_thread(
-                self.table.put_item,
-                Item=item,
-                ConditionExpression="attribute_exists(PK) AND attribute_exists(SK)",
-            )
-        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
-            raise NotFoundError("Room not found")
+        await self._transact_with_watermark(
+            {
+                "Put": {
+                    "TableName": self.table.table_name,
+                    "Item": item,
+                    "ConditionExpression": "attribute_exists(PK) AND attribute_exists(SK)",
+                }
+            },
+            room.updated_at,
+        )
 
     async def delete_by_id(self, room_id: str) -> None:
         if not room_id:
             raise InvalidInputError("Room ID is required")
 
+        room = await self.get_by_id(room_id)
         try:
-            await asyncio.to_thread(
-                self.table.delete_item,
-                Key={"PK": "ROOM", "SK": f"ROOM#{room_id}"},
-                ConditionExpression="attribute_exists(PK) AND attribute_exists(SK)",
+            await self.executor.run(
+                self.dynamodb.meta.client.transact_write_items,
+                TransactItems=[
+                    {
+                        "Delete": {
+                            "TableName": self.table.table_name,
+                            "Key": self._key(room_id),
+                            "ConditionExpression": "attribute_exists(PK) AND attribute_exists(SK)",
+                        }
+                    },
+                    {
+                        "Delete": {
+                            "TableName": self.table.table_name,
+                            "Key": self._room_number_key(room.floor, room.room_number),
+                            "ConditionExpression": "attribute_not_exists(PK) OR RoomID = :id",
+                            "ExpressionAttributeValues": {":id": room_id},
+                        }
+                    },
+                    self._watermark_update(int(time.time())),
+                ],
             )
-        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
-            raise NotFoundError("Room not found")
+        except self.dynamodb.meta.client.exceptions.TransactionCanceledException as e:
+            reasons = e.response.get("CancellationReasons", [])
+            if reasons and reasons[0].get("Code") == "ConditionalCheckFailed":
+                raise NotFoundError("Room not found")
+            raise
 
     async def update_availability(self, room_id: str, status: str) -> None:
         if not room_id:
             raise InvalidInputError("Room ID is required")
 
-        try:
-            await asyncio.to_thread(
-                self.table.update_item,
-                Key={"PK": "ROOM", "SK": f"ROOM#{room_id}"},
-                UpdateExpression="SET #status = :status, UpdatedAt = :updated_at",
-                ExpressionAttributeNames={"#status": "Status"},
-                ExpressionAttributeValues={
-                    ":status": status,
-                    ":updated_at": int(time.time()),
-                },
-                ConditionExpression="attribute_exists(PK) AND attribute_exists(SK)",
-            )
-        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
-            raise NotFoundError("Room not found")
+        now = int(time.time())
+        await self._transact_with_watermark(
+            {
+                "Update": {
+                    "TableName": self.table.table_name,
+                    "Key": self._key(room_id),
+                    "UpdateExpression": "SET #status = :status, UpdatedAt = :updated_at",
+                    "ExpressionAttributeNames": {"#status": "Status"},
+                    "ExpressionAttributeValues": {
+                        ":status": status,
+                        ":updated_at": now,
+                    },
+                    "ConditionExpression": "attribute_exists(PK) AND attribute_exists(SK)",
+                }
+            },
+            now,
+        )
+
+    async def get_watermark(self) -> Watermark:
+        """Version of the room collection, bumped by every room write."""
+        response = await self.executor.run(
+            self.table.get_item, Key=rooms_watermark_key(), ConsistentRead=True
+        )
+        return parse_watermark(response.get("Item"))
+
+    async def get_by_floor(self, floor: int) -> List[Room]:
+        return (await self.get_by_floor_page(floor)).items
+
+    async def get_by_floor_page(
+        self,
+        floor: int,
+        limit: Optional[int] = None,
+        next_token: Optional[str] = None,
+    ) -> Page[Room]:
+        return await self.get_all_page(limit, next_token, floor=floor)
 
-    async def check_room_number_exists_on_floor(
-        self, room_number: int, floor: int
-    ) -> bool:
+    async def _transact_with_watermark(self, room_write: dict, now: int) -> None:
         try:
-            response = await asyncio.to_thread(
-                self.table.query,
-                KeyConditionExpression=Key("PK").eq("ROOM"),
-                FilterExpression=Attr("RoomNumber").eq(room_number)
-                & Attr("Floor").eq(floor),
+            await self.executor.run(
+                self.dynamodb.meta.client.transact_write_items,
+                TransactItems=[room_write, self._watermark_update(now)],
             )
-            return len(response.get("Items", [])) > 0
-        except Exception:
-            return False
+        except self.dynamodb.meta.client.exceptions.TransactionCanceledException as e:
+            reasons = e.response.get("CancellationReasons", [])
+            if reasons and reasons[0].get("Code") == "ConditionalCheckFailed":
+                raise NotFoundError("Room not found")
+            raise
+
+    def _watermark_update(self, now: int) -> dict:
+        return watermark_update(self.table.table_name, rooms_watermark_key(), now)
+
+    def _key(self, room_id: str) -> dict:
+        return {
+            "PK": partition_key("ROOM", room_id, self.shard_count),
+            "SK": f"ROOM#{room_id}",
+        }
+
+    def _room_number_key(self, floor: int, room_number: int) -> dict:
+        return {"PK": f"ROOMNUM#{floor}#{room_number}", "SK": "ROOMNUM"}
+
+    def _partition_queries(
+        self, sort_key_condition: Any = None, **query_kwargs: Any
+    ) -> List[dict]:
+        queries = []
+        for pk in partition_keys("ROOM", self.shard_count):
+            key_condition = Key("PK").eq(pk)
+            if sort_key_condition is not None:
+                key_condition = key_condition & sort_key_condition
+            queries.append({"KeyConditionExpression": key_condition, **query_kwargs})
+        return queries
+
+    def _unmarshal_room(self, item: dict) -> Room:
+        # Items come from our own writes, so validation is skipped.
+        return Room.model_construct(
+            id=item["ID"],
+            name=item["Name"],
+            room_number=int(item["RoomNumber"]),
+            capacity=int(item["Capacity"]),
+            floor=int(item["Floor"]),
+            amenities=list(item.get("Amenities", [])),
+            status=item["Status"],
+            location=item["Location"],
+            description=item.get("Description"),
+            created_at=int(item["CreatedAt"]),
+            updated_at=int(item["UpdatedAt"]),
+        )
@@ -1,119 +1,123 @@
-from typing import Optional, List, Any
+from typing import Dict, Optional, List, Any
+from functools import partial
 import boto3
-import asyncio
 from boto3.dynamodb.conditions import Key
-from app.models.models import User
+from app.models.models import User, Page
+from app.utils.dynamo_executor import DynamoExecutor
 from app.utils.errors import NotFoundError, InvalidInputError
+from app.utils.dynamo_batch import batch_get_items
+from app.utils.pagination import query_partitions_page
+from app.utils.partition_keys import partition_key, partition_keys
 import time
 
 
 class UserRepository:
-    def __init__(self, dynamodb_client: Any, table_name: str) -> None:
+    def __init__(
+        self,
+        dynamodb_client: Any,
+        table_name: str,
+        shard_count: int = 1,
+        executor: Optional[DynamoExecutor] = None,
+    ) -> None:
         self.dynamodb: Any = dynamodb_client
         self.table: Any = dynamodb_client.Table(table_name)
+        self.shard_count: int = shard_count
+        self.executor: DynamoExecutor = executor or DynamoExecutor()
+        self._query = partial(self.executor.run, self.table.query)
 
-    async def find_user_id_by_email(self, email: str) -> str:
+    async def find_by_email(self, email: str, consistent_read: bool = False) -> User:
+        """Resolve a user by email with one read of the email item.
+
+        Email items carry a copy of the user's attributes; items written
+        before that only point at the user ID and need a second read.
+        """
         if not email:
             raise InvalidInputError("Email is required")
 
-        response = await asyncio.to_thread(
-            self.table.query,
-            KeyConditionExpression=Key("PK").eq("USER") & Key("SK").eq(email),
+        response = await self.executor.run(
+            self.table.get_item,
+            Key=self._email_key(email),
+            ConsistentRead=consistent_read,
         )
-
-        if not response.get("Items"):
+        item = response.get("Item")
+        if not item or not item.get("ID"):
             raise NotFoundError("User not found")
+        if "Password" in item:
+            return self._unmarshal_user(item)
+        return await self.get_by_id(str(item["ID"]), consistent_read)
 
-        user_id = response["Items"][0].get("ID")
-        return str(user_id) if user_id else ""
-
-    async def find_by_email(self, email: str) -> User:
-        user_id: str = await self.find_user_id_by_email(email)
-        if not user_id:
-            raise NotFoundError("User not found")
-        return await self.get_by_id(user_id)
-
-    async def get_by_id(self, user_id: str) -> User:
+    async def get_by_id(self, user_id: str, consistent_read: bool = False) -> User:
         if not user_id:
             raise InvalidInputError("User ID is required")
 
-        response = await asyncio.to_thread(
-            self.table.query,
-            KeyConditionExpression=Key("PK").eq("USER")
-            & Key("SK").eq(f"USER#{user_id}"),
+        response = await self.executor.run(
+            self.table.get_item,
+            Key=self._user_key(user_id),
+            ConsistentRead=consistent_read,
         )
 
-        if not response.get("Items"):
+        if "Item" not in response:
             raise NotFoundError("User not found")
 
-        item = response["Items"][0]
-        return User(
-            id=item["ID"],
-            name=item["Name"],
-            email=item["Email"],
-            password=item["Password"],
-            role=item["Role"],
-            created_at=int(item["CreatedAt"]),
-            updated_at=int(item["UpdatedAt"]),
+        return self._unmarshal_user(response["Item"])
+
+    async def get_many(
+        self, user_ids: List[str], consistent_read: bool = False
+    ) -> Dict[str, User]:
+        unique_ids = list(dict.fromkeys(user_id for user_id in user_ids if user_id))
+        items = await batch_get_items(
+            self.executor,
+            self.dynamodb,
+            self.table.table_name,
+            [self._user_key(user_id) for user_id in unique_ids],
+            consistent_read=consistent_read,
         )
+        return {item["ID"]: self._unmarshal_user(item) for item in items}
 
     async def create(self, user: User) -> None:
         if not user:
             raise InvalidInputError("User is required")
 
-        await asyncio.to_thread(
+        await self.executor.run(
             self.table.meta.client.transact_write_items,
             TransactItems=[
                 {
                     "Put": {
                         "TableName": self.table.table_name,
-                        "Item": {"PK": "USER", "SK": user.email, "ID": user.id},
+                        "Item": {**self._email_key(user.email), **self._attributes(user)},
                     }
                 },
                 {
                     "Put": {
                         "TableName": self.table.table_name,
-                        "Item": {
-                            "PK": "USER",
-                            "SK": f"USER#{user.id}",
-                            "ID": user.id,
-                            "Name": user.name,
-                            "Email": user.email,
-                            "Password": user.password,
-                            "Role": user.role,
-                            "CreatedAt": user.created_at,
-                            "UpdatedAt": user.updated_at,
-                        },
+                        "Item": {**self._user_key(user.id), **self._attributes(user)},
                     }
                 },
             ],
         )
 
     async def get_all(self) -> List[User]:
-        response = await asyncio.to_thread(
-            self.table.query,
-            KeyConditionExpression=Key("PK").eq("USER")
-            & Key("SK").begins_with("USER#"),
+        return (await self.get_all_page()).items
+
+    async def get_all_page(
+        self, limit: Optional[int] = None, next_token: Optional[str] = None
+    ) -> Page[User]:
+        items, token = await query_partitions_page(
+            self._query,
+            [
+                {
+                    "KeyConditionExpression": Key("PK").eq(pk)
+                    & Key("SK").begins_with("USER#")
+                }
+                for pk in partition_keys("USER", self.shard_count)
+            ],
+            limit,
+            next_token,
         )
 
-        if not response.get("Items"):
-            return []
-
-        users = []
-        for item in response["Items"]:
-            users.append(
-                User(
-                    id=item["ID"],
-                    name=item["Name"],
-                    email=item["Email"],
-                    password=item["Password"],
-                    role=item["Role"],
-                    created_at=int(item["CreatedAt"]),
-                    updated_at=int(item["UpdatedAt"]),
-                )
-            )
+        users = [self._unmarshal_user(item) for item in items]
 
-        return users
+        return Page(items=users, next_token=token)
 
     async def update(self, user: User, old_email: Optional[str] = None) -> None:
         if not user:
@@ -121,50 +125,79 @@ class UserRepository:
 
         transact_items = []
 
-        # If email changed, delete old email lookup and create new one
+        # If email changed, delete old email lookup before writing the new one
         if old_email and old_email != user.email:
             transact_items.append(
                 {
                     "Delete": {
                         "TableName": self.table.table_name,
-                        "Key": {"PK": "USER", "SK": old_email},
-                    }
-                }
-            )
-            transact_items.append(
-                {
-                    "Put": {
-                        "TableName": self.table.table_name,
-                        "Item": {"PK": "USER", "SK": user.email, "ID": user.id},
+                        "Key": self._email_key(old_email),
                     }
                 }
             )
 
-        # Update main user record
+        # The email item mirrors the user record, so both are rewritten
         transact_items.append(
             {
                 "Put": {
                     "TableName": self.table.table_name,
-                    "Item": {
-                        "PK": "USER",
-                        "SK": f"USER#{user.id}",
-                        "ID": user.id,
-                        "Name": user.name,
-                        "Email": user.email,
-                        "Password": user.password,
-                        "Role": user.role,
-                        "CreatedAt": user.created_at,
-                        "UpdatedAt": user.updated_at,
-                    },
+                    "Item": {**self._email_key(user.email), **self._attributes(user)},
+                }
+            }
+        )
+        transact_items.append(
+            {
+                "Put": {
+                    "TableName": self.table.table_name,
+                    "Item": {**self._user_key(user.id), **self._attributes(user)},
                 }
             }
         )
 
-        await asyncio.to_thread(
+        await self.executor.run(
             self.table.meta.client.transact_write_items,
             TransactItems=transact_items,
         )
 
+    async def update_password(
+        self, user: User, old_password: str, new_password: str
+    ) -> bool:
+        """Replace the password hash if it is still ``old_password``.
+
+        Only ``Password`` is written, on both the user and the email item, so
+        concurrent changes to other attributes are kept. Returns False when
+        either item no longer holds ``old_password``, which includes email
+        items not yet backfilled with the user's attributes.
+        """
+        if not user:
+            raise InvalidInputError("User is required")
+
+        try:
+            await self.executor.run(
+                self.table.meta.client.transact_write_items,
+                TransactItems=[
+                    {
+                        "Update": {
+                            "TableName": self.table.table_name,
+                            "Key": key,
+                            "UpdateExpression": "SET Password = :new",
+                            "ConditionExpression": "Password = :old",
+                            "ExpressionAttributeValues": {
+                                ":new": new_password,
+                                ":old": old_password,
+                            },
+                        }
+                    }
+                    for key in (self._email_key(user.email), self._user_key(user.id))
+                ],
+            )
+        except self.dynamodb.meta.client.exceptions.TransactionCanceledException as e:
+            reasons = e.response.get("CancellationReasons", [])
+            if any(reason.get("Code") == "ConditionalCheckFailed" for reason in reasons):
+                return False
+            raise
+        return True
+
     async def delete_by_id(self, user_id: str) -> None:
         if not user_id:
             raise InvalidInputError("User ID is required")
@@ -173,20 +206,52 @@ class UserRepository:
         if not user:
             raise NotFoundError("User not found")
 
-        await asyncio.to_thread(
+        await self.executor.run(
             self.table.meta.client.transact_write_items,
             TransactItems=[
                 {
                     "Delete": {
                         "TableName": self.table.table_name,
-                        "Key": {"PK": "USER", "SK": user.email},
+                        "Key": self._email_key(user.email),
                     }
                 },
                 {
                     "Delete": {
                         "TableName": self.table.table_name,
-                        "Key": {"PK": "USER", "SK": f"USER#{user_id}"},
+                        "Key": self._user_key(user_id),
                     }
                 },
             ],
         )
+
+    def _attributes(self, user: User) -> dict:
+        return {
+            "ID": user.id,
+            "Name": user.name,
+            "Email": user.email,
+            "Password": user.password,
+            "Role": user.role,
+            "CreatedAt": user.created_at,
+            "UpdatedAt": user.updated_at,
+        }
+
+    def _user_key(self, user_id: str) -> dict:
+        return {
+            "PK": partition_key("USER", user_id, self.shard_count),
+            "SK": f"USER#{user_id}",
+        }
+
+    def _email_key(self, email: str) -> dict:
+        return {"PK": partition_key("USER", email, self.shard_count), "SK": email}
+
+    def _unmarshal_user(self, item: dict) -> User:
+        # Items come from our own writes, so validation is skipped.
+        return User.model_construct(
+            id=item["ID"],
+            name=item["Name"],
+            email=item["Email"],
+            password=item["Password"],
+            role=item["Role"],
+            created_at=int(item["CreatedAt"]),
+            updated_at=int(item["UpdatedAt"]),
+        )
@@ -1,14 +1,23 @@
-from typing import Tuple
+from typing import Optional, Tuple
+import logging
 from app.models.models import User
 from app.repositories.users_repo import UserRepository
 from app.utils.errors import InvalidInputError, UnauthorizedError
-from app.utils import jwt_utils, password_utils
+from app.utils import jwt_utils
+from app.utils.password_utils import PasswordHasher
+
+logger = logging.getLogger(__name__)
 
 
 class AuthService:
 
-    def __init__(self, user_repository: UserRepository) -> None:
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        password_hasher: Optional[PasswordHasher] = None,
+    ) -> None:
         self.user_repo: UserRepository = user_repository
+        self.password_hasher: PasswordHasher = password_hasher or PasswordHasher()
 
     async def login(self, email: str, password: str) -> Tuple[str, User]:
         email = email.strip()
@@ -17,13 +26,28 @@ class AuthService:
         if not email or not password:
             raise InvalidInputError("Email and password are required")
 
-        user: User = await self.user_repo.find_by_email(email)
+        # Credentials and role must be current, so they never come from a cache.
+        user: User = await self.user_repo.find_by_email(email, consistent_read=True)
         if not user:
             raise UnauthorizedError("Invalid credentials")
 
-        if not password_utils.verify_password(user.password, password):
+        if not await self.password_hasher.verify(user.password, password):
             raise UnauthorizedError("Invalid credentials")
 
+        if self.password_hasher.needs_rehash(user.password):
+            await self._rehash_password(user, password)
+
         token: str = jwt_utils.generate_token(user.id, user.role)
 
         return token, user
+
+    async def _rehash_password(self, user: User, password: str) -> None:
+        # Best effort: a failed upgrade must not fail an otherwise valid login,
+        # the next login simply tries again. Only the hash is written, and only
+        # if it is still the one just verified, so a stale user is harmless.
+        try:
+            new_password = await self.password_hasher.hash(password)
+            if await self.user_repo.update_password(user, user.password, new_password):
+                user.password = new_password
+        except Exception:
+            logger.warning("Password rehash failed for user %s", user.id, exc_info=True)
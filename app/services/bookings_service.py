@@ -1,24 +1,30 @@
-from typing import List
+from typing import Dict, List, Optional
+import asyncio
 import uuid
 import time
 from app.models.models import (
     Booking,
+    BulkBookingResult,
+    Recurrence,
     BookingWithDetails,
     RoomScheduleResponse,
-    ScheduleSlot,
     User,
     Room,
+    Page,
+    ScheduleGrid,
+    ScheduleGridRoom,
+    Watermark,
 )
 from app.repositories.bookings_repo import BookingRepository
 from app.repositories.rooms_repo import RoomRepository
 from app.repositories.users_repo import UserRepository
+from app.utils.availability_index import AvailabilityIndex
 from app.utils.errors import (
     InvalidInputError,
     NotFoundError,
-    RoomUnavailableError,
     TimeRangeInvalidError,
 )
-from app.utils.time_utils import is_time_range_valid, overlaps, is_within_booking_window
+from app.utils.time_utils import is_time_range_valid, is_within_booking_window
 from app.config.config import settings
 
 
@@ -29,46 +35,29 @@ class BookingService:
         booking_repository: BookingRepository,
         room_repository: RoomRepository,
         user_repository: UserRepository,
+        availability_index: Optional[AvailabilityIndex] = None,
     ) -> None:
         self.booking_repo: BookingRepository = booking_repository
         self.room_repo: RoomRepository = room_repository
         self.user_repo: UserRepository = user_repository
+        self.availability_index: Optional[AvailabilityIndex] = availability_index
 
     async def create_booking(self, booking: Booking) -> None:
         if not booking:
             raise InvalidInputError("Booking is required")
 
-        if not booking.user_id or not booking.room_id:
-            raise InvalidInputError("User ID and Room ID are required")
+        self._validate_booking(booking)
 
-        if not is_time_range_valid(booking.start_time, booking.end_time):
-            raise TimeRangeInvalidError("Invalid time range")
-
-        if not is_within_booking_window(
-            booking.start_time, settings.MAX_BOOKING_DAYS_IN_FUTURE
-        ):
-            raise InvalidInputError(
-                f"Bookings can only be made up to {settings.MAX_BOOKING_DAYS_IN_FUTURE} days in advance"
-            )
-
-        user = await self.user_repo.get_by_id(booking.user_id)
+        user, room = await asyncio.gather(
+            self.user_repo.get_by_id(booking.user_id),
+            self.room_repo.get_by_id(booking.room_id),
+        )
         if not user:
             raise NotFoundError("User not found")
 
-        room = await self.room_repo.get_by_id(booking.room_id)
         if not room:
             raise NotFoundError("Room not found")
 
-        existing_bookings: List[Booking] = await self.booking_repo.get_by_room_and_time(
-            booking.room_id, booking.start_time, booking.end_time
-        )
-
-        for b in existing_bookings:
-            if overlaps(booking.start_time, booking.end_time, b.start_time, b.end_time):
-                raise RoomUnavailableError(
-                    "Room is not available for the selected time slot"
-                )
-
         booking.id = str(uuid.uuid4())
         booking.user_name = user.name
         booking.room_number = room.room_number
@@ -76,7 +65,124 @@ class BookingService:
         booking.created_at = int(time.time())
         booking.updated_at = int(time.time())
 
+        # Overlaps are rejected by the repository's conditional slot-lock write.
         await self.booking_repo.create(booking)
+        if self.availability_index:
+            self.availability_index.add(booking)
+
+    async def create_bookings_bulk(
+        self, user_id: str, requests: List
+    ) -> List[BulkBookingResult]:
+        """Create many bookings, expanding recurrences, with per-item results.
+
+        Rooms are resolved with one batched read and each room's existing
+        bookings with one windowed query, so only bookings that pass every
+        check reach the transactional write.
+        """
+        if not user_id:
+            raise InvalidInputError("User ID is required")
+
+        results: List[BulkBookingResult] = []
+        bookings: List[Booking] = []
+        for index, request in enumerate(requests):
+            for occurrence, booking in enumerate(
+                self._expand_recurrence(user_id, request)
+            ):
+                result = BulkBookingResult(
+                    index=index,
+                    occurrence=occurrence,
+                    room_id=booking.room_id,
+                    start_time=booking.start_time,
+                    end_time=booking.end_time,
+                    status="pending",
+                )
+                try:
+                    self._validate_booking(booking)
+                except (InvalidInputError, TimeRangeInvalidError) as e:
+                    result.status = "invalid"
+                    result.error = str(e)
+                results.append(result)
+                bookings.append(booking)
+
+        if len(bookings) > settings.MAX_BULK_BOOKINGS:
+            raise InvalidInputError(
+                f"A bulk request can create at most {settings.MAX_BULK_BOOKINGS} bookings"
+            )
+
+        user, rooms = await asyncio.gather(
+            self.user_repo.get_by_id(user_id),
+            self.room_repo.get_many(
+                list(
+                    {
+                        booking.room_id
+                        for booking, result in zip(bookings, results)
+                        if result.status == "pending"
+                    }
+                )
+            ),
+        )
+
+        pending: Dict[str, List[int]] = {}
+        for position, (booking, result) in enumerate(zip(bookings, results)):
+            if result.status != "pending":
+                continue
+            room = rooms.get(booking.room_id)
+            if room is None:
+                result.status = "not_found"
+                result.error = "Room not found"
+                continue
+            booking.id = str(uuid.uuid4())
+            booking.user_name = user.name
+            booking.room_number = room.room_number
+            booking.status = "confirmed"
+            booking.created_at = int(time.time())
+            booking.updated_at = booking.created_at
+            pending.setdefault(booking.room_id, []).append(position)
+
+        existing_by_room = await asyncio.gather(
+            *(
+                self.booking_repo.get_by_room_and_time(
+                    room_id,
+                    min(bookings[p].start_time for p in positions),
+                    max(bookings[p].end_time for p in positions),
+                )
+                for room_id, positions in pending.items()
+            )
+        )
+
+        to_write: List[Booking] = []
+        for positions, existing in zip(pending.values(), existing_by_room):
+            taken = [(b.start_time, b.end_time) for b in existing]
+            for position in sorted(positions, key=lambda p: bookings[p].start_time):
+                booking = bookings[position]
+                if any(
+                    start < booking.end_time and booking.start_time < end
+                    for start, end in taken
+                ):
+                    results[position].status = "conflict"
+                    results[position].error = (
+                        "Room is not available for the selected time slot"
+                    )
+                    continue
+                taken.append((booking.start_time, booking.end_time))
+                to_write.append(booking)
+
+        rejected = set()
+        if to_write:
+            rejected = set(await self.booking_repo.create_many(to_write))
+
+        for booking, result in zip(bookings, results):
+            if result.status != "pending":
+                continue
+            if booking.id in rejected:
+                result.status = "conflict"
+                result.error = "Room is not available for the selected time slot"
+            else:
+                result.status = "created"
+                result.booking_id = booking.id
+                if self.availability_index:
+                    self.availability_index.add(booking)
+        return results
 
     async def get_booking_by_id(self, booking_id: str) -> Booking:
         if not booking_id:
@@ -96,22 +202,42 @@ class BookingService:
         if not booking:
             raise NotFoundError("Booking not found")
 
-        await self.booking_repo.cancel(booking_id)
+        await self.booking_repo.cancel(booking)
+        if self.availability_index:
+            self.availability_index.remove(booking)
 
-    async def get_all_bookings(self) -> List[Booking]:
-        return await self.booking_repo.get_all()
+    async def get_all_bookings(
+        self, limit: Optional[int] = None, next_token: Optional[str] = None
+    ) -> Page[Booking]:
+        return await self.booking_repo.get_all_page(limit, next_token)
 
-    async def get_bookings_by_room_id(self, room_id: str) -> List[Booking]:
+    async def get_bookings_by_room_id(
+        self,
+        room_id: str,
+        limit: Optional[int] = None,
+        next_token: Optional[str] = None,
+    ) -> Page[Booking]:
         if not room_id:
             raise InvalidInputError("Room ID is required")
 
-        return await self.booking_repo.get_by_room_id(room_id)
+        return await self.booking_repo.get_by_room_id_page(room_id, limit, next_token)
+
+    async def get_bookings_by_user_id(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        next_token: Optional[str] = None,
+    ) -> Page[Booking]:
+        if not user_id:
+            raise InvalidInputError("User ID is required")
+
+        return await self.booking_repo.get_by_user_id_page(user_id, limit, next_token)
 
-    async def get_bookings_by_user_id(self, user_id: str) -> List[Booking]:
+    async def get_user_bookings_watermark(self, user_id: str) -> Watermark:
         if not user_id:
             raise InvalidInputError("User ID is required")
 
-        return await self.booking_repo.get_by_user_id(user_id)
+        return await self.booking_repo.get_user_watermark(user_id)
 
     async def get_bookings_with_details_by_room_id(
         self, room_id: str
@@ -119,35 +245,40 @@ class BookingService:
         if not room_id:
             raise InvalidInputError("Room ID is required")
 
-        bookings: List[Booking] = await self.booking_repo.get_by_room_id(room_id)
-        room = await self.room_repo.get_by_id(room_id)
+        room, bookings = await asyncio.gather(
+            self.room_repo.get_by_id(room_id),
+            self.booking_repo.get_by_room_id(room_id),
+        )
 
         if not room:
             raise NotFoundError("Room not found")
 
+        users: Dict[str, User] = await self.user_repo.get_many(
+            [booking.user_id for booking in bookings]
+        )
+
         detailed_bookings: List[BookingWithDetails] = []
         for booking in bookings:
-            try:
-                user: User = await self.user_repo.get_by_id(booking.user_id)
-                detailed_bookings.append(
-                    BookingWithDetails(
-                        id=booking.id,
-                        user_id=booking.user_id,
-                        user_name=user.name,
-                        room_id=booking.room_id,
-                        room_number=room.room_number,
-                        start_time=booking.start_time,
-                        end_time=booking.end_time,
-                        purpose=booking.purpose,
-                        status=booking.status,
-                        created_at=booking.created_at,
-                        updated_at=booking.updated_at,
-                        user_email=user.email,
-                        room_name=room.name,
-                    )
-                )
-            except Exception:
+            user = users.get(booking.user_id)
+            if not user:
                 continue
+            detailed_bookings.append(
+                BookingWithDetails(
+                    id=booking.id,
+                    user_id=booking.user_id,
+                    user_name=user.name,
+                    room_id=booking.room_id,
+                    room_number=room.room_number,
+                    start_time=booking.start_time,
+                    end_time=booking.end_time,
+                    purpose=booking.purpose,
+                    status=booking.status,
+                    created_at=booking.created_at,
+                    updated_at=booking.updated_at,
+                    user_email=user.email,
+                    room_name=room.name,
+                )
+            )
 
         return detailed_bookings
 
@@ -162,39 +293,144 @@ class BookingService:
         if not room_id:
             raise InvalidInputError("Room ID is required")
 
-        room = await self.room_repo.get_by_id(room_id)
+        room, room_day = await asyncio.gather(
+            self.room_repo.get_by_id(room_id),
+            self.booking_repo.get_room_day(room_id, (target_date // 86400) * 86400),
+        )
         if not room:
             raise NotFoundError("Room not found")
 
-        bookings: List[Booking] = await self.booking_repo.get_by_room_id_and_date(
-            room_id, target_date
-        )
-
-        schedule_slots: List[ScheduleSlot] = []
-        for booking in bookings:
-            user_name: str = ""
-            try:
-                user: User = await self.user_repo.get_by_id(booking.user_id)
-                if user:
-                    user_name = user.name
-            except Exception:
-                pass
-
-            schedule_slots.append(
-                ScheduleSlot(
-                    start_time=booking.start_time,
-                    end_time=booking.end_time,
-                    is_booked=True,
-                    booking_id=booking.id,
-                    user_name=user_name,
-                    purpose=booking.purpose,
-                )
-            )
-
         return RoomScheduleResponse(
             room_id=room.id,
             room_name=room.name,
             room_number=room.room_number,
             date=target_date,
-            bookings=schedule_slots,
+            bookings=room_day.slots,
+            version=room_day.version,
+            updated_at=max(room_day.updated_at, room.updated_at),
+        )
+
+    async def get_schedule_grid(
+        self,
+        start_date: int,
+        days: int,
+        room_ids: Optional[List[str]] = None,
+        floor: Optional[int] = None,
+    ) -> ScheduleGrid:
+        """Schedules of many rooms over consecutive days, as per-room columns.
+
+        Offsets are seconds from ``start_date``; a booking that began the day
+        before the grid has a negative start offset.
+        """
+        if not room_ids and floor is None:
+            raise InvalidInputError("Room IDs or a floor are required")
+        if not 1 <= days <= settings.MAX_SCHEDULE_GRID_DAYS:
+            raise InvalidInputError(
+                f"A grid can span 1 to {settings.MAX_SCHEDULE_GRID_DAYS} days"
+            )
+
+        if room_ids:
+            found = await self.room_repo.get_many(room_ids)
+            rooms = [
+                found[room_id] for room_id in dict.fromkeys(room_ids) if room_id in found
+            ]
+            if floor is not None:
+                rooms = [room for room in rooms if room.floor == floor]
+        else:
+            rooms = sorted(
+                await self.room_repo.get_by_floor(floor),
+                key=lambda room: room.room_number,
+            )
+        if len(rooms) > settings.MAX_SCHEDULE_GRID_ROOMS:
+            raise InvalidInputError(
+                f"A grid can show at most {settings.MAX_SCHEDULE_GRID_ROOMS} rooms"
+            )
+
+        start = (start_date // 86400) * 86400
+        room_days = await self.booking_repo.get_room_days(
+            [room.id for room in rooms], [start + i * 86400 for i in range(days)]
         )
+
+        grid_rooms: List[ScheduleGridRoom] = []
+        for index, room in enumerate(rooms):
+            columns = ScheduleGridRoom(
+                room_id=room.id,
+                room_name=room.name,
+                room_number=room.room_number,
+                floor=room.floor,
+            )
+            seen = set()
+            for room_day in room_days[index * days : (index + 1) * days]:
+                for slot in room_day.slots:
+                    # Bookings that cross midnight are listed under both days.
+                    if slot.booking_id in seen:
+                        continue
+                    seen.add(slot.booking_id)
+                    columns.starts.append(slot.start_time - start)
+                    columns.ends.append(slot.end_time - start)
+                    columns.booking_ids.append(slot.booking_id)
+                    columns.user_names.append(slot.user_name)
+                    columns.purposes.append(slot.purpose)
+            grid_rooms.append(columns)
+
+        return ScheduleGrid(
+            start=start,
+            days=days,
+            rooms=grid_rooms,
+            versions=[room_day.version for room_day in room_days],
+            updated_at=max(
+                [room_day.updated_at for room_day in room_days]
+                + [room.updated_at for room in rooms],
+                default=0,
+            ),
+        )
+
+    def _validate_booking(self, booking: Booking) -> None:
+        if not booking.user_id or not booking.room_id:
+            raise InvalidInputError("User ID and Room ID are required")
+
+        if not is_time_range_valid(booking.start_time, booking.end_time):
+            raise TimeRangeInvalidError("Invalid time range")
+
+        # Slot locks cover whole slots, so unaligned times would make adjacent
+        # bookings that share a slot conflict.
+        slot_seconds = settings.BOOKING_SLOT_MINUTES * 60
+        if booking.start_time % slot_seconds or booking.end_time % slot_seconds:
+            raise InvalidInputError(
+                f"Bookings must start and end on {settings.BOOKING_SLOT_MINUTES}-minute boundaries"
+            )
+
+        if (
+            booking.end_time - booking.start_time
+            > settings.MAX_BOOKING_DURATION_HOURS * 3600
+        ):
+            raise TimeRangeInvalidError(
+                f"Bookings cannot be longer than {settings.MAX_BOOKING_DURATION_HOURS} hours"
+            )
+
+        if not is_within_booking_window(
+            booking.start_time, settings.MAX_BOOKING_DAYS_IN_FUTURE
+        ):
+            raise InvalidInputError(
+                f"Bookings can only be made up to {settings.MAX_BOOKING_DAYS_IN_FUTURE} days in advance"
+            )
+
+    def _expand_recurrence(self, user_id: str, request) -> List[Booking]:
+        recurrence: Optional[Recurrence] = getattr(request, "recurrence", None)
+        count = recurrence.count if recurrence else 1
+        step = 0
+        if recurrence:
+            step = {"daily": 86400, "weekly": 7 * 86400}.get(recurrence.frequency)
+            if step is None:
+                raise InvalidInputError("Recurrence frequency must be daily or weekly")
+
+        return [
+            Booking(
+                user_id=user_id,
+                room_id=request.room_id,
+                start_time=request.start_time + i * step,
+                end_time=request.end_time + i * step,
+                purpose=request.purpose,
+            )
+            for i in range(count)
+        ]
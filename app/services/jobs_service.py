@@ -0,0 +1,186 @@
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import contextvars
+import logging
+import random
+import time
+import uuid
+from app.models.models import Booking, Job
+from app.repositories.bookings_repo import BookingRepository
+from app.repositories.jobs_repo import JobRepository
+from app.repositories.users_repo import UserRepository
+from app.utils.availability_index import AvailabilityIndex
+from app.utils.errors import ConflictError, InvalidInputError, NotFoundError
+
+logger = logging.getLogger(__name__)
+
+DELETE_USER_BOOKINGS = "delete_user_bookings"
+
+
+class JobService:
+    """Runs background jobs as asyncio tasks on this instance.
+
+    Progress is checkpointed after every page, so a job interrupted by a
+    crash is picked up again by ``resume_unfinished`` once its lease has
+    expired; a job interrupted by ``shutdown`` releases its lease first.
+    ``start_sweeping`` repeats ``resume_unfinished`` every lease period.
+    """
+
+    def __init__(
+        self,
+        job_repository: JobRepository,
+        booking_repository: BookingRepository,
+        user_repository: UserRepository,
+        page_size: int = 100,
+        lease_seconds: int = 60,
+        page_attempts: int = 5,
+        availability_index: Optional[AvailabilityIndex] = None,
+    ) -> None:
+        self.job_repo: JobRepository = job_repository
+        self.booking_repo: BookingRepository = booking_repository
+        self.user_repo: UserRepository = user_repository
+        self.page_size: int = page_size
+        self.lease_seconds: int = lease_seconds
+        self.page_attempts: int = page_attempts
+        self.availability_index: Optional[AvailabilityIndex] = availability_index
+        self.owner: str = str(uuid.uuid4())
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+
+    async def create_user_bookings_deletion(self, user_id: str) -> Job:
+        if not user_id:
+            raise InvalidInputError("User ID is required")
+
+        now = int(time.time())
+        job = Job(
+            id=str(uuid.uuid4()),
+            type=DELETE_USER_BOOKINGS,
+            target_id=user_id,
+            created_at=now,
+            updated_at=now,
+        )
+        await self.job_repo.create(job)
+        return job
+
+    async def get_job(self, job_id: str) -> Job:
+        return await self.job_repo.get_by_id(job_id)
+
+    def start(self, job: Job) -> None:
+        if job.id in self._tasks:
+            return
+        # A fresh context, so the job does not record into the request trace
+        # of whichever request started it.
+        task = asyncio.create_task(self.run(job), context=contextvars.Context())
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+
+    async def resume_unfinished(self) -> int:
+        jobs = [
+            job for job in await self.job_repo.get_unfinished()
+            if job.id not in self._tasks
+        ]
+        for job in jobs:
+            self.start(job)
+        return len(jobs)
+
+    def start_sweeping(self) -> None:
+        """Resume unfinished jobs now and then once per lease period."""
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(
+                self._sweep(), context=contextvars.Context()
+            )
+
+    async def abandon(self, job: Job, error: str) -> None:
+        """Mark a job that was created but must not run as failed.
+
+        Best effort: a job left pending is failed by ``run`` at the next
+        startup, because its user still exists.
+        """
+        try:
+            if await self.job_repo.claim(job.id, self.owner, self.lease_seconds):
+                job.status = "failed"
+                job.error = error
+                await self.job_repo.save_progress(
+                    job, self.owner, self.lease_seconds
+                )
+        except Exception:
+            logger.warning("Could not abandon job %s", job.id, exc_info=True)
+
+    async def shutdown(self) -> None:
+        # Cancelled jobs keep their checkpoint and release their lease, so the
+        # next sweep on any instance resumes them.
+        tasks = list(self._tasks.values())
+        if self._sweeper is not None:
+            tasks.append(self._sweeper)
+            self._sweeper = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, job: Job) -> Job:
+        was_pending = job.status == "pending"
+        if not await self.job_repo.claim(job.id, self.owner, self.lease_seconds):
+            return job
+        job.status = "running"
+
+        try:
+            if job.type != DELETE_USER_BOOKINGS:
+                raise InvalidInputError(f"Unknown job type {job.type}")
+            if was_pending and job.processed == 0 and not job.checkpoint:
+                # A pending job is only started once its user is gone; one
+                # found at startup may belong to a deletion that failed.
+                await self._ensure_user_deleted(job.target_id)
+            while True:
+                deleted, job.checkpoint = await self._delete_page(job)
+                job.processed += len(deleted)
+                if self.availability_index:
+                    for booking in deleted:
+                        self.availability_index.remove(booking)
+                if not job.checkpoint:
+                    break
+                await self.job_repo.save_progress(job, self.owner, self.lease_seconds)
+            job.status = "completed"
+        except ConflictError:
+            logger.warning("Lost the lease on job %s", job.id)
+            return job
+        except asyncio.CancelledError:
+            try:
+                await self.job_repo.release(job.id, self.owner)
+            except Exception:
+                logger.warning("Could not release job %s", job.id, exc_info=True)
+            raise
+        except Exception as e:
+            logger.exception("Job %s failed", job.id)
+            job.status = "failed"
+            job.error = str(e)
+
+        await self.job_repo.save_progress(job, self.owner, self.lease_seconds)
+        return job
+
+    async def _sweep(self) -> None:
+        while True:
+            try:
+                await self.resume_unfinished()
+            except Exception:
+                logger.warning("Could not resume background jobs", exc_info=True)
+            await asyncio.sleep(self.lease_seconds)
+
+    async def _delete_page(self, job: Job) -> Tuple[List[Booking], Optional[str]]:
+        for attempt in range(self.page_attempts):
+            try:
+                return await self.booking_repo.delete_by_user_id_page(
+                    job.target_id, job.checkpoint, self.page_size
+                )
+            except Exception:
+                if attempt + 1 == self.page_attempts:
+                    raise
+                logger.warning("Retrying page of job %s", job.id, exc_info=True)
+                await asyncio.sleep(random.uniform(0, 0.5 * 2**attempt))
+
+    async def _ensure_user_deleted(self, user_id: str) -> None:
+        try:
+            # Consistent, so a deletion made just before does not look undone.
+            await self.user_repo.get_by_id(user_id, consistent_read=True)
+        except NotFoundError:
+            return
+        raise InvalidInputError("User still exists")
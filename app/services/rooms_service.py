@@ -1,15 +1,26 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+import asyncio
 import uuid
 import time
-from app.models.models import Room
+from app.models.models import Room, Page, RoomAvailability, TimeSlot, Watermark
 from app.repositories.rooms_repo import RoomRepository
-from app.utils.errors import InvalidInputError, NotFoundError, ConflictError
+from app.utils.availability_index import AvailabilityIndex
+from app.utils.errors import (
+    InvalidInputError,
+    NotFoundError,
+    InternalError,
+)
 
 
 class RoomService:
 
-    def __init__(self, room_repository: RoomRepository) -> None:
+    def __init__(
+        self,
+        room_repository: RoomRepository,
+        availability_index: Optional[AvailabilityIndex] = None,
+    ) -> None:
         self.room_repo: RoomRepository = room_repository
+        self.availability_index: Optional[AvailabilityIndex] = availability_index
 
     async def add_room(self, room: Room) -> None:
         if not room:
@@ -33,21 +44,33 @@ class RoomService:
         if not room.amenities:
             room.amenities = []
 
-        exists: bool = await self.room_repo.check_room_number_exists_on_floor(
-            room.room_number, room.floor
-        )
-        if exists:
-            raise ConflictError("Room number already exists on this floor")
-
         room.id = str(uuid.uuid4())
         room.created_at = int(time.time())
         room.updated_at = int(time.time())
 
+        # The repository rejects a duplicate number on the floor atomically.
         await self.room_repo.create(room)
 
-    async def get_all_rooms(self) -> List[Room]:
-        rooms: List[Room] = await self.room_repo.get_all()
-        return rooms if rooms else []
+    async def get_all_rooms(
+        self,
+        limit: Optional[int] = None,
+        next_token: Optional[str] = None,
+        floor: Optional[int] = None,
+        min_capacity: Optional[int] = None,
+        status: Optional[str] = None,
+        amenities: Optional[List[str]] = None,
+    ) -> Page[Room]:
+        return await self.room_repo.get_all_page(
+            limit,
+            next_token,
+            floor=floor,
+            min_capacity=min_capacity,
+            status=status,
+            amenities=amenities,
+        )
+
+    async def get_rooms_watermark(self) -> Watermark:
+        return await self.room_repo.get_watermark()
 
     async def get_room_by_id(self, room_id: str) -> Room:
         if not room_id:
@@ -62,7 +85,9 @@ class RoomService:
         if not room_id:
             raise InvalidInputError("Room ID is required")
 
-        room: Room = await self.room_repo.get_by_id(room_id)
+        # The whole item is written back, so it must not come from a cache
+        # that another instance's writes have not invalidated.
+        room: Room = await self.room_repo.get_by_id(room_id, consistent_read=True)
 
         if update_data.name:
             room.name = update_data.name.strip()
@@ -90,26 +115,105 @@ class RoomService:
             raise InvalidInputError("Room ID is required")
         await self.room_repo.delete_by_id(room_id)
 
-    # def check_availability(
-    #     self, room_id: str, start_time: int, end_time: int
-    # ) -> Tuple[bool, List[Booking]]:
-    #     if not room_id:
-    #         raise InvalidInputError("Room ID is required")
-
-    #     room = self.room_repo.get_by_id(room_id)
-    #     if not room:
-    #         raise NotFoundError("Room not found")
-
-    #     return True, []
-
-    # def get_available_slots(
-    #     self, room_id: str, date: int, slot_duration: int
-    # ) -> List[TimeSlot]:
-    #     if not room_id or slot_duration <= 0:
-    #         raise InvalidInputError("Invalid input")
+    async def check_availability(
+        self, room_id: str, start_time: int, end_time: int
+    ) -> bool:
+        if not room_id or start_time >= end_time:
+            raise InvalidInputError("Invalid input")
+
+        await self.room_repo.get_by_id(room_id)
+        view = await self._require_index().prepare(start_time, end_time)
+        return view.is_free(room_id, start_time, end_time)
+
+    async def get_available_slots(
+        self, room_id: str, date: int, slot_duration: int
+    ) -> List[TimeSlot]:
+        if not room_id or slot_duration <= 0:
+            raise InvalidInputError("Invalid input")
+
+        await self.room_repo.get_by_id(room_id)
+        start_of_day = (date // 86400) * 86400
+        view = await self._require_index().prepare(start_of_day, start_of_day + 86400)
+        return self._time_slots(
+            view.free_windows(
+                room_id, start_of_day, start_of_day + 86400, slot_duration
+            )
+        )
 
-    #     room = self.room_repo.get_by_id(room_id)
-    #     if not room:
-    #         raise NotFoundError("Room not found")
+    async def search_available_rooms(
+        self,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        date: Optional[int] = None,
+        duration: Optional[int] = None,
+        min_capacity: Optional[int] = None,
+        floor: Optional[int] = None,
+        amenities: Optional[List[str]] = None,
+    ) -> List[RoomAvailability]:
+        """Rooms matching the filters that are free for the requested time.
+
+        Either the whole [start_time, end_time) window must be free, or the
+        room needs a free gap of ``duration`` seconds somewhere on ``date``.
+        """
+        if start_time is not None and end_time is not None:
+            if start_time >= end_time:
+                raise InvalidInputError("start_time must be before end_time")
+            window_start, window_end, min_duration = start_time, end_time, None
+        elif date is not None and duration:
+            if duration <= 0 or duration > 86400:
+                raise InvalidInputError("Invalid duration")
+            window_start = (date // 86400) * 86400
+            window_end, min_duration = window_start + 86400, duration
+        else:
+            raise InvalidInputError(
+                "Provide start_time and end_time, or date and duration"
+            )
+
+        index = self._require_index()
+        index.check_window(window_start, window_end)
+        rooms, view = await asyncio.gather(
+            (
+                self.room_repo.get_by_floor(floor)
+                if floor is not None
+                else self.room_repo.get_all()
+            ),
+            index.prepare(window_start, window_end),
+        )
 
-    #     return []
+        wanted = set(amenities or [])
+        results: List[RoomAvailability] = []
+        for room in rooms:
+            if room.status.lower() != "available":
+                continue
+            if min_capacity is not None and room.capacity < min_capacity:
+                continue
+            if floor is not None and room.floor != floor:
+                continue
+            if not wanted.issubset(room.amenities):
+                continue
+
+            if min_duration is None:
+                if not view.is_free(room.id, window_start, window_end):
+                    continue
+                windows = [(window_start, window_end)]
+            else:
+                windows = view.free_windows(
+                    room.id, window_start, window_end, min_duration
+                )
+                if not windows:
+                    continue
+            results.append(
+                RoomAvailability(room=room, free_slots=self._time_slots(windows))
+            )
+        return results
+
+    def _require_index(self) -> AvailabilityIndex:
+        if self.availability_index is None:
+            raise InternalError("Availability search is not configured")
+        return self.availability_index
+
+    def _time_slots(self, windows: List[Tuple[int, int]]) -> List[TimeSlot]:
+        return [
+            TimeSlot(start_time=start, end_time=end, duration=end - start)
+            for start, end in windows
+        ]
@@ -1,12 +1,12 @@
-from typing import List, Optional
+from typing import Optional
 import uuid
 import time
-from app.models.models import User
+from app.models.models import Job, User, Page
 from app.repositories.users_repo import UserRepository
 from app.repositories.bookings_repo import BookingRepository
+from app.services.jobs_service import JobService
 from app.utils.errors import InvalidInputError, NotFoundError, ConflictError
-from app.utils import password_utils
-from app.config.config import settings
+from app.utils.password_utils import PasswordHasher
 
 
 class UserService:
@@ -15,9 +15,13 @@ class UserService:
         self,
         user_repository: UserRepository,
         booking_repository: BookingRepository = None,
+        password_hasher: Optional[PasswordHasher] = None,
+        job_service: Optional[JobService] = None,
     ) -> None:
         self.user_repo: UserRepository = user_repository
         self.booking_repo: BookingRepository = booking_repository
+        self.password_hasher: PasswordHasher = password_hasher or PasswordHasher()
+        self.job_service: Optional[JobService] = job_service
 
     async def register(self, user: User) -> None:
         if not user:
@@ -38,7 +42,7 @@ class UserService:
         except NotFoundError:
             pass
 
-        hashed: str = password_utils.hash_password(user.password)
+        hashed: str = await self.password_hasher.hash(user.password)
         user.id = str(uuid.uuid4())
         user.password = hashed
         user.created_at = int(time.time())
@@ -46,11 +50,13 @@ class UserService:
 
         await self.user_repo.create(user)
 
-    async def get_all_users(self) -> List[User]:
-        users: List[User] = await self.user_repo.get_all()
-        if not users:
+    async def get_all_users(
+        self, limit: Optional[int] = None, next_token: Optional[str] = None
+    ) -> Page[User]:
+        page: Page[User] = await self.user_repo.get_all_page(limit, next_token)
+        if not page.items and not next_token:
             raise NotFoundError("No users found")
-        return users
+        return page
 
     async def get_user_by_id(self, user_id: str) -> User:
         if not user_id or len(user_id) < 10:
@@ -61,7 +67,9 @@ class UserService:
         if not user_id:
             raise InvalidInputError("User ID is required")
 
-        user: User = await self.user_repo.get_by_id(user_id)
+        # The whole item is written back, so it must not come from a cache
+        # that another instance's writes have not invalidated.
+        user: User = await self.user_repo.get_by_id(user_id, consistent_read=True)
         old_email = user.email
 
         if update_data.email and update_data.email != user.email:
@@ -84,19 +92,34 @@ class UserService:
 
     async def delete_user_by_id(
         self, user_id: str, current_user_id: Optional[str] = None
-    ) -> None:
+    ) -> Optional[Job]:
+        """Delete the user; with a job service their bookings go in the background.
+
+        Returns the cascade job, or None when bookings were deleted inline.
+        """
         if not user_id:
             raise InvalidInputError("User ID is required")
 
         if current_user_id and user_id == current_user_id:
             raise InvalidInputError("You cannot delete your own account")
 
-        user_to_delete: User = await self.user_repo.get_by_id(user_id)
+        # Raises NotFoundError before a job is created for an unknown user.
+        await self.user_repo.get_by_id(user_id)
 
-        # if user_to_delete.email.lower() in settings.SUPERADMIN_EMAILS:
-        #     raise InvalidInputError("Superadmin accounts cannot be deleted")
+        if self.job_service:
+            # The job is recorded before the user goes, so a crash in between
+            # leaves a job to resume rather than orphaned bookings.
+            job: Job = await self.job_service.create_user_bookings_deletion(user_id)
+            try:
+                await self.user_repo.delete_by_id(user_id)
+            except Exception as e:
+                await self.job_service.abandon(job, str(e))
+                raise
+            self.job_service.start(job)
+            return job
 
         if self.booking_repo:
             await self.booking_repo.delete_by_user_id(user_id)
 
         await self.user_repo.delete_by_id(user_id)
+        return None
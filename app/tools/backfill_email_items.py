@@ -0,0 +1,74 @@
+"""
+Copy user attributes onto email lookup items written before they carried them.
+
+Login resolves a user from the email item alone once it holds the password
+hash, role and name. Email items that point at a different user are reported
+as mismatches and left untouched:
+
+    python -m app.tools.backfill_email_items
+"""
+
+import argparse
+from typing import Any, Dict
+
+import boto3
+from boto3.dynamodb.conditions import Key
+
+from app.config.config import settings
+from app.utils.partition_keys import partition_key, partition_keys
+
+USER_ATTRIBUTES = ("ID", "Name", "Email", "Password", "Role", "CreatedAt", "UpdatedAt")
+
+
+def backfill(table: Any, shard_count: int) -> Dict[str, int]:
+    client = table.meta.client
+    stats = {"users": 0, "written": 0, "mismatches": 0}
+
+    for pk in partition_keys("USER", shard_count):
+        query_kwargs: Dict[str, Any] = {
+            "KeyConditionExpression": Key("PK").eq(pk) & Key("SK").begins_with("USER#")
+        }
+        while True:
+            response = table.query(**query_kwargs)
+            for item in response.get("Items", []):
+                stats["users"] += 1
+                email = item["Email"]
+                try:
+                    table.put_item(
+                        Item={
+                            "PK": partition_key("USER", email, shard_count),
+                            "SK": email,
+                            **{name: item[name] for name in USER_ATTRIBUTES},
+                        },
+                        ConditionExpression="attribute_not_exists(PK) OR ID = :id",
+                        ExpressionAttributeValues={":id": item["ID"]},
+                    )
+                    stats["written"] += 1
+                except client.exceptions.ConditionalCheckFailedException:
+                    stats["mismatches"] += 1
+                    print(f"email {email} of user {item['ID']} points at another user")
+
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                break
+            query_kwargs["ExclusiveStartKey"] = last_key
+
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--table", default=settings.DYNAMODB_TABLE_NAME)
+    args = parser.parse_args()
+
+    table = boto3.resource("dynamodb", region_name=settings.AWS_REGION).Table(
+        args.table
+    )
+    stats = backfill(table, settings.PARTITION_SHARD_COUNT)
+    print(
+        f"users={stats['users']} written={stats['written']} mismatches={stats['mismatches']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
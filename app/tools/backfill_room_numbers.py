@@ -0,0 +1,72 @@
+"""
+Write room-number uniqueness items for rooms created before they existed.
+
+Rooms whose floor and number are already claimed by a different room are
+reported as duplicates and left untouched, so they can be renumbered by
+hand:
+
+    python -m app.tools.backfill_room_numbers
+"""
+
+import argparse
+from typing import Any, Dict
+
+import boto3
+from boto3.dynamodb.conditions import Key
+
+from app.config.config import settings
+from app.utils.partition_keys import partition_keys
+
+
+def backfill(table: Any, shard_count: int) -> Dict[str, int]:
+    client = table.meta.client
+    stats = {"rooms": 0, "written": 0, "duplicates": 0}
+
+    for pk in partition_keys("ROOM", shard_count):
+        query_kwargs: Dict[str, Any] = {"KeyConditionExpression": Key("PK").eq(pk)}
+        while True:
+            response = table.query(**query_kwargs)
+            for item in response.get("Items", []):
+                stats["rooms"] += 1
+                try:
+                    table.put_item(
+                        Item={
+                            "PK": f"ROOMNUM#{int(item['Floor'])}#{int(item['RoomNumber'])}",
+                            "SK": "ROOMNUM",
+                            "RoomID": item["ID"],
+                        },
+                        ConditionExpression="attribute_not_exists(PK) OR RoomID = :id",
+                        ExpressionAttributeValues={":id": item["ID"]},
+                    )
+                    stats["written"] += 1
+                except client.exceptions.ConditionalCheckFailedException:
+                    stats["duplicates"] += 1
+                    print(
+                        f"room {item['ID']} duplicates number {item['RoomNumber']} "
+                        f"on floor {item['Floor']}"
+                    )
+
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                break
+            query_kwargs["ExclusiveStartKey"] = last_key
+
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--table", default=settings.DYNAMODB_TABLE_NAME)
+    args = parser.parse_args()
+
+    table = boto3.resource("dynamodb", region_name=settings.AWS_REGION).Table(
+        args.table
+    )
+    stats = backfill(table, settings.PARTITION_SHARD_COUNT)
+    print(
+        f"rooms={stats['rooms']} written={stats['written']} duplicates={stats['duplicates']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Write slot-lock items for bookings created before slot locking existed.
+
+Bookings whose slots are already locked by a different booking are reported
+as overlaps and left untouched:
+
+    python -m app.tools.backfill_slot_locks
+"""
+
+import argparse
+from typing import Any, Dict
+
+import boto3
+from boto3.dynamodb.conditions import Key
+
+from app.config.config import settings
+from app.utils.partition_keys import partition_keys
+from app.utils.time_utils import slot_buckets
+
+
+def backfill(table: Any, shard_count: int, slot_seconds: int) -> Dict[str, int]:
+    client = table.meta.client
+    stats = {"bookings": 0, "locks": 0, "overlaps": 0}
+
+    for pk in partition_keys("BOOKING", shard_count):
+        query_kwargs: Dict[str, Any] = {"KeyConditionExpression": Key("PK").eq(pk)}
+        while True:
+            response = table.query(**query_kwargs)
+            for item in response.get("Items", []):
+                stats["bookings"] += 1
+                for bucket in slot_buckets(
+                    int(item["StartTime"]), int(item["EndTime"]), slot_seconds
+                ):
+                    try:
+                        table.put_item(
+                            Item={
+                                "PK": f"ROOM#{item['RoomID']}#SLOT#{bucket}",
+                                "SK": "SLOT",
+                                "BookingID": item["ID"],
+                                "ExpiresAt": int(item["EndTime"]) + 86400,
+                            },
+                            ConditionExpression="attribute_not_exists(PK) OR BookingID = :id",
+                            ExpressionAttributeValues={":id": item["ID"]},
+                        )
+                        stats["locks"] += 1
+                    except client.exceptions.ConditionalCheckFailedException:
+                        stats["overlaps"] += 1
+                        print(f"booking {item['ID']} overlaps slot {bucket}")
+
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                break
+            query_kwargs["ExclusiveStartKey"] = last_key
+
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--table", default=settings.DYNAMODB_TABLE_NAME)
+    args = parser.parse_args()
+
+    table = boto3.resource("dynamodb", region_name=settings.AWS_REGION).Table(
+        args.table
+    )
+    stats = backfill(
+        table, settings.PARTITION_SHARD_COUNT, settings.BOOKING_SLOT_MINUTES * 60
+    )
+    print(
+        f"bookings={stats['bookings']} locks={stats['locks']} overlaps={stats['overlaps']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Rewrite BOOKING, ROOM and USER items into a different partition shard layout.
+
+Run with the application stopped (or in read-only mode), then deploy with
+PARTITION_SHARD_COUNT set to the new value:
+
+    python -m app.tools.migrate_partition_keys --from-shards 1 --to-shards 8
+"""
+
+import argparse
+from typing import Any, Dict
+
+import boto3
+from boto3.dynamodb.conditions import Key
+
+from app.config.config import settings
+from app.utils.partition_keys import partition_key, partition_keys
+
+COLLECTIONS = ("BOOKING", "ROOM", "USER")
+
+
+def _shard_value(collection: str, sort_key: str) -> str:
+    prefix = f"{collection}#"
+    if sort_key.startswith(prefix):
+        return sort_key[len(prefix) :]
+    # USER email lookup items are keyed by the bare email address.
+    return sort_key
+
+
+def migrate_collection(
+    table: Any,
+    collection: str,
+    from_shards: int,
+    to_shards: int,
+    dry_run: bool = False,
+    keep_source: bool = False,
+) -> Dict[str, int]:
+    stats = {"scanned": 0, "moved": 0}
+
+    with table.batch_writer() as writer:
+        for source_pk in partition_keys(collection, from_shards):
+            query_kwargs: Dict[str, Any] = {
+                "KeyConditionExpression": Key("PK").eq(source_pk)
+            }
+            while True:
+                response = table.query(**query_kwargs)
+                for item in response.get("Items", []):
+                    stats["scanned"] += 1
+                    target_pk = partition_key(
+                        collection, _shard_value(collection, item["SK"]), to_shards
+                    )
+                    if target_pk == item["PK"]:
+                        continue
+                    stats["moved"] += 1
+                    if dry_run:
+                        continue
+                    writer.put_item(Item={**item, "PK": target_pk})
+                    if not keep_source:
+                        writer.delete_item(Key={"PK": item["PK"], "SK": item["SK"]})
+
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key:
+                    break
+                query_kwargs["ExclusiveStartKey"] = last_key
+
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--from-shards", type=int, default=1)
+    parser.add_argument("--to-shards", type=int, required=True)
+    parser.add_argument("--table", default=settings.DYNAMODB_TABLE_NAME)
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument(
+        "--keep-source",
+        action="store_true",
+        help="copy items without deleting them from their old partition",
+    )
+    args = parser.parse_args()
+
+    table = boto3.resource("dynamodb", region_name=settings.AWS_REGION).Table(
+        args.table
+    )
+    for collection in COLLECTIONS:
+        stats = migrate_collection(
+            table,
+            collection,
+            args.from_shards,
+            args.to_shards,
+            dry_run=args.dry_run,
+            keep_source=args.keep_source,
+        )
+        print(f"{collection}: scanned={stats['scanned']} moved={stats['moved']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Regenerate room-day schedule documents from the booking items.
+
+The version of every existing document is recorded (with one scan of
+the table) before any booking is read, and a document is replaced only
+if its version has not moved since. Every booking write bumps the
+version of the documents it touches, so a document that raced with the
+rebuild is left alone and reported as a conflict; running the tool again
+rebuilds it. ``--prune`` also clears documents whose room-day no longer
+has any booking:
+
+    python -m app.tools.rebuild_room_days [--prune]
+"""
+
+import argparse
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from boto3.dynamodb.conditions import Attr, Key
+
+from app.config.config import settings
+from app.models.models import Booking
+from app.utils.partition_keys import partition_key, partition_keys
+from app.utils.watermarks import (
+    days_between,
+    room_day_key,
+    schedule_slot,
+    schedule_slot_attribute,
+)
+
+
+def rebuild(table: Any, shard_count: int, prune: bool = False) -> Dict[str, int]:
+    stats = {"bookings": 0, "documents": 0, "pruned": 0, "conflicts": 0}
+    documents: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    user_names: Dict[str, str] = {}
+    # Read first: a booking written after this point moves the version.
+    versions = _room_day_versions(table)
+
+    for pk in partition_keys("BOOKING", shard_count):
+        query_kwargs: Dict[str, Any] = {
+            "KeyConditionExpression": Key("PK").eq(pk),
+            "ConsistentRead": True,
+        }
+        while True:
+            response = table.query(**query_kwargs)
+            for item in response.get("Items", []):
+                stats["bookings"] += 1
+                booking = Booking.model_construct(
+                    id=item["ID"],
+                    user_id=item["UserID"],
+                    user_name=item.get("UserName")
+                    or _user_name(table, shard_count, item["UserID"], user_names),
+                    room_id=item["RoomID"],
+                    start_time=int(item["StartTime"]),
+                    end_time=int(item["EndTime"]),
+                    purpose=item["Purpose"],
+                )
+                for day in days_between(booking.start_time, booking.end_time):
+                    documents.setdefault((booking.room_id, day), {})[
+                        schedule_slot_attribute(booking.id)
+                    ] = schedule_slot(booking)
+
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                break
+            query_kwargs["ExclusiveStartKey"] = last_key
+
+    if prune:
+        for room_id, day in versions:
+            if (room_id, day) not in documents:
+                documents[(room_id, day)] = {}
+                stats["pruned"] += 1
+
+    for (room_id, day), slots in documents.items():
+        if _replace(
+            table, room_day_key(room_id, day), slots, versions.get((room_id, day))
+        ):
+            stats["documents"] += 1
+        else:
+            stats["conflicts"] += 1
+            print(f"room {room_id} day {day} changed during the rebuild")
+
+    return stats
+
+
+def _replace(
+    table: Any, key: Dict[str, str], slots: Dict[str, Any], version: Optional[int]
+) -> bool:
+    """Write ``slots`` to ``key`` if the document is still at ``version``.
+
+    ``None`` means the document did not exist when versions were recorded.
+    """
+    client = table.meta.client
+    condition: Dict[str, Any] = (
+        {
+            "ConditionExpression": "Version = :version",
+            "ExpressionAttributeValues": {":version": version},
+        }
+        if version is not None
+        else {"ConditionExpression": "attribute_not_exists(PK)"}
+    )
+    try:
+        table.put_item(
+            Item={
+                **key,
+                **slots,
+                "Version": (version or 0) + 1,
+                "UpdatedAt": int(time.time()),
+            },
+            **condition,
+        )
+        return True
+    except client.exceptions.ConditionalCheckFailedException:
+        return False
+
+
+def _room_day_versions(table: Any) -> Dict[Tuple[str, int], int]:
+    versions: Dict[Tuple[str, int], int] = {}
+    scan_kwargs: Dict[str, Any] = {
+        "FilterExpression": Attr("PK").begins_with("ROOMDAY#"),
+        "ProjectionExpression": "PK, Version",
+        "ConsistentRead": True,
+    }
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            _, room_id, day = item["PK"].rsplit("#", 2)
+            versions[(room_id, int(day))] = int(item.get("Version", 0))
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            break
+        scan_kwargs["ExclusiveStartKey"] = last_key
+    return versions
+
+
+def _user_name(
+    table: Any, shard_count: int, user_id: str, cache: Dict[str, str]
+) -> str:
+    if user_id not in cache:
+        item = table.get_item(
+            Key={
+                "PK": partition_key("USER", user_id, shard_count),
+                "SK": f"USER#{user_id}",
+            }
+        ).get("Item")
+        cache[user_id] = item["Name"] if item else ""
+    return cache[user_id]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--table", default=settings.DYNAMODB_TABLE_NAME)
+    parser.add_argument("--prune", action="store_true")
+    args = parser.parse_args()
+
+    table = boto3.resource("dynamodb", region_name=settings.AWS_REGION).Table(
+        args.table
+    )
+    stats = rebuild(table, settings.PARTITION_SHARD_COUNT, prune=args.prune)
+    print(
+        f"bookings={stats['bookings']} documents={stats['documents']} "
+        f"pruned={stats['pruned']} conflicts={stats['conflicts']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import asyncio
+import bisect
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.models.models import Booking
+from app.utils.errors import InvalidInputError
+from app.utils.watermarks import DAY_SECONDS, days_between
+
+Interval = Tuple[int, int, str]
+BookingLoader = Callable[[int, int], Awaitable[List[Booking]]]
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # Loads nobody waits for any more must not log "never retrieved".
+    if not task.cancelled():
+        task.exception()
+
+
+class _Day:
+
+    def __init__(self) -> None:
+        self.loaded_at: float = time.monotonic()
+        self.rooms: Dict[str, List[Interval]] = {}
+
+    def add(self, interval: Interval, room_id: str) -> None:
+        intervals = self.rooms.setdefault(room_id, [])
+        if interval not in intervals:
+            bisect.insort(intervals, interval)
+
+    def remove(self, interval: Interval, room_id: str) -> None:
+        intervals = self.rooms.get(room_id, [])
+        if interval in intervals:
+            intervals.remove(interval)
+
+
+class AvailabilityView:
+    """The days of one search, pinned for as long as the search holds them.
+
+    Days stay shared with the index, so bookings written meanwhile still
+    show up, but evicting them from the index does not affect the view.
+    """
+
+    def __init__(self, days: Dict[int, _Day]) -> None:
+        self._days: Dict[int, _Day] = days
+
+    def busy_intervals(
+        self, room_id: str, start: int, end: int
+    ) -> List[Tuple[int, int]]:
+        """Bookings of ``room_id`` overlapping [start, end), from the view's days."""
+        seen: Dict[str, Tuple[int, int]] = {}
+        for day in days_between(start, end):
+            entry = self._days.get(day)
+            if entry is None:
+                raise InvalidInputError("Requested time is outside the search window")
+            intervals = entry.rooms.get(room_id, [])
+            # Intervals of one room never overlap, so ends are sorted too.
+            i = bisect.bisect_right([iv[1] for iv in intervals], start)
+            while i < len(intervals) and intervals[i][0] < end:
+                booking_start, booking_end, booking_id = intervals[i]
+                seen[booking_id] = (booking_start, booking_end)
+                i += 1
+        return sorted(seen.values())
+
+    def is_free(self, room_id: str, start: int, end: int) -> bool:
+        return not self.busy_intervals(room_id, start, end)
+
+    def free_windows(
+        self, room_id: str, start: int, end: int, min_duration: int = 1
+    ) -> List[Tuple[int, int]]:
+        """Maximal free gaps in [start, end) that last at least ``min_duration``."""
+        windows = []
+        cursor = start
+        for booking_start, booking_end in self.busy_intervals(room_id, start, end):
+            if booking_start - cursor >= min_duration:
+                windows.append((cursor, booking_start))
+            cursor = max(cursor, booking_end)
+        if end - cursor >= min_duration:
+            windows.append((cursor, end))
+        return windows
+
+
+class AvailabilityIndex:
+    """Per-room, per-day sorted booking intervals for free-slot search.
+
+    A day is loaded with one DateIndex read covering every room, kept for
+    ``ttl_seconds`` and patched in place as bookings are created or
+    cancelled, so searches never query DynamoDB per room. Days touched by
+    writes from other instances converge when their TTL expires.
+    """
+
+    def __init__(
+        self,
+        load_bookings: BookingLoader,
+        ttl_seconds: float = 60.0,
+        max_days: int = 32,
+    ) -> None:
+        self._load_bookings = load_bookings
+        self.ttl_seconds: float = ttl_seconds
+        self.max_days: int = max_days
+        self._days: "OrderedDict[int, _Day]" = OrderedDict()
+        self._loading: Dict[int, asyncio.Task] = {}
+        # Writes that land while a day is loading are replayed onto the result.
+        self._journal: Dict[int, List[Tuple[str, Booking]]] = {}
+        self.loads: int = 0
+
+    async def prepare(self, start: int, end: int) -> AvailabilityView:
+        """Load every day overlapping [start, end) and pin them in a view.
+
+        Windows longer than the index holds are rejected, since their first
+        days would be evicted by the last ones.
+        """
+        self.check_window(start, end)
+        days = days_between(start, end)
+        entries = await asyncio.gather(*(self._ensure_day(day) for day in days))
+        return AvailabilityView(dict(zip(days, entries)))
+
+    def check_window(self, start: int, end: int) -> None:
+        if len(days_between(start, end)) > self.max_days:
+            raise InvalidInputError(
+                f"Time window cannot span more than {self.max_days} days"
+            )
+
+    def add(self, booking: Booking) -> None:
+        self._apply("add", booking)
+
+    def remove(self, booking: Booking) -> None:
+        self._apply("remove", booking)
+
+    def clear(self) -> None:
+        self._days.clear()
+
+    def _apply(self, op: str, booking: Booking) -> None:
+        interval = (booking.start_time, booking.end_time, booking.id)
+        for day in days_between(booking.start_time, booking.end_time):
+            if day in self._journal:
+                self._journal[day].append((op, booking))
+            entry = self._days.get(day)
+            if entry is not None:
+                getattr(entry, op)(interval, booking.room_id)
+
+    async def _ensure_day(self, day: int) -> _Day:
+        entry = self._days.get(day)
+        if (
+            entry is not None
+            and time.monotonic() - entry.loaded_at < self.ttl_seconds
+        ):
+            self._days.move_to_end(day)
+            return entry
+
+        pending: Optional[asyncio.Task] = self._loading.get(day)
+        if pending is None:
+            # The load runs in its own task, so a cancelled caller (a client
+            # that disconnected) does not cancel it for the other waiters.
+            pending = asyncio.create_task(self._load_day(day))
+            pending.add_done_callback(_retrieve_exception)
+            self._loading[day] = pending
+            self._journal[day] = []
+        return await asyncio.shield(pending)
+
+    async def _load_day(self, day: int) -> _Day:
+        try:
+            # Bookings are indexed by the day they start and last under a day,
+            # so the previous day's partition can spill into this one.
+            bookings = await self._load_bookings(day - DAY_SECONDS, day)
+            self.loads += 1
+            fresh = _Day()
+            for booking in bookings:
+                if booking.start_time < day + DAY_SECONDS and booking.end_time > day:
+                    fresh.add(
+                        (booking.start_time, booking.end_time, booking.id),
+                        booking.room_id,
+                    )
+            for op, booking in self._journal[day]:
+                getattr(fresh, op)(
+                    (booking.start_time, booking.end_time, booking.id), booking.room_id
+                )
+            self._days[day] = fresh
+            self._days.move_to_end(day)
+            while len(self._days) > self.max_days:
+                self._days.popitem(last=False)
+            return fresh
+        finally:
+            del self._loading[day]
+            del self._journal[day]
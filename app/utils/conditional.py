@@ -0,0 +1,55 @@
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag for a representation identified by ``parts``."""
+    digest = hashlib.sha256(":".join(str(part) for part in parts).encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def not_modified(
+    request: Request, etag: str, last_modified: Optional[int] = None
+) -> Optional[Response]:
+    """A bodiless 304 if the client's copy is current, otherwise None.
+
+    ``If-None-Match`` wins over ``If-Modified-Since`` when both are sent
+    (RFC 9110, section 13.2.2).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        fresh = "*" in candidates or etag in candidates
+    else:
+        fresh = _not_modified_since(
+            request.headers.get("if-modified-since"), last_modified
+        )
+    if not fresh:
+        return None
+    response = Response(status_code=304)
+    set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(
+    response: Response, etag: str, last_modified: Optional[int] = None
+) -> Response:
+    response.headers["ETag"] = etag
+    if last_modified:
+        response.headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+    return response
+
+
+def _not_modified_since(header: Optional[str], last_modified: Optional[int]) -> bool:
+    if not header or not last_modified:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return last_modified <= since.timestamp()
@@ -0,0 +1,97 @@
+import asyncio
+import random
+from typing import Any, Dict, List
+from app.utils.dynamo_executor import DynamoExecutor
+from app.utils.errors import ServiceUnavailableError
+
+BATCH_GET_MAX_KEYS = 100
+BATCH_WRITE_MAX_ITEMS = 25
+
+
+async def batch_get_items(
+    executor: DynamoExecutor,
+    dynamodb: Any,
+    table_name: str,
+    keys: List[Dict[str, Any]],
+    consistent_read: bool = False,
+    max_concurrency: int = 8,
+    max_attempts: int = 8,
+    base_delay: float = 0.05,
+) -> List[Dict[str, Any]]:
+    """Fetch ``keys`` with BatchGetItem, one concurrent request per 100 keys.
+
+    ``UnprocessedKeys`` are re-requested with jittered exponential backoff; a
+    chunk still throttled after ``max_attempts`` raises
+    ServiceUnavailableError. Reads are eventually consistent unless
+    ``consistent_read`` is set.
+    """
+    if not keys:
+        return []
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_chunk(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        items: List[Dict[str, Any]] = []
+        request: Dict[str, Any] = {
+            table_name: {"Keys": chunk, "ConsistentRead": consistent_read}
+        }
+        async with semaphore:
+            for attempt in range(max_attempts):
+                response = await executor.run(
+                    dynamodb.meta.client.batch_get_item, RequestItems=request
+                )
+                items.extend(response.get("Responses", {}).get(table_name, []))
+                request = response.get("UnprocessedKeys") or {}
+                if not request:
+                    return items
+                await asyncio.sleep(random.uniform(0, base_delay * 2**attempt))
+        raise ServiceUnavailableError("DynamoDB kept throttling a batch read")
+
+    chunks = [
+        keys[i : i + BATCH_GET_MAX_KEYS]
+        for i in range(0, len(keys), BATCH_GET_MAX_KEYS)
+    ]
+    results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+    return [item for items in results for item in items]
+
+
+async def batch_write_items(
+    executor: DynamoExecutor,
+    dynamodb: Any,
+    table_name: str,
+    requests: List[Dict[str, Any]],
+    max_concurrency: int = 8,
+    max_attempts: int = 8,
+    base_delay: float = 0.05,
+) -> None:
+    """Send ``requests`` (PutRequest/DeleteRequest entries) with BatchWriteItem.
+
+    Chunks of 25 run concurrently, at most ``max_concurrency`` at a time.
+    ``UnprocessedItems`` are resent with jittered exponential backoff; a chunk
+    that is still throttled after ``max_attempts`` raises
+    ServiceUnavailableError.
+    """
+    if not requests:
+        return
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def write_chunk(chunk: List[Dict[str, Any]]) -> None:
+        request: Dict[str, Any] = {table_name: chunk}
+        async with semaphore:
+            for attempt in range(max_attempts):
+                response = await executor.run(
+                    dynamodb.meta.client.batch_write_item, RequestItems=request
+                )
+                request = response.get("UnprocessedItems") or {}
+                if not request:
+                    return
+                await asyncio.sleep(random.uniform(0, base_delay * 2**attempt))
+        raise ServiceUnavailableError("DynamoDB kept throttling a batch write")
+
+    await asyncio.gather(
+        *(
+            write_chunk(requests[i : i + BATCH_WRITE_MAX_ITEMS])
+            for i in range(0, len(requests), BATCH_WRITE_MAX_ITEMS)
+        )
+    )
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+from app.utils.metrics import Metrics, repository_operation
+from app.utils.request_trace import RequestTrace, current_trace
+
+
+class DynamoExecutor:
+    """Runs blocking boto3 calls on a dedicated thread pool.
+
+    Keeps DynamoDB calls from competing with other ``to_thread`` work on the
+    default executor and tracks how many calls are queued versus running.
+    Without ``max_workers`` the event loop's default executor is used.
+    Coroutine functions (the native async backend) are awaited directly.
+    With ``metrics``, or while a request trace is active, every call asks
+    DynamoDB for its consumed capacity and records it.
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, metrics: Optional[Metrics] = None
+    ) -> None:
+        self.max_workers: Optional[int] = max_workers
+        self.metrics: Optional[Metrics] = metrics
+        self._executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dynamodb")
+            if max_workers
+            else None
+        )
+        self._lock = threading.Lock()
+        self.submitted: int = 0
+        self.in_flight: int = 0
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        trace: Optional[RequestTrace] = current_trace.get()
+        if self.metrics is None and trace is None:
+            return await self._run(fn, *args, **kwargs)
+
+        kwargs.setdefault("ReturnConsumedCapacity", "TOTAL")
+        start = time.perf_counter()
+        response = await self._run(fn, *args, **kwargs)
+        if self.metrics is not None and isinstance(response, dict):
+            self.metrics.record_consumed_capacity(response.get("ConsumedCapacity"))
+        if trace is not None:
+            trace.record(
+                getattr(fn, "__name__", "call"),
+                kwargs,
+                response,
+                time.perf_counter() - start,
+                *(repository_operation.get() or ()),
+            )
+        return response
+
+    async def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if asyncio.iscoroutinefunction(fn):
+            with self._lock:
+                self.in_flight += 1
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+
+        loop = asyncio.get_running_loop()
+        self.submitted += 1
+        try:
+            return await loop.run_in_executor(
+                self._executor, partial(self._call, fn, *args, **kwargs)
+            )
+        finally:
+            self.submitted -= 1
+
+    def _call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            self.in_flight += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self.submitted - self.in_flight, 0)
+
+    def shutdown(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=False)
@@ -24,3 +24,7 @@ class RoomUnavailableError(Exception):
 
 class TimeRangeInvalidError(Exception):
     pass
+
+
+class ServiceUnavailableError(Exception):
+    pass
@@ -13,6 +13,7 @@ from app.utils.errors import (
     InternalError,
     RoomUnavailableError,
     TimeRangeInvalidError,
+    ServiceUnavailableError,
 )
 
 
@@ -76,6 +77,17 @@ async def internal_error_exception_handler(request: Request, exc: InternalError)
     )
 
 
+async def service_unavailable_exception_handler(
+    request: Request, exc: ServiceUnavailableError
+):
+    """Handle ServiceUnavailableError exceptions."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle all unhandled exceptions."""
     return JSONResponse(
@@ -0,0 +1,218 @@
+import bisect
+import threading
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# The repository method on whose behalf DynamoDB is being called, so the
+# executor can attribute consumed capacity without threading it through.
+repository_operation: ContextVar[Optional[Tuple[str, str]]] = ContextVar(
+    "repository_operation", default=None
+)
+
+Samples = Iterable[Tuple[Tuple[str, ...], float]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name: str = name
+        self.help: str = help
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            lines.append(
+                f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            )
+        return lines
+
+
+class Histogram:
+    """Fixed-bucket histogram; an observation is one bisect and three adds."""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name: str = name
+        self.help: str = help
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self.buckets: Tuple[float, ...] = tuple(buckets)
+        # labels -> [per-bucket counts (last is +Inf), sum, count]
+        self._series: Dict[Tuple[str, ...], List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return series[2] if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted(
+                (labels, (list(s[0]), s[1], s[2])) for labels, s in self._series.items()
+            )
+        names = self.labelnames + ("le",)
+        for labels, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                lines.append(
+                    f"{self.name}_bucket"
+                    f"{_format_labels(names, labels + (_format_value(bound),))} {cumulative}"
+                )
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {total!r}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+class Collector:
+    """Samples read from live objects (pools, caches) at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        type: str,
+        labelnames: Sequence[str],
+        collect: Callable[[], Samples],
+    ) -> None:
+        self.name: str = name
+        self.help: str = help
+        self.type: str = type
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self.collect = collect
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        for labels, value in self.collect():
+            lines.append(
+                f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            )
+        return lines
+
+
+class Metrics:
+    """Application metrics rendered in the Prometheus text format.
+
+    Request, repository and bcrypt timings are recorded as they happen;
+    executor, cache and hasher state is read when ``/metrics`` is scraped.
+    """
+
+    def __init__(self) -> None:
+        self.request_seconds = Histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by route template.",
+            ("method", "route", "status"),
+        )
+        self.repository_seconds = Histogram(
+            "repository_call_duration_seconds",
+            "Latency of repository methods, including every DynamoDB call they make.",
+            ("repository", "method"),
+        )
+        self.consumed_capacity = Counter(
+            "dynamodb_consumed_capacity_units_total",
+            "DynamoDB capacity units reported by ReturnConsumedCapacity.",
+            ("repository", "method", "table"),
+        )
+        self.password_hash_seconds = Histogram(
+            "password_hash_duration_seconds",
+            "Time spent in bcrypt on the hashing pool.",
+            ("operation",),
+            buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+        )
+        self._collectors: List[Collector] = []
+
+    def collector(
+        self,
+        name: str,
+        help: str,
+        collect: Callable[[], Samples],
+        labelnames: Sequence[str] = (),
+        type: str = "gauge",
+    ) -> None:
+        self._collectors.append(Collector(name, help, type, labelnames, collect))
+
+    def record_consumed_capacity(self, consumed: Any) -> None:
+        if not consumed:
+            return
+        repository, method = repository_operation.get() or ("", "")
+        # Single-table operations return a dict; batches and transactions a list.
+        for entry in consumed if isinstance(consumed, list) else [consumed]:
+            self.consumed_capacity.inc(
+                float(entry.get("CapacityUnits", 0)),
+                repository,
+                method,
+                entry.get("TableName", ""),
+            )
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in (
+            self.request_seconds,
+            self.repository_seconds,
+            self.consumed_capacity,
+            self.password_hash_seconds,
+            *self._collectors,
+        ):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,129 @@
+import asyncio
+import base64
+import binascii
+import json
+from decimal import Decimal
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.utils.errors import InvalidInputError
+
+QueryFn = Callable[..., Awaitable[Dict[str, Any]]]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else str(value)
+    raise TypeError(f"Unsupported cursor value: {value!r}")
+
+
+def encode_next_token(last_evaluated_key: Optional[Dict[str, Any]]) -> Optional[str]:
+    if not last_evaluated_key:
+        return None
+    raw = json.dumps(last_evaluated_key, default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_next_token(next_token: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not next_token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(next_token.encode("ascii"))
+        key = json.loads(raw, parse_float=Decimal)
+    except (ValueError, binascii.Error, UnicodeError):
+        raise InvalidInputError("Invalid next_token")
+    if not isinstance(key, dict):
+        raise InvalidInputError("Invalid next_token")
+    return key
+
+
+async def iter_query_pages(
+    query: QueryFn,
+    exclusive_start_key: Optional[Dict[str, Any]] = None,
+    **query_kwargs: Any,
+) -> AsyncIterator[Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+    """Yield (items, last_evaluated_key) for every page DynamoDB returns."""
+    start_key = exclusive_start_key
+    while True:
+        kwargs = dict(query_kwargs)
+        if start_key:
+            kwargs["ExclusiveStartKey"] = start_key
+        response = await query(**kwargs)
+        start_key = response.get("LastEvaluatedKey")
+        yield response.get("Items", []), start_key
+        if not start_key:
+            return
+
+
+async def query_all(query: QueryFn, **query_kwargs: Any) -> List[Dict[str, Any]]:
+    items: List[Dict[str, Any]] = []
+    async for page, _ in iter_query_pages(query, **query_kwargs):
+        items.extend(page)
+    return items
+
+
+async def query_partitions_all(
+    query: QueryFn, partition_queries: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Run one query per partition concurrently and merge the results."""
+    if len(partition_queries) == 1:
+        return await query_all(query, **partition_queries[0])
+    results = await asyncio.gather(
+        *(query_all(query, **kwargs) for kwargs in partition_queries)
+    )
+    return [item for items in results for item in items]
+
+
+def _decode_cursor(
+    next_token: Optional[str], partition_count: int
+) -> Tuple[int, Optional[Dict[str, Any]]]:
+    cursor = decode_next_token(next_token)
+    if cursor is None:
+        return 0, None
+    partition = cursor.get("p")
+    start_key = cursor.get("k")
+    if (
+        not isinstance(partition, int)
+        or not 0 <= partition < partition_count
+        or (start_key is not None and not isinstance(start_key, dict))
+    ):
+        raise InvalidInputError("Invalid next_token")
+    return partition, start_key
+
+
+async def query_partitions_page(
+    query: QueryFn,
+    partition_queries: List[Dict[str, Any]],
+    limit: Optional[int] = None,
+    next_token: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Return up to ``limit`` items across partitions starting at ``next_token``.
+
+    Without a limit or a cursor every partition is read concurrently and in
+    full. Bounded pages walk the partitions in order, so the cursor only has
+    to remember one partition index and its LastEvaluatedKey.
+    """
+    if limit is not None and limit <= 0:
+        raise InvalidInputError("limit must be greater than zero")
+
+    if limit is None and not next_token:
+        return await query_partitions_all(query, partition_queries), None
+
+    partition, start_key = _decode_cursor(next_token, len(partition_queries))
+    items: List[Dict[str, Any]] = []
+    while partition < len(partition_queries):
+        kwargs = dict(partition_queries[partition])
+        if limit is not None:
+            kwargs["Limit"] = limit - len(items)
+        if start_key:
+            kwargs["ExclusiveStartKey"] = start_key
+        response = await query(**kwargs)
+        items.extend(response.get("Items", []))
+        start_key = response.get("LastEvaluatedKey")
+        if not start_key:
+            partition += 1
+        if limit is not None and len(items) >= limit:
+            break
+
+    if partition >= len(partition_queries):
+        return items, None
+    return items, encode_next_token({"p": partition, "k": start_key})
@@ -0,0 +1,18 @@
+import zlib
+from typing import List
+
+
+def shard_for(value: str, shard_count: int) -> int:
+    return zlib.crc32(value.encode("utf-8")) % shard_count
+
+
+def partition_key(collection: str, value: str, shard_count: int) -> str:
+    if shard_count <= 1:
+        return collection
+    return f"{collection}#{shard_for(value, shard_count)}"
+
+
+def partition_keys(collection: str, shard_count: int) -> List[str]:
+    if shard_count <= 1:
+        return [collection]
+    return [f"{collection}#{shard}" for shard in range(shard_count)]
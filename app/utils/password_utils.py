@@ -1,10 +1,17 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
 import bcrypt
+from app.utils.errors import ServiceUnavailableError
+from app.utils.metrics import Metrics
 
 
-def hash_password(password: str) -> str:
+def hash_password(password: str, rounds: int = 12) -> str:
     if not password:
         raise ValueError("Password cannot be empty")
-    salt: bytes = bcrypt.gensalt()
+    salt: bytes = bcrypt.gensalt(rounds=rounds)
     hashed: bytes = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed.decode("utf-8")
 
@@ -14,3 +21,71 @@ def verify_password(hashed: str, plain: str) -> bool:
         return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
     except Exception:
         return False
+
+
+def get_rounds(hashed: str) -> int:
+    # Modular crypt format: $2b$<cost>$<salt+hash>
+    try:
+        return int(hashed.split("$")[2])
+    except (IndexError, ValueError):
+        return 0
+
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated, bounded thread pool.
+
+    bcrypt holds a worker thread for tens of milliseconds per call, so it is
+    kept off the event loop and away from the default executor. Once
+    ``max_pending`` calls are queued or running, new calls fail fast with
+    ServiceUnavailableError instead of piling up behind a login spike.
+    """
+
+    def __init__(
+        self,
+        rounds: int = 12,
+        max_workers: int = 2,
+        max_pending: int = 64,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
+        self.rounds: int = rounds
+        self.max_pending: int = max_pending
+        self.pending: int = 0
+        self.metrics: Optional[Metrics] = metrics
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="bcrypt"
+        )
+
+    async def _run(self, operation: str, fn: Callable[..., Any], *args: Any) -> Any:
+        if self.pending >= self.max_pending:
+            raise ServiceUnavailableError("Server is busy, please retry shortly")
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            call = partial(fn, *args)
+            if self.metrics is not None:
+                call = partial(self._timed, operation, call)
+            return await loop.run_in_executor(self._executor, call)
+        finally:
+            self.pending -= 1
+
+    def _timed(self, operation: str, call: Callable[[], Any]) -> Any:
+        # Timed on the worker so queueing behind other hashes is not counted.
+        start = time.perf_counter()
+        try:
+            return call()
+        finally:
+            self.metrics.password_hash_seconds.observe(
+                time.perf_counter() - start, operation
+            )
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", hash_password, password, self.rounds)
+
+    async def verify(self, hashed: str, plain: str) -> bool:
+        return await self._run("verify", verify_password, hashed, plain)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return get_rounds(hashed) != self.rounds
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,129 @@
+import asyncio
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Dict, Iterable, List, Optional
+from app.utils.errors import ConflictError, InvalidInputError
+
+# Pool threads are named "<prefix>_<n>"; their samples are merged per pool.
+POOL_THREAD_SUFFIX = re.compile(r"_\d+$")
+
+
+class SamplingProfiler:
+    """Statistical profiler for the running process.
+
+    A daemon thread reads every thread's Python stack with
+    ``sys._current_frames()`` each ``interval`` seconds, while the event loop
+    records where each asyncio task is suspended. Nothing is traced between
+    samples, so the overhead is one stack walk per thread per interval.
+    Results are returned as collapsed stacks (``frame;frame;frame count``),
+    the input format of flamegraph.pl, speedscope and inferno.
+    """
+
+    def __init__(self, max_seconds: float = 60.0) -> None:
+        self.max_seconds: float = max_seconds
+        self.running: bool = False
+        self._labels: Dict[CodeType, str] = {}
+        # Frames are labelled relative to the longest import root that holds them.
+        self._roots: List[str] = sorted(
+            {os.path.abspath(path or os.curdir) for path in sys.path}, key=len, reverse=True
+        )
+
+    async def profile(self, seconds: float, interval: float = 0.01) -> str:
+        if not 0 < seconds <= self.max_seconds:
+            raise InvalidInputError(
+                f"Profile duration must be between 0 and {self.max_seconds:g} seconds"
+            )
+        if not 0.001 <= interval <= 1:
+            raise InvalidInputError("Sampling interval must be between 1 ms and 1 s")
+        if self.running:
+            raise ConflictError("A profile is already running")
+
+        self.running = True
+        thread_samples: Counter = Counter()
+        task_samples: Counter = Counter()
+        stop = threading.Event()
+        sampler = threading.Thread(
+            target=self._sample_threads,
+            args=(thread_samples, stop, interval),
+            name="profiler",
+            daemon=True,
+        )
+        try:
+            sampler.start()
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + seconds
+            while loop.time() < deadline:
+                self._sample_tasks(task_samples)
+                await asyncio.sleep(interval)
+        finally:
+            stop.set()
+            await asyncio.to_thread(sampler.join)
+            self.running = False
+
+        return collapse(thread_samples + task_samples)
+
+    def _sample_threads(self, samples: Counter, stop: threading.Event, interval: float) -> None:
+        own = threading.get_ident()
+        while not stop.wait(interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                name = POOL_THREAD_SUFFIX.sub("", names.get(ident, str(ident)))
+                samples[f"thread {name};{self._stack(self._walk(frame))}"] += 1
+
+    def _sample_tasks(self, samples: Counter) -> None:
+        current = asyncio.current_task()
+        for task in asyncio.all_tasks():
+            if task is current:
+                continue
+            frames = self._awaiting(task.get_coro())
+            if frames:
+                samples[f"asyncio tasks;{self._stack(frames)}"] += 1
+
+    @staticmethod
+    def _awaiting(awaitable: object) -> List[FrameType]:
+        # Task.get_stack() stops at the task's own coroutine; follow what each
+        # coroutine (or generator-based coroutine) awaits down to the innermost.
+        frames: List[FrameType] = []
+        while awaitable is not None:
+            frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None)
+            if frame is None:
+                break
+            frames.append(frame)
+            awaitable = getattr(awaitable, "cr_await", None) or getattr(
+                awaitable, "gi_yieldfrom", None
+            )
+        return frames
+
+    @staticmethod
+    def _walk(frame: Optional[FrameType]) -> List[FrameType]:
+        frames: List[FrameType] = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        frames.reverse()
+        return frames
+
+    def _stack(self, frames: Iterable[FrameType]) -> str:
+        return ";".join(self._label(frame.f_code) for frame in frames)
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            path = code.co_filename
+            for root in self._roots:
+                if path.startswith(root + os.sep):
+                    path = path[len(root) + 1 :]
+                    break
+            label = f"{code.co_name} ({path}:{code.co_firstlineno})".replace(";", ",")
+            self._labels[code] = label
+        return label
+
+
+def collapse(samples: Counter) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(samples.items()))
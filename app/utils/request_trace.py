@@ -0,0 +1,122 @@
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+WRITE_OPERATIONS = frozenset(
+    {
+        "put_item",
+        "update_item",
+        "delete_item",
+        "batch_write_item",
+        "transact_write_items",
+    }
+)
+
+# Per-call Server-Timing entries beyond this are folded into the total only.
+MAX_TIMING_ENTRIES = 20
+
+
+@dataclass
+class DynamoCall:
+    operation: str
+    repository: str
+    method: str
+    index: Optional[str]
+    count: int
+    scanned_count: int
+    read_units: float
+    write_units: float
+    seconds: float
+
+    @property
+    def name(self) -> str:
+        return f"{self.repository}.{self.method}" if self.repository else self.operation
+
+
+@dataclass
+class RequestTrace:
+    """DynamoDB calls made while serving one request."""
+
+    calls: List[DynamoCall] = field(default_factory=list)
+
+    def record(
+        self,
+        operation: str,
+        params: Dict[str, Any],
+        response: Any,
+        seconds: float,
+        repository: str = "",
+        method: str = "",
+    ) -> None:
+        response = response if isinstance(response, dict) else {}
+        if "Items" in response:
+            count = int(response.get("Count", len(response["Items"])))
+        elif "Responses" in response:
+            count = sum(len(items) for items in response["Responses"].values())
+        else:
+            count = 1 if response.get("Item") else 0
+        read_units = write_units = 0.0
+        consumed = response.get("ConsumedCapacity") or []
+        for entry in consumed if isinstance(consumed, list) else [consumed]:
+            units = float(entry.get("CapacityUnits", 0))
+            if operation in WRITE_OPERATIONS:
+                write_units += units
+            else:
+                read_units += units
+        self.calls.append(
+            DynamoCall(
+                operation=operation,
+                repository=repository,
+                method=method,
+                index=params.get("IndexName"),
+                count=count,
+                scanned_count=int(response.get("ScannedCount", count)),
+                read_units=read_units,
+                write_units=write_units,
+                seconds=seconds,
+            )
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "calls": len(self.calls),
+            "items": sum(call.count for call in self.calls),
+            "scanned": sum(call.scanned_count for call in self.calls),
+            "rcu": round(sum(call.read_units for call in self.calls), 2),
+            "wcu": round(sum(call.write_units for call in self.calls), 2),
+            "seconds": sum(call.seconds for call in self.calls),
+        }
+
+    def server_timing(self) -> str:
+        summary = self.summary()
+        entries = [
+            f'dynamodb;dur={summary["seconds"] * 1000:.1f};desc="{summary["calls"]} calls, '
+            f'{summary["items"]}/{summary["scanned"]} items, '
+            f'{summary["rcu"]:g} RCU, {summary["wcu"]:g} WCU"'
+        ]
+        for position, call in enumerate(self.calls[:MAX_TIMING_ENTRIES], 1):
+            index = f" {call.index}" if call.index else ""
+            entries.append(
+                f'db{position};dur={call.seconds * 1000:.1f};desc="{call.name} '
+                f"{call.operation}{index} {call.count}/{call.scanned_count} items "
+                f'{call.read_units + call.write_units:g} CU"'
+            )
+        return ", ".join(entries)
+
+    def log_fields(self) -> str:
+        """The summary plus per-operation call counts as ``key=value`` pairs."""
+        summary = self.summary()
+        operations: Dict[str, int] = {}
+        for call in self.calls:
+            operations[call.name] = operations.get(call.name, 0) + 1
+        return (
+            f"dynamodb_calls={summary['calls']} items={summary['items']} "
+            f"scanned={summary['scanned']} rcu={summary['rcu']:g} "
+            f"wcu={summary['wcu']:g} dynamodb_ms={summary['seconds'] * 1000:.1f} "
+            "ops=" + ",".join(f"{name}:{n}" for name, n in sorted(operations.items()))
+        )
+
+
+current_trace: ContextVar[Optional[RequestTrace]] = ContextVar(
+    "current_trace", default=None
+)
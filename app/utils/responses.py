@@ -0,0 +1,33 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple, Type
+
+from fastapi import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+@lru_cache(maxsize=None)
+def _field_names(dto_type: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(dto_type.model_fields)
+
+
+def trusted_list_response(
+    dto_type: Type[BaseModel],
+    rows: Iterable[Dict[str, Any]],
+    next_token: Optional[str] = None,
+) -> Response:
+    """Serialize rows as a JSON list shaped like ``dto_type``, without validation.
+
+    Rows come from repository models built from our own table, so they are
+    only projected onto the DTO's fields (dropping anything else, such as a
+    password hash) and encoded by pydantic-core in one pass. Returning a
+    ``Response`` also skips FastAPI's ``response_model`` validation.
+    """
+    fields = _field_names(dto_type)
+    response = Response(
+        content=to_json([{name: row[name] for name in fields} for row in rows]),
+        media_type="application/json",
+    )
+    if next_token:
+        response.headers["X-Next-Token"] = next_token
+    return response
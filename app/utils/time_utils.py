@@ -1,4 +1,5 @@
 import time
+from typing import List
 
 
 def is_time_range_valid(start: int, end: int) -> bool:
@@ -13,3 +14,7 @@ def is_within_booking_window(start_time: int, max_days_in_future: int) -> bool:
     current_time = int(time.time())
     max_future_time = current_time + (max_days_in_future * 24 * 60 * 60)
     return start_time >= current_time and start_time <= max_future_time
+
+
+def slot_buckets(start: int, end: int, slot_seconds: int) -> List[int]:
+    return list(range((start // slot_seconds) * slot_seconds, end, slot_seconds))
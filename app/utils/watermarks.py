@@ -0,0 +1,104 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.models.models import Booking, ScheduleSlot, Watermark
+
+DAY_SECONDS = 86400
+SCHEDULE_SLOT_PREFIX = "S#"
+
+
+def rooms_watermark_key() -> Dict[str, str]:
+    return {"PK": "WATERMARK#ROOMS", "SK": "WATERMARK"}
+
+
+def user_bookings_watermark_key(user_id: str) -> Dict[str, str]:
+    return {"PK": f"WATERMARK#BOOKINGS#USER#{user_id}", "SK": "WATERMARK"}
+
+
+def room_day_key(room_id: str, day: int) -> Dict[str, str]:
+    return {"PK": f"ROOMDAY#{room_id}#{day}", "SK": "SCHEDULE"}
+
+
+def schedule_slot_attribute(booking_id: str) -> str:
+    return f"{SCHEDULE_SLOT_PREFIX}{booking_id}"
+
+
+def schedule_slot(booking: Booking) -> Dict[str, Any]:
+    """The compact entry a room-day document keeps for ``booking``."""
+    return {
+        "StartTime": booking.start_time,
+        "EndTime": booking.end_time,
+        "UserID": booking.user_id,
+        "UserName": booking.user_name,
+        "Purpose": booking.purpose,
+    }
+
+
+def parse_schedule_slots(item: Optional[Dict[str, Any]]) -> List[ScheduleSlot]:
+    """Slots of a room-day document, ordered by start time."""
+    slots = [
+        ScheduleSlot(
+            start_time=int(value["StartTime"]),
+            end_time=int(value["EndTime"]),
+            is_booked=True,
+            booking_id=name[len(SCHEDULE_SLOT_PREFIX) :],
+            user_name=value.get("UserName"),
+            purpose=value.get("Purpose"),
+        )
+        for name, value in (item or {}).items()
+        if name.startswith(SCHEDULE_SLOT_PREFIX)
+    ]
+    slots.sort(key=lambda slot: (slot.start_time, slot.booking_id))
+    return slots
+
+
+def days_between(start: int, end: int) -> List[int]:
+    """Start-of-day timestamps of every UTC day overlapping [start, end)."""
+    first = (start // DAY_SECONDS) * DAY_SECONDS
+    return list(range(first, max(end, start + 1), DAY_SECONDS))
+
+
+def watermark_update(
+    table_name: str,
+    key: Dict[str, str],
+    now: int,
+    set_attributes: Optional[Dict[str, Any]] = None,
+    remove_attributes: Sequence[str] = (),
+) -> Dict[str, Any]:
+    """TransactWriteItems entry that bumps the watermark stored at ``key``.
+
+    Documents that carry their own watermark (room days) pass the
+    attributes to set or remove in the same update.
+    """
+    sets = ["UpdatedAt = :now"]
+    names: Dict[str, str] = {}
+    values: Dict[str, Any] = {":one": 1, ":now": now}
+    for i, (name, value) in enumerate((set_attributes or {}).items()):
+        names[f"#s{i}"] = name
+        values[f":s{i}"] = value
+        sets.append(f"#s{i} = :s{i}")
+    expression = "ADD Version :one SET " + ", ".join(sets)
+    if remove_attributes:
+        for i, name in enumerate(remove_attributes):
+            names[f"#r{i}"] = name
+        expression += " REMOVE " + ", ".join(
+            f"#r{i}" for i in range(len(remove_attributes))
+        )
+
+    update: Dict[str, Any] = {
+        "TableName": table_name,
+        "Key": key,
+        "UpdateExpression": expression,
+        "ExpressionAttributeValues": values,
+    }
+    if names:
+        update["ExpressionAttributeNames"] = names
+    return {"Update": update}
+
+
+def parse_watermark(item: Optional[Dict[str, Any]]) -> Watermark:
+    """A watermark item, or version 0 if it has never been written."""
+    item = item or {}
+    return Watermark(
+        version=int(item.get("Version", 0)),
+        updated_at=int(item.get("UpdatedAt", 0)),
+    )
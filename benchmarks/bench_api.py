@@ -0,0 +1,204 @@
+"""
+Throughput benchmark for the HTTP hot paths.
+
+Drives the FastAPI app from ``main.py`` in-process against the in-memory
+DynamoDB backend and reports p50/p99 latency and requests/sec for the
+booking, schedule, list and search workloads::
+
+    python -m benchmarks.bench_api --requests 2000 --concurrency 50 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+import httpx
+
+from app.config.config import settings
+
+WORKLOADS = ("booking", "schedule", "list", "search")
+
+Request = Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+
+
+async def seed(app_state, rooms: int, users: int) -> Tuple[List[str], List[Tuple[str, str]]]:
+    from app.models.models import Room, User
+    from app.utils.jwt_utils import generate_token
+
+    now = int(time.time())
+    room_ids = []
+    for number in range(rooms):
+        room = Room(
+            id=str(uuid.uuid4()),
+            name=f"Room {number}",
+            room_number=100 + number,
+            capacity=4 + number % 20,
+            floor=number % 10,
+            amenities=["projector"],
+            location="HQ",
+            created_at=now,
+            updated_at=now,
+        )
+        await app_state.room_repo.create(room)
+        room_ids.append(room.id)
+
+    tokens = []
+    for number in range(users):
+        user = User(
+            id=str(uuid.uuid4()),
+            name=f"User {number}",
+            email=f"user{number}@example.com",
+            password="not-used",
+            role="user",
+            created_at=now,
+            updated_at=now,
+        )
+        await app_state.user_repo.create(user)
+        tokens.append((user.id, generate_token(user.id, user.role)))
+    return room_ids, tokens
+
+
+def build_workload(
+    name: str, room_ids: List[str], tokens: List[Tuple[str, str]]
+) -> Request:
+    slot = settings.BOOKING_SLOT_MINUTES * 60
+    window_start = (int(time.time()) // slot + 4) * slot
+    window_slots = (settings.MAX_BOOKING_DAYS_IN_FUTURE - 1) * 86400 // slot
+
+    def headers() -> Dict[str, str]:
+        return {"Authorization": f"Bearer {random.choice(tokens)[1]}"}
+
+    async def booking(client: httpx.AsyncClient) -> httpx.Response:
+        start = window_start + random.randrange(window_slots) * slot
+        return await client.post(
+            "/api/bookings",
+            headers=headers(),
+            json={
+                "room_id": random.choice(room_ids),
+                "start_time": start,
+                "end_time": start + slot * random.randint(1, 4),
+                "purpose": "benchmark",
+            },
+        )
+
+    async def schedule(client: httpx.AsyncClient) -> httpx.Response:
+        day = window_start + random.randrange(settings.MAX_BOOKING_DAYS_IN_FUTURE - 1) * 86400
+        date = datetime.fromtimestamp(day, timezone.utc).strftime("%Y-%m-%d")
+        return await client.get(
+            f"/api/rooms/{random.choice(room_ids)}/schedule",
+            headers=headers(),
+            params={"date": date},
+        )
+
+    async def listing(client: httpx.AsyncClient) -> httpx.Response:
+        if random.random() < 0.5:
+            return await client.get("/api/bookings/my", headers=headers())
+        return await client.get("/api/rooms", headers=headers())
+
+    async def search(client: httpx.AsyncClient) -> httpx.Response:
+        day = window_start + random.randrange(settings.MAX_BOOKING_DAYS_IN_FUTURE - 1) * 86400
+        date = datetime.fromtimestamp(day, timezone.utc).strftime("%Y-%m-%d")
+        return await client.get(
+            "/api/rooms/search",
+            headers=headers(),
+            params={"date": date, "duration_minutes": 60, "min_capacity": 8},
+        )
+
+    return {
+        "booking": booking,
+        "schedule": schedule,
+        "list": listing,
+        "search": search,
+    }[name]
+
+
+async def run_workload(
+    client: httpx.AsyncClient, request: Request, total: int, concurrency: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    remaining = iter(range(total))
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await request(client)
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "statuses": statuses,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    settings.DYNAMODB_BACKEND = "memory"
+    settings.MEMORY_DYNAMODB_LATENCY_MS = args.latency_ms
+
+    from main import app
+    from app.dependencies import close_app_state, init_app_state
+
+    init_app_state(app.state)
+    try:
+        room_ids, tokens = await seed(app.state, args.rooms, args.users)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark"
+        ) as client:
+            print(
+                f"{'workload':<10} {'requests':>8} {'req/s':>9} "
+                f"{'p50 ms':>8} {'p99 ms':>8}  statuses"
+            )
+            for name in args.workloads:
+                result = await run_workload(
+                    client,
+                    build_workload(name, room_ids, tokens),
+                    args.requests,
+                    args.concurrency,
+                )
+                print(
+                    f"{name:<10} {result['requests']:>8} {result['rps']:>9.1f} "
+                    f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f}  "
+                    f"{result['statuses']}"
+                )
+    finally:
+        await close_app_state(app.state)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000, help="requests per workload")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rooms", type=int, default=20)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=2.0,
+        help="simulated DynamoDB round-trip latency per call",
+    )
+    parser.add_argument(
+        "--workloads", nargs="+", choices=WORKLOADS, default=list(WORKLOADS)
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    random.seed(arguments.seed)
+    asyncio.run(main(arguments))
@@ -4,10 +4,14 @@ from contextlib import asynccontextmanager
 
 from app.controllers.auth_controllers import auth_router
 from app.controllers.bookings_controllers import bookings_router
+from app.controllers.jobs_controllers import jobs_router
+from app.controllers.profiling_controllers import profiling_router
 from app.controllers.rooms_controllers import rooms_router
 from app.controllers.users_controllers import users_router
 from app.config.config import settings
-from app.dependencies import init_app_state
+from app.dependencies import init_app_state, close_app_state
+from app.middleware.metrics_middleware import MetricsMiddleware
+from app.middleware.tracing_middleware import TracingMiddleware
 from app.utils.errors import (
     NotFoundError,
     InvalidInputError,
@@ -16,6 +20,7 @@ from app.utils.errors import (
     InternalError,
     RoomUnavailableError,
     TimeRangeInvalidError,
+    ServiceUnavailableError,
 )
 from app.utils.exception_handlers import (
     not_found_exception_handler,
@@ -25,6 +30,7 @@ from app.utils.exception_handlers import (
     internal_error_exception_handler,
     room_unavailable_exception_handler,
     time_range_invalid_exception_handler,
+    service_unavailable_exception_handler,
     general_exception_handler,
 )
 
@@ -32,7 +38,9 @@ from app.utils.exception_handlers import (
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_app_state(app.state)
+    app.state.job_service.start_sweeping()
     yield
+    await close_app_state(app.state)
 
 
 app = FastAPI(
@@ -50,6 +58,9 @@ app.add_middleware(
     allow_headers=["*"],
     expose_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
+if settings.REQUEST_TRACE_ENABLED:
+    app.add_middleware(TracingMiddleware, server_timing=settings.DEBUG)
 
 app.add_exception_handler(NotFoundError, not_found_exception_handler)
 app.add_exception_handler(InvalidInputError, invalid_input_exception_handler)
@@ -58,9 +69,14 @@ app.add_exception_handler(ConflictError, conflict_exception_handler)
 app.add_exception_handler(InternalError, internal_error_exception_handler)
 app.add_exception_handler(RoomUnavailableError, room_unavailable_exception_handler)
 app.add_exception_handler(TimeRangeInvalidError, time_range_invalid_exception_handler)
+app.add_exception_handler(
+    ServiceUnavailableError, service_unavailable_exception_handler
+)
 app.add_exception_handler(Exception, general_exception_handler)
 
 app.include_router(auth_router)
 app.include_router(bookings_router)
 app.include_router(rooms_router)
 app.include_router(users_router)
+app.include_router(jobs_router)
+app.include_router(profiling_router)
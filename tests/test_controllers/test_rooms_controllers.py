@@ -0,0 +1,111 @@
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, MagicMock
+from app.models.models import Page, Room, Watermark
+
+
+class TestRoomsControllers:
+    @pytest.fixture
+    def mock_room_service(self):
+        service = MagicMock()
+        service.get_rooms_watermark = AsyncMock(
+            return_value=Watermark(version=3, updated_at=1704700000)
+        )
+        return service
+
+    @pytest.fixture
+    def client(self, mock_room_service):
+        from fastapi import FastAPI
+        from app.controllers.rooms_controllers import rooms_router
+        from app.dependencies.dependencies import get_room_service
+        from app.middleware.auth_middleware import set_current_user
+
+        async def mock_set_current_user(request):
+            request.state.user = {"user_id": "user-1", "role": "user"}
+
+        app = FastAPI()
+        app.include_router(rooms_router)
+        app.dependency_overrides[get_room_service] = lambda: mock_room_service
+        app.dependency_overrides[set_current_user] = lambda: mock_set_current_user
+
+        return TestClient(app, raise_server_exceptions=False)
+
+    @pytest.fixture
+    def sample_room(self):
+        return Room(
+            id="room-1",
+            name="Board Room",
+            room_number=101,
+            capacity=10,
+            floor=1,
+            amenities=["projector"],
+            status="available",
+            location="North wing",
+            description="",
+            created_at=1704700000,
+            updated_at=1704700000,
+        )
+
+    def test_get_all_rooms_sets_validators(
+        self, client, mock_room_service, sample_room
+    ):
+        mock_room_service.get_all_rooms = AsyncMock(
+            return_value=Page(items=[sample_room])
+        )
+
+        response = client.get("/api/rooms")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('"')
+        assert response.headers["Last-Modified"] == "Mon, 08 Jan 2024 07:46:40 GMT"
+        assert [room["id"] for room in response.json()] == ["room-1"]
+
+    def test_get_all_rooms_not_modified_skips_the_query(
+        self, client, mock_room_service, sample_room
+    ):
+        mock_room_service.get_all_rooms = AsyncMock(
+            return_value=Page(items=[sample_room])
+        )
+        etag = client.get("/api/rooms").headers["ETag"]
+        mock_room_service.get_all_rooms.reset_mock()
+
+        response = client.get("/api/rooms", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        mock_room_service.get_all_rooms.assert_not_called()
+
+    def test_get_all_rooms_etag_changes_with_watermark_and_query(
+        self, client, mock_room_service, sample_room
+    ):
+        mock_room_service.get_all_rooms = AsyncMock(
+            return_value=Page(items=[sample_room])
+        )
+        etag = client.get("/api/rooms").headers["ETag"]
+
+        assert client.get("/api/rooms?floor=1").headers["ETag"] != etag
+        mock_room_service.get_rooms_watermark.return_value = Watermark(
+            version=4, updated_at=1704700100
+        )
+        response = client.get("/api/rooms", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_get_room_by_id_honours_if_modified_since(
+        self, client, mock_room_service, sample_room
+    ):
+        mock_room_service.get_room_by_id = AsyncMock(return_value=sample_room)
+
+        fresh = client.get(
+            "/api/rooms/room-1",
+            headers={"If-Modified-Since": "Mon, 08 Jan 2024 07:46:40 GMT"},
+        )
+        stale = client.get(
+            "/api/rooms/room-1",
+            headers={"If-Modified-Since": "Mon, 08 Jan 2024 07:46:39 GMT"},
+        )
+
+        assert fresh.status_code == 304
+        assert stale.status_code == 200
+        assert stale.json()["id"] == "room-1"
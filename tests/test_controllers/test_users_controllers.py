@@ -1,7 +1,8 @@
 import pytest
+from fastapi import Request
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock
-from app.models.models import User
+from app.models.models import Job, Page, User
 from app.utils.errors import InvalidInputError, UnauthorizedError
 
 
@@ -13,7 +14,7 @@ class TestUsersControllers:
     @pytest.fixture
     def mock_auth_middleware(self):
 
-        async def mock_set_current_user(request):
+        async def mock_set_current_user(request: Request):
             request.state.user = {
                 "user_id": "admin-123",
                 "email": "admin@example.com",
@@ -46,7 +47,7 @@ class TestUsersControllers:
         app.add_exception_handler(Exception, general_exception_handler)
 
         app.dependency_overrides[get_user_service] = lambda: mock_user_service
-        app.dependency_overrides[set_current_user] = lambda: mock_auth_middleware[0]
+        app.dependency_overrides[set_current_user] = mock_auth_middleware[0]
         app.dependency_overrides[require_admin_state] = lambda: mock_auth_middleware[1]
 
         return TestClient(app, raise_server_exceptions=False)
@@ -62,3 +63,44 @@ class TestUsersControllers:
             created_at=1704700000,
             updated_at=1704700000,
         )
+
+    def test_get_all_users_serializes_without_password(
+        self, client, mock_user_service, sample_user
+    ):
+        mock_user_service.get_all_users = AsyncMock(
+            return_value=Page(items=[sample_user], next_token="token-1")
+        )
+
+        response = client.get("/api/users", params={"limit": 1})
+
+        assert response.status_code == 200
+        assert response.headers["X-Next-Token"] == "token-1"
+        assert "password" not in response.json()[0]
+        assert response.json() == [
+            {
+                "id": "user-123",
+                "name": "John Doe",
+                "email": "john@example.com",
+                "role": "user",
+                "created_at": 1704700000,
+                "updated_at": 1704700000,
+            }
+        ]
+
+    def test_delete_user_returns_202_with_a_job(self, client, mock_user_service):
+        mock_user_service.delete_user_by_id = AsyncMock(
+            return_value=Job(id="job-1", type="delete_user_bookings", target_id="u-1")
+        )
+
+        response = client.delete("/api/users/u-1")
+
+        assert response.status_code == 202
+        assert response.json()["job_id"] == "job-1"
+
+    def test_inline_delete_returns_200(self, client, mock_user_service):
+        mock_user_service.delete_user_by_id = AsyncMock(return_value=None)
+
+        response = client.delete("/api/users/u-1")
+
+        assert response.status_code == 200
+        assert response.json()["job_id"] is None
@@ -0,0 +1,76 @@
+import time
+import jwt
+import pytest
+from unittest.mock import patch
+from fastapi import HTTPException
+from app.config.config import settings
+from app.middleware import auth_middleware
+from app.middleware.auth_middleware import get_current_user, token_cache
+from app.utils.jwt_utils import generate_token
+
+
+class TestGetCurrentUser:
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        token_cache.clear()
+        yield
+        token_cache.clear()
+
+    def test_repeat_requests_skip_verification(self):
+        token = generate_token("user-1", "user")
+
+        with patch.object(
+            auth_middleware.jwt_utils,
+            "validate_token",
+            wraps=auth_middleware.jwt_utils.validate_token,
+        ) as validate:
+            first = get_current_user(f"Bearer {token}")
+            second = get_current_user(f"Bearer {token}")
+
+        assert first == second
+        assert first["user_id"] == "user-1"
+        assert validate.call_count == 1
+        assert token_cache.stats()["hits"] == 1
+
+    def test_cached_payload_is_not_shared(self):
+        token = generate_token("user-1", "user")
+
+        get_current_user(f"Bearer {token}")["role"] = "admin"
+
+        assert get_current_user(f"Bearer {token}")["role"] == "user"
+
+    def test_tampered_token_is_rejected(self):
+        token = generate_token("user-1", "user")
+        get_current_user(f"Bearer {token}")
+
+        with pytest.raises(HTTPException) as e:
+            get_current_user(f"Bearer {token[:-2]}xx")
+        assert e.value.status_code == 401
+
+    def test_expired_token_is_not_cached(self):
+        token = jwt.encode(
+            {"user_id": "user-1", "role": "user", "exp": int(time.time()) - 1},
+            settings.JWT_SECRET,
+            algorithm="HS256",
+        )
+
+        with pytest.raises(HTTPException):
+            get_current_user(f"Bearer {token}")
+        assert token_cache.stats()["size"] == 0
+
+    def test_entry_expires_with_token(self):
+        token = jwt.encode(
+            {"user_id": "user-1", "role": "user", "exp": int(time.time()) + 5},
+            settings.JWT_SECRET,
+            algorithm="HS256",
+        )
+        get_current_user(f"Bearer {token}")
+
+        later = time.monotonic() + 10
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=later), patch.object(
+            auth_middleware.jwt_utils, "validate_token", return_value=None
+        ) as validate:
+            with pytest.raises(HTTPException):
+                get_current_user(f"Bearer {token}")
+        assert validate.call_count == 1
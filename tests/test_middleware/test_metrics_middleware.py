@@ -0,0 +1,29 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from app.middleware.metrics_middleware import MetricsMiddleware
+from app.utils.metrics import Metrics
+
+
+class TestMetricsMiddleware:
+
+    def test_requests_are_labelled_by_route_template(self):
+        app = FastAPI()
+        app.state.metrics = Metrics()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/rooms/{room_id}")
+        async def get_room(room_id: str):
+            if room_id == "missing":
+                raise HTTPException(status_code=404)
+            return {"id": room_id}
+
+        client = TestClient(app)
+        client.get("/rooms/a")
+        client.get("/rooms/b")
+        client.get("/rooms/missing")
+        client.get("/nowhere")
+
+        histogram = app.state.metrics.request_seconds
+        assert histogram.count("GET", "/rooms/{room_id}", "200") == 2
+        assert histogram.count("GET", "/rooms/{room_id}", "404") == 1
+        assert histogram.count("GET", "unmatched", "404") == 1
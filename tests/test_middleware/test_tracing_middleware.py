@@ -0,0 +1,51 @@
+import logging
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.middleware.tracing_middleware import TracingMiddleware
+from app.utils.request_trace import current_trace
+
+
+def build_app(server_timing):
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware, server_timing=server_timing)
+
+    @app.get("/rooms/{room_id}")
+    async def get_room(room_id: str):
+        current_trace.get().record(
+            "get_item",
+            {},
+            {"Item": {"ID": room_id}, "ConsumedCapacity": {"CapacityUnits": 0.5}},
+            0.001,
+            "RoomRepository",
+            "get_by_id",
+        )
+        return {"id": room_id}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+
+class TestTracingMiddleware:
+
+    def test_server_timing_header_in_debug_mode(self):
+        response = build_app(server_timing=True).get("/rooms/a")
+
+        assert response.headers["server-timing"].startswith(
+            'dynamodb;dur=1.0;desc="1 calls, 1/1 items, 0.5 RCU, 0 WCU"'
+        )
+
+    def test_traces_are_logged_without_header(self, caplog):
+        client = build_app(server_timing=False)
+
+        with caplog.at_level(logging.INFO, logger="app.middleware.tracing_middleware"):
+            response = client.get("/rooms/a")
+            client.get("/health")
+
+        assert "server-timing" not in response.headers
+        assert len(caplog.records) == 1
+        message = caplog.records[0].getMessage()
+        assert "route=/rooms/{room_id} status=200" in message
+        assert "ops=RoomRepository.get_by_id:1" in message
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import boto3
+import httpx
+import pytest
+from boto3.dynamodb.conditions import Key
+from app.repositories.async_dynamodb import AsyncDynamoDBClient, AsyncDynamoDBResource
+
+
+class TestAsyncDynamoDBBackend:
+
+    @pytest.fixture
+    def session(self):
+        return boto3.Session(
+            aws_access_key_id="test",
+            aws_secret_access_key="test",
+            region_name="us-east-1",
+        )
+
+    def make_resource(self, session, handler):
+        client = AsyncDynamoDBClient(
+            "us-east-1",
+            session=session,
+            max_attempts=2,
+            transport=httpx.MockTransport(handler),
+        )
+        return AsyncDynamoDBResource(client)
+
+    def test_query_serializes_conditions_and_deserializes_items(self, session):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "Items": [{"PK": {"S": "ROOM"}, "Capacity": {"N": "8"}}],
+                    "Count": 1,
+                },
+            )
+
+        async def run():
+            resource = self.make_resource(session, handler)
+            table = resource.Table("MeetingRoomSystem")
+            try:
+                return await table.query(KeyConditionExpression=Key("PK").eq("ROOM"))
+            finally:
+                await resource.close()
+
+        response = asyncio.run(run())
+
+        assert response["Items"] == [{"PK": "ROOM", "Capacity": 8}]
+        request = requests[0]
+        assert request.headers["X-Amz-Target"] == "DynamoDB_20120810.Query"
+        assert request.headers["Authorization"].startswith("AWS4-HMAC-SHA256")
+        body = json.loads(request.content)
+        assert body["TableName"] == "MeetingRoomSystem"
+        assert body["KeyConditionExpression"] == "#n0 = :v0"
+        assert body["ExpressionAttributeValues"] == {":v0": {"S": "ROOM"}}
+
+    def test_errors_raise_modeled_exceptions(self, session):
+        def handler(request):
+            return httpx.Response(
+                400,
+                json={
+                    "__type": "com.amazonaws.dynamodb.v20120810#ConditionalCheckFailedException",
+                    "message": "The conditional request failed",
+                },
+            )
+
+        async def run():
+            resource = self.make_resource(session, handler)
+            table = resource.Table("MeetingRoomSystem")
+            try:
+                await table.put_item(
+                    Item={"PK": "ROOM", "SK": "ROOM#1"},
+                    ConditionExpression="attribute_not_exists(PK)",
+                )
+            finally:
+                await resource.close()
+
+        resource_exceptions = self.make_resource(session, handler).meta.client.exceptions
+        with pytest.raises(resource_exceptions.ConditionalCheckFailedException):
+            asyncio.run(run())
+
+    def test_throttling_is_retried(self, session):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(
+                    400,
+                    json={"__type": "com.amazonaws.dynamodb.v20120810#ThrottlingException"},
+                )
+            return httpx.Response(200, json={"Item": {"ID": {"S": "room-1"}}})
+
+        async def run():
+            resource = self.make_resource(session, handler)
+            try:
+                return await resource.Table("MeetingRoomSystem").get_item(
+                    Key={"PK": "ROOM", "SK": "ROOM#room-1"}
+                )
+            finally:
+                await resource.close()
+
+        assert asyncio.run(run())["Item"] == {"ID": "room-1"}
+        assert len(calls) == 2
+
+    def test_non_json_error_is_retried(self, session):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(
+                    502,
+                    text="<html>Bad Gateway</html>",
+                    headers={"Content-Type": "text/html"},
+                )
+            return httpx.Response(200, json={"Item": {"ID": {"S": "room-1"}}})
+
+        async def run():
+            resource = self.make_resource(session, handler)
+            try:
+                return await resource.Table("MeetingRoomSystem").get_item(
+                    Key={"PK": "ROOM", "SK": "ROOM#room-1"}
+                )
+            finally:
+                await resource.close()
+
+        assert asyncio.run(run())["Item"] == {"ID": "room-1"}
+        assert len(calls) == 2
@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+from app.models.models import Booking
+from app.repositories.bookings_repo import BookingRepository
+from app.utils.dynamo_executor import DynamoExecutor
+from app.utils.errors import RoomUnavailableError
+
+
+class TransactionCanceledException(Exception):
+    def __init__(self, reasons):
+        super().__init__("Transaction cancelled")
+        self.response = {"CancellationReasons": reasons}
+
+
+class TestBookingRepository:
+
+    @pytest.fixture
+    def dynamodb(self):
+        dynamodb = MagicMock()
+        dynamodb.Table.return_value.table_name = "MeetingRoomSystem"
+        dynamodb.meta.client.exceptions.TransactionCanceledException = (
+            TransactionCanceledException
+        )
+        return dynamodb
+
+    @pytest.fixture
+    def booking(self):
+        return Booking(
+            id="booking-1",
+            user_id="user-1",
+            user_name="John Doe",
+            room_id="room-1",
+            room_number=101,
+            start_time=1704700800,
+            end_time=1704700800 + 3600,
+            purpose="Standup",
+            status="confirmed",
+            created_at=1704700000,
+            updated_at=1704700000,
+        )
+
+    def test_create_writes_booking_and_slot_locks_in_one_transaction(
+        self, dynamodb, booking
+    ):
+        repo = BookingRepository(dynamodb, "MeetingRoomSystem")
+
+        asyncio.run(repo.create(booking))
+
+        transact_items = dynamodb.meta.client.transact_write_items.call_args.kwargs[
+            "TransactItems"
+        ]
+        assert len(transact_items) == 7
+        assert transact_items[0]["Put"]["Item"]["SK"] == "BOOKING#booking-1"
+        assert transact_items[1]["Put"]["Item"]["PK"] == (
+            f"ROOM#room-1#SLOT#{booking.start_time}"
+        )
+        assert all(
+            item["Put"]["ConditionExpression"] == "attribute_not_exists(PK)"
+            for item in transact_items[:5]
+        )
+        assert [item["Update"]["Key"]["PK"] for item in transact_items[5:]] == [
+            "WATERMARK#BOOKINGS#USER#user-1",
+            "ROOMDAY#room-1#1704672000",
+        ]
+
+    def test_create_retries_conflicts_on_watermarks_only(self, dynamodb, booking):
+        reasons = [{"Code": "None"}] * 5 + [
+            {"Code": "TransactionConflict"},
+            {"Code": "None"},
+        ]
+        dynamodb.meta.client.transact_write_items.side_effect = [
+            TransactionCanceledException(reasons),
+            None,
+        ]
+        repo = BookingRepository(dynamodb, "MeetingRoomSystem")
+
+        asyncio.run(repo.create(booking))
+
+        assert dynamodb.meta.client.transact_write_items.call_count == 2
+
+    def test_create_many_does_not_conflict_with_itself(self, dynamodb, booking):
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        # Like DynamoDB, cancel transactions that overlap on shared items.
+        def transact_write_items(TransactItems):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                overlapping = active[0] > 1
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            if overlapping:
+                raise TransactionCanceledException(
+                    [
+                        {"Code": "TransactionConflict" if "Update" in item else "None"}
+                        for item in TransactItems
+                    ]
+                )
+
+        dynamodb.meta.client.transact_write_items.side_effect = transact_write_items
+        executor = DynamoExecutor(max_workers=4)
+        repo = BookingRepository(dynamodb, "MeetingRoomSystem", executor=executor)
+        bookings = [
+            booking.model_copy(
+                update={
+                    "id": f"booking-{i}",
+                    "start_time": booking.start_time + i * 3600,
+                    "end_time": booking.start_time + (i + 1) * 3600,
+                }
+            )
+            for i in range(40)
+        ]
+
+        try:
+            assert asyncio.run(repo.create_many(bookings)) == []
+        finally:
+            executor.shutdown()
+
+        assert dynamodb.meta.client.transact_write_items.call_count == 3
+        assert peak[0] == 1
+
+    def test_create_maps_lock_conflict_to_room_unavailable(self, dynamodb, booking):
+        dynamodb.meta.client.transact_write_items.side_effect = (
+            TransactionCanceledException(
+                [{"Code": "None"}, {"Code": "ConditionalCheckFailed"}]
+            )
+        )
+        repo = BookingRepository(dynamodb, "MeetingRoomSystem")
+
+        with pytest.raises(RoomUnavailableError):
+            asyncio.run(repo.create(booking))
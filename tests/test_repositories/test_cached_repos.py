@@ -0,0 +1,118 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from app.models.models import Page, Room, User, Watermark
+from app.repositories.cached_repos import CachedRoomRepository, CachedUserRepository
+from app.utils.ttl_cache import TTLCache
+
+
+class TestCachedRoomRepository:
+
+    @pytest.fixture
+    def sample_room(self):
+        return Room(
+            id="room-1",
+            name="Everest",
+            room_number=101,
+            capacity=8,
+            floor=1,
+            amenities=["projector"],
+            location="North wing",
+            created_at=1704700000,
+            updated_at=1704700000,
+        )
+
+    @pytest.fixture
+    def inner_repo(self, sample_room):
+        repo = MagicMock()
+        repo.get_by_id = AsyncMock(return_value=sample_room)
+        repo.update_availability = AsyncMock()
+        return repo
+
+    def test_get_by_id_is_served_from_cache(self, inner_repo):
+        repo = CachedRoomRepository(inner_repo, TTLCache())
+
+        first = asyncio.run(repo.get_by_id("room-1"))
+        first.name = "mutated"
+        second = asyncio.run(repo.get_by_id("room-1"))
+
+        assert second.name == "Everest"
+        inner_repo.get_by_id.assert_awaited_once_with("room-1", False)
+
+    def test_consistent_get_by_id_skips_cache(self, inner_repo):
+        repo = CachedRoomRepository(inner_repo, TTLCache())
+
+        asyncio.run(repo.get_by_id("room-1"))
+        asyncio.run(repo.get_by_id("room-1", consistent_read=True))
+        asyncio.run(repo.get_by_id("room-1"))
+
+        assert inner_repo.get_by_id.await_count == 2
+        inner_repo.get_by_id.assert_awaited_with("room-1", True)
+
+    def test_filtered_listing_bypasses_cache(self, inner_repo, sample_room):
+        inner_repo.get_all_page = AsyncMock(return_value=Page(items=[sample_room]))
+        repo = CachedRoomRepository(inner_repo, TTLCache())
+
+        asyncio.run(repo.get_all_page())
+        asyncio.run(repo.get_all_page())
+        asyncio.run(repo.get_all_page(floor=0))
+
+        assert inner_repo.get_all_page.await_count == 2
+        inner_repo.get_all_page.assert_awaited_with(None, None, floor=0)
+
+    def test_writes_invalidate_cached_room(self, inner_repo):
+        repo = CachedRoomRepository(inner_repo, TTLCache())
+
+        asyncio.run(repo.get_by_id("room-1"))
+        asyncio.run(repo.update_availability("room-1", "maintenance"))
+        asyncio.run(repo.get_by_id("room-1"))
+
+        assert inner_repo.get_by_id.await_count == 2
+
+    def test_moved_watermark_drops_cached_rooms(self, inner_repo):
+        inner_repo.get_watermark = AsyncMock(return_value=Watermark(version=1))
+        repo = CachedRoomRepository(inner_repo, TTLCache())
+
+        asyncio.run(repo.get_watermark())
+        asyncio.run(repo.get_by_id("room-1"))
+        asyncio.run(repo.get_watermark())
+        asyncio.run(repo.get_by_id("room-1"))
+        inner_repo.get_watermark.return_value = Watermark(version=2)
+        asyncio.run(repo.get_watermark())
+        asyncio.run(repo.get_by_id("room-1"))
+
+        assert inner_repo.get_by_id.await_count == 2
+
+    def test_consistent_get_many_skips_cache(self, inner_repo, sample_room):
+        inner_repo.get_many = AsyncMock(return_value={"room-1": sample_room})
+        repo = CachedRoomRepository(inner_repo, TTLCache())
+
+        asyncio.run(repo.get_many(["room-1"]))
+        asyncio.run(repo.get_many(["room-1"]))
+        asyncio.run(repo.get_many(["room-1"], consistent_read=True))
+
+        assert inner_repo.get_many.await_count == 2
+        inner_repo.get_many.assert_awaited_with(["room-1"], True)
+
+
+class TestCachedUserRepository:
+
+    def test_consistent_find_by_email_skips_cache(self):
+        user = User(
+            id="user-1",
+            name="John Doe",
+            email="john@example.com",
+            password="hash",
+            role="admin",
+        )
+        inner_repo = MagicMock()
+        inner_repo.find_by_email = AsyncMock(return_value=user)
+        repo = CachedUserRepository(inner_repo, TTLCache())
+
+        asyncio.run(repo.find_by_email("john@example.com"))
+        inner_repo.find_by_email.return_value = user.model_copy(update={"role": "user"})
+        cached = asyncio.run(repo.find_by_email("john@example.com"))
+        fresh = asyncio.run(repo.find_by_email("john@example.com", consistent_read=True))
+
+        assert (cached.role, fresh.role) == ("admin", "user")
+        inner_repo.find_by_email.assert_awaited_with("john@example.com", True)
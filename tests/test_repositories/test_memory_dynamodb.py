@@ -0,0 +1,376 @@
+import asyncio
+import pytest
+from decimal import Decimal
+from unittest.mock import MagicMock
+from boto3.dynamodb.conditions import Attr, Key
+from app.models.models import Booking, Room, User
+from app.repositories.bookings_repo import BookingRepository
+from app.repositories.memory_dynamodb import MemoryDynamoDB
+from app.repositories.rooms_repo import RoomRepository
+from app.repositories.users_repo import UserRepository
+from app.utils.errors import ConflictError, NotFoundError, RoomUnavailableError
+
+TABLE = "MeetingRoomSystem"
+
+
+class TestMemoryDynamoDB:
+
+    @pytest.fixture
+    def table(self):
+        return MemoryDynamoDB().Table(TABLE)
+
+    def test_conditional_put(self, table):
+        table.put_item(Item={"PK": "A", "SK": "1", "N": 1})
+
+        with pytest.raises(table.meta.client.exceptions.ConditionalCheckFailedException):
+            table.put_item(
+                Item={"PK": "A", "SK": "1"},
+                ConditionExpression="attribute_not_exists(PK)",
+            )
+        assert table.get_item(Key={"PK": "A", "SK": "1"})["Item"]["N"] == Decimal(1)
+
+    def test_query_index_with_limit_and_filter(self, table):
+        for i in range(5):
+            table.put_item(Item={"PK": "B", "SK": f"{i}", "RoomID": "r", "StartTime": i})
+
+        page = table.query(
+            IndexName="RoomStartTimeIndex",
+            KeyConditionExpression=Key("RoomID").eq("r") & Key("StartTime").gte(1),
+            FilterExpression=Attr("StartTime").ne(2),
+            Limit=2,
+        )
+
+        assert [item["SK"] for item in page["Items"]] == ["1"]
+        assert page["ScannedCount"] == 2
+
+        rest = table.query(
+            IndexName="RoomStartTimeIndex",
+            KeyConditionExpression=Key("RoomID").eq("r") & Key("StartTime").gte(1),
+            ExclusiveStartKey=page["LastEvaluatedKey"],
+        )
+
+        assert [item["SK"] for item in rest["Items"]] == ["3", "4"]
+        assert "LastEvaluatedKey" not in rest
+
+    def test_update_expression(self, table):
+        table.put_item(Item={"PK": "C", "SK": "1", "Status": "a", "Old": 1})
+
+        table.update_item(
+            Key={"PK": "C", "SK": "1"},
+            UpdateExpression="SET #s = :s, Version = if_not_exists(Version, :zero) + :one REMOVE Old",
+            ExpressionAttributeNames={"#s": "Status"},
+            ExpressionAttributeValues={":s": "b", ":zero": 0, ":one": 1},
+        )
+
+        assert table.get_item(Key={"PK": "C", "SK": "1"})["Item"] == {
+            "PK": "C",
+            "SK": "1",
+            "Status": "b",
+            "Version": Decimal(1),
+        }
+
+    def test_transaction_is_all_or_nothing(self, table):
+        client = table.meta.client
+        table.put_item(Item={"PK": "D", "SK": "2"})
+
+        with pytest.raises(client.exceptions.TransactionCanceledException) as e:
+            client.transact_write_items(
+                TransactItems=[
+                    {"Put": {"TableName": TABLE, "Item": {"PK": "D", "SK": "1"}}},
+                    {
+                        "Put": {
+                            "TableName": TABLE,
+                            "Item": {"PK": "D", "SK": "2"},
+                            "ConditionExpression": "attribute_not_exists(PK)",
+                        }
+                    },
+                ]
+            )
+
+        assert [r["Code"] for r in e.value.response["CancellationReasons"]] == [
+            "None",
+            "ConditionalCheckFailed",
+        ]
+        assert "Item" not in table.get_item(Key={"PK": "D", "SK": "1"})
+
+    def test_latency_is_injected_per_call(self):
+        sleeps = []
+        table = MemoryDynamoDB(latency_seconds=0.005, sleep=sleeps.append).Table(TABLE)
+
+        table.put_item(Item={"PK": "E", "SK": "1"})
+        table.get_item(Key={"PK": "E", "SK": "1"})
+
+        assert sleeps == [0.005, 0.005]
+
+
+class TestRepositoriesOnMemoryDynamoDB:
+
+    @pytest.fixture
+    def dynamodb(self):
+        return MemoryDynamoDB()
+
+    @pytest.fixture
+    def room(self):
+        return Room(
+            id="room-1",
+            name="Everest",
+            room_number=101,
+            capacity=8,
+            floor=1,
+            amenities=["tv"],
+            location="North wing",
+        )
+
+    def booking(self, booking_id, start, end):
+        return Booking(
+            id=booking_id,
+            user_id="user-1",
+            user_name="John Doe",
+            room_id="room-1",
+            room_number=101,
+            start_time=start,
+            end_time=end,
+            purpose="Sync",
+            status="confirmed",
+        )
+
+    def test_booking_lifecycle(self, dynamodb):
+        repo = BookingRepository(dynamodb, TABLE, shard_count=4)
+        day = 1704672000
+        first = self.booking("b-1", day + 3600, day + 7200)
+
+        asyncio.run(repo.create(first))
+        with pytest.raises(RoomUnavailableError):
+            asyncio.run(repo.create(self.booking("b-2", day + 5400, day + 9000)))
+        asyncio.run(repo.create(self.booking("b-3", day + 7200, day + 9000)))
+
+        schedule = asyncio.run(repo.get_by_room_and_time("room-1", day, day + 86400))
+        assert [b.id for b in schedule] == ["b-1", "b-3"]
+        assert len(asyncio.run(repo.get_by_user_id("user-1"))) == 2
+
+        page = asyncio.run(repo.get_all_page(limit=1))
+        assert len(page.items) == 1 and page.next_token
+
+        asyncio.run(repo.cancel(first))
+        with pytest.raises(NotFoundError):
+            asyncio.run(repo.get_by_id("b-1"))
+        asyncio.run(repo.create(self.booking("b-4", day + 3600, day + 7200)))
+
+    def test_room_window_is_bounded_by_the_longest_booking(self, dynamodb):
+        repo = BookingRepository(dynamodb, TABLE, max_booking_duration=3 * 3600)
+        start = 1704672000 + 12 * 3600
+        end = start + 3600
+        for booking in (
+            self.booking("ends-before", start - 3 * 3600 - 900, start - 3 * 3600 + 900),
+            self.booking("longest", start - 3 * 3600 + 900, start + 900),
+            self.booking("starts-at-end", end, end + 900),
+        ):
+            asyncio.run(repo.create(booking))
+
+        found = asyncio.run(repo.get_by_room_and_time("room-1", start, end))
+
+        assert [b.id for b in found] == ["longest"]
+
+    def test_room_window_includes_bookings_from_the_previous_day(self, dynamodb):
+        repo = BookingRepository(dynamodb, TABLE)
+        day = 1704672000
+        for booking in (
+            self.booking("overnight", day - 3600, day + 3600),
+            self.booking("next-day", day + 86400, day + 86400 + 3600),
+        ):
+            asyncio.run(repo.create(booking))
+
+        found = asyncio.run(repo.get_by_room_and_time("room-1", day, day + 86400))
+
+        assert [b.id for b in found] == ["overnight"]
+
+    def test_delete_by_user_id_releases_slots(self, dynamodb):
+        repo = BookingRepository(dynamodb, TABLE)
+        asyncio.run(repo.create(self.booking("b-1", 1704675600, 1704679200)))
+
+        assert asyncio.run(repo.delete_by_user_id("user-1")) == 1
+        assert sorted(item["PK"] for item in dynamodb.items(TABLE)) == [
+            "ROOMDAY#room-1#1704672000",
+            "WATERMARK#BOOKINGS#USER#user-1",
+        ]
+        assert asyncio.run(repo.get_user_watermark("user-1")).version == 3
+
+    def test_interrupted_delete_page_leaves_no_phantom_slots(self, dynamodb):
+        repo = BookingRepository(dynamodb, TABLE)
+        day = 1704672000
+        asyncio.run(repo.create(self.booking("b-1", day + 3600, day + 7200)))
+        batch_write_item = dynamodb.batch_write_item
+        dynamodb.batch_write_item = MagicMock(side_effect=RuntimeError("crash"))
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(repo.delete_by_user_id_page("user-1"))
+        assert asyncio.run(repo.get_room_day("room-1", day)).slots == []
+
+        dynamodb.batch_write_item = batch_write_item
+        deleted, next_token = asyncio.run(repo.delete_by_user_id_page("user-1"))
+        assert [booking.id for booking in deleted] == ["b-1"] and next_token is None
+        assert asyncio.run(repo.get_by_user_id("user-1")) == []
+
+    def test_booking_writes_bump_watermarks(self, dynamodb):
+        repo = BookingRepository(dynamodb, TABLE)
+        day = 1704672000
+        first = self.booking("b-1", day + 3600, day + 7200)
+
+        asyncio.run(repo.create(first))
+        asyncio.run(repo.create_many([self.booking("b-2", day + 7200, day + 9000)]))
+        asyncio.run(repo.cancel(first))
+
+        assert asyncio.run(repo.get_user_watermark("user-1")).version == 3
+        room_day = asyncio.run(repo.get_room_day("room-1", day))
+        assert room_day.version == 3
+        assert [slot.booking_id for slot in room_day.slots] == ["b-2"]
+        assert asyncio.run(repo.get_room_day("room-1", day + 86400)).version == 0
+
+    def test_room_day_documents_follow_bookings(self, dynamodb):
+        repo = BookingRepository(dynamodb, TABLE)
+        day = 1704672000
+        overnight = self.booking("b-1", day + 86400 - 3600, day + 86400 + 3600)
+
+        asyncio.run(
+            repo.create_many(
+                [
+                    self.booking("b-2", day + 7200, day + 9000),
+                    self.booking("b-3", day + 3600, day + 5400),
+                    overnight,
+                ]
+            )
+        )
+
+        first = asyncio.run(repo.get_room_day("room-1", day))
+        second = asyncio.run(repo.get_room_day("room-1", day + 86400))
+        assert [slot.booking_id for slot in first.slots] == ["b-3", "b-2", "b-1"]
+        assert [slot.booking_id for slot in second.slots] == ["b-1"]
+        assert first.slots[0].user_name == "John Doe"
+        assert first.slots[0].purpose == "Sync"
+
+        asyncio.run(repo.delete_by_user_id("user-1"))
+        assert asyncio.run(repo.get_room_day("room-1", day)).slots == []
+        assert asyncio.run(repo.get_room_day("room-1", day + 86400)).slots == []
+
+    def test_room_repository(self, dynamodb, room):
+        repo = RoomRepository(dynamodb, TABLE)
+
+        asyncio.run(repo.create(room))
+        with pytest.raises(ConflictError):
+            asyncio.run(repo.create(room))
+        asyncio.run(repo.update_availability("room-1", "maintenance"))
+        assert asyncio.run(repo.get_watermark()).version == 2
+
+        assert asyncio.run(repo.get_by_id("room-1")).status == "maintenance"
+        assert [r.id for r in asyncio.run(repo.get_all())] == ["room-1"]
+
+    def test_room_number_is_unique_per_floor(self, dynamodb, room):
+        repo = RoomRepository(dynamodb, TABLE, shard_count=2)
+        asyncio.run(repo.create(room))
+        duplicate = room.model_copy(update={"id": "room-2"})
+        other_floor = room.model_copy(update={"id": "room-3", "floor": 2})
+
+        with pytest.raises(ConflictError, match="Room number"):
+            asyncio.run(repo.create(duplicate))
+        asyncio.run(repo.create(other_floor))
+
+        number_key = repo._room_number_key(1, 101)
+        assert "Item" in dynamodb.Table(TABLE).get_item(Key=number_key)
+        assert [r.id for r in asyncio.run(repo.get_by_floor(2))] == ["room-3"]
+
+        asyncio.run(repo.delete_by_id("room-1"))
+        assert "Item" not in dynamodb.Table(TABLE).get_item(Key=number_key)
+        asyncio.run(repo.create(duplicate))
+
+    def test_user_repository(self, dynamodb):
+        repo = UserRepository(dynamodb, TABLE, shard_count=2)
+        user = User(
+            id="user-1",
+            name="John Doe",
+            email="john@example.com",
+            password="hash",
+            role="user",
+        )
+
+        asyncio.run(repo.create(user))
+
+        assert asyncio.run(repo.find_by_email("john@example.com")).id == "user-1"
+        assert list(asyncio.run(repo.get_many(["user-1", "missing"]))) == ["user-1"]
+
+        dynamodb.calls.clear()
+        assert asyncio.run(repo.get_by_id("user-1")).name == "John Doe"
+        assert dynamodb.calls == {"GetItem": 1}
+
+    def test_find_by_email_is_one_read(self, dynamodb):
+        repo = UserRepository(dynamodb, TABLE, shard_count=2)
+        user = User(
+            id="user-1",
+            name="John Doe",
+            email="john@example.com",
+            password="hash",
+            role="user",
+        )
+        asyncio.run(repo.create(user))
+        dynamodb.calls.clear()
+
+        found = asyncio.run(repo.find_by_email("john@example.com"))
+
+        assert (found.password, found.role, found.name) == ("hash", "user", "John Doe")
+        assert dynamodb.calls == {"GetItem": 1}
+
+    def test_find_by_email_follows_legacy_pointer_items(self, dynamodb):
+        repo = UserRepository(dynamodb, TABLE, shard_count=2)
+        user = User(
+            id="user-1",
+            name="John Doe",
+            email="john@example.com",
+            password="hash",
+            role="user",
+        )
+        asyncio.run(repo.create(user))
+        dynamodb.Table(TABLE).put_item(
+            Item={**repo._email_key(user.email), "ID": user.id}
+        )
+
+        assert asyncio.run(repo.find_by_email("john@example.com")).password == "hash"
+
+    def test_update_password_only_replaces_the_expected_hash(self, dynamodb):
+        repo = UserRepository(dynamodb, TABLE, shard_count=2)
+        user = User(
+            id="user-1",
+            name="John Doe",
+            email="john@example.com",
+            password="hash",
+            role="user",
+        )
+        asyncio.run(repo.create(user))
+        asyncio.run(repo.update(user.model_copy(update={"role": "admin"})))
+
+        assert asyncio.run(repo.update_password(user, "hash", "rehashed"))
+        assert not asyncio.run(repo.update_password(user, "hash", "other"))
+
+        for found in (
+            asyncio.run(repo.get_by_id("user-1")),
+            asyncio.run(repo.find_by_email("john@example.com")),
+        ):
+            assert (found.password, found.role) == ("rehashed", "admin")
+
+    def test_update_rewrites_email_item(self, dynamodb):
+        repo = UserRepository(dynamodb, TABLE, shard_count=2)
+        user = User(
+            id="user-1",
+            name="John Doe",
+            email="john@example.com",
+            password="hash",
+            role="user",
+        )
+        asyncio.run(repo.create(user))
+
+        asyncio.run(repo.update(user.model_copy(update={"role": "admin"})))
+        assert asyncio.run(repo.find_by_email("john@example.com")).role == "admin"
+
+        moved = user.model_copy(update={"email": "jd@example.com", "password": "new"})
+        asyncio.run(repo.update(moved, old_email=user.email))
+        assert asyncio.run(repo.find_by_email("jd@example.com")).password == "new"
+        with pytest.raises(NotFoundError):
+            asyncio.run(repo.find_by_email("john@example.com"))
@@ -0,0 +1,325 @@
+import asyncio
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from app.models.models import Booking, Recurrence, Room, RoomDay, ScheduleSlot, User
+from app.repositories.bookings_repo import BookingRepository
+from app.repositories.memory_dynamodb import MemoryDynamoDB
+from app.repositories.rooms_repo import RoomRepository
+from app.repositories.users_repo import UserRepository
+from app.services.bookings_service import BookingService
+from app.config.config import settings
+from app.utils.errors import InvalidInputError, TimeRangeInvalidError
+
+
+class TestBookingService:
+
+    @pytest.fixture
+    def sample_room(self):
+        return Room(
+            id="room-1",
+            name="Everest",
+            room_number=101,
+            capacity=8,
+            floor=1,
+            amenities=[],
+            location="North wing",
+        )
+
+    @pytest.fixture
+    def bookings(self):
+        return [
+            Booking(
+                id=f"booking-{i}",
+                user_id=f"user-{i % 2}",
+                user_name=f"User {i % 2}",
+                room_id="room-1",
+                room_number=101,
+                start_time=1704700800 + i * 3600,
+                end_time=1704700800 + i * 3600 + 1800,
+                purpose="Sync",
+                status="confirmed",
+            )
+            for i in range(4)
+        ]
+
+    @pytest.fixture
+    def service(self, sample_room, bookings):
+        booking_repo = MagicMock()
+        booking_repo.get_by_room_id = AsyncMock(return_value=bookings)
+        booking_repo.get_room_day = AsyncMock(
+            return_value=RoomDay(
+                room_id="room-1",
+                date=1704672000,
+                slots=[
+                    ScheduleSlot(
+                        start_time=b.start_time,
+                        end_time=b.end_time,
+                        is_booked=True,
+                        booking_id=b.id,
+                        user_name=b.user_name,
+                        purpose=b.purpose,
+                    )
+                    for b in bookings
+                ],
+                version=4,
+                updated_at=1704700000,
+            )
+        )
+        room_repo = MagicMock()
+        room_repo.get_by_id = AsyncMock(return_value=sample_room)
+        user_repo = MagicMock()
+        user_repo.get_by_id = AsyncMock()
+        user_repo.get_many = AsyncMock(
+            return_value={
+                f"user-{i}": User(
+                    id=f"user-{i}",
+                    name=f"User {i}",
+                    email=f"user{i}@example.com",
+                    password="hashed",
+                    role="user",
+                )
+                for i in range(2)
+            }
+        )
+        return BookingService(booking_repo, room_repo, user_repo)
+
+    def test_schedule_is_read_from_the_room_day_document(self, service):
+        schedule = asyncio.run(service.get_room_schedule_by_date("room-1", 1704672000))
+
+        assert schedule.version == 4
+        service.booking_repo.get_room_day.assert_awaited_once_with(
+            "room-1", 1704672000
+        )
+
+        assert [slot.user_name for slot in schedule.bookings] == [
+            "User 0",
+            "User 1",
+            "User 0",
+            "User 1",
+        ]
+        service.user_repo.get_by_id.assert_not_awaited()
+        service.user_repo.get_many.assert_not_awaited()
+
+    def test_detailed_bookings_resolve_users_in_one_batch(self, service):
+        detailed = asyncio.run(service.get_bookings_with_details_by_room_id("room-1"))
+
+        assert len(detailed) == 4
+        assert detailed[1].user_email == "user1@example.com"
+        service.user_repo.get_many.assert_awaited_once()
+        service.user_repo.get_by_id.assert_not_awaited()
+
+
+class TestBulkBookings:
+
+    @pytest.fixture
+    def dynamodb(self):
+        return MemoryDynamoDB()
+
+    @pytest.fixture
+    def service(self, dynamodb):
+        table = "MeetingRoomSystem"
+        user_repo = UserRepository(dynamodb, table)
+        room_repo = RoomRepository(dynamodb, table)
+        asyncio.run(
+            user_repo.create(
+                User(
+                    id="user-1",
+                    name="John",
+                    email="j@example.com",
+                    password="x",
+                    role="user",
+                )
+            )
+        )
+        for number in (1, 2):
+            asyncio.run(
+                room_repo.create(
+                    Room(
+                        id=f"room-{number}",
+                        name=f"Room {number}",
+                        room_number=100 + number,
+                        capacity=8,
+                        floor=1,
+                        amenities=[],
+                        location="North wing",
+                    )
+                )
+            )
+        return BookingService(BookingRepository(dynamodb, table), room_repo, user_repo)
+
+    @pytest.fixture
+    def start(self):
+        return (int(time.time()) // 86400 + 1) * 86400 + 9 * 3600
+
+    def request(self, room_id, start, end, recurrence=None):
+        return SimpleNamespace(
+            room_id=room_id,
+            start_time=start,
+            end_time=end,
+            purpose="Standup",
+            recurrence=recurrence,
+        )
+
+    def test_recurring_series_uses_few_round_trips(self, service, dynamodb, start):
+        dynamodb.calls.clear()
+
+        results = asyncio.run(
+            service.create_bookings_bulk(
+                "user-1",
+                [
+                    self.request(
+                        "room-1",
+                        start,
+                        start + 3600,
+                        Recurrence(frequency="daily", count=8),
+                    )
+                ],
+            )
+        )
+
+        assert [r.status for r in results] == ["created"] * 8
+        assert results[7].start_time == start + 7 * 86400
+        assert sum(dynamodb.calls.values()) <= 5
+        assert len(asyncio.run(service.booking_repo.get_by_user_id("user-1"))) == 8
+
+    def test_reports_per_item_outcomes(self, service, start):
+        asyncio.run(
+            service.create_booking(
+                Booking(
+                    user_id="user-1",
+                    room_id="room-1",
+                    start_time=start,
+                    end_time=start + 3600,
+                    purpose="Existing",
+                )
+            )
+        )
+
+        results = asyncio.run(
+            service.create_bookings_bulk(
+                "user-1",
+                [
+                    self.request("room-1", start + 1800, start + 5400),
+                    self.request("room-2", start, start + 3600),
+                    self.request("room-2", start + 1800, start + 3600),
+                    self.request("room-9", start, start + 3600),
+                    self.request("room-1", start + 3600, start),
+                ],
+            )
+        )
+
+        assert [r.status for r in results] == [
+            "conflict",
+            "created",
+            "conflict",
+            "not_found",
+            "invalid",
+        ]
+        assert results[1].booking_id
+
+    def test_adjacent_bookings_do_not_conflict(self, service, start):
+        for offset in (0, 900):
+            asyncio.run(
+                service.create_booking(
+                    Booking(
+                        user_id="user-1",
+                        room_id="room-1",
+                        start_time=start + offset,
+                        end_time=start + offset + 900,
+                        purpose="Back to back",
+                    )
+                )
+            )
+
+        assert len(asyncio.run(service.booking_repo.get_by_user_id("user-1"))) == 2
+
+    def test_rejects_times_off_slot_boundaries(self, service, start):
+        with pytest.raises(InvalidInputError):
+            asyncio.run(
+                service.create_booking(
+                    Booking(
+                        user_id="user-1",
+                        room_id="room-1",
+                        start_time=start,
+                        end_time=start + 600,
+                        purpose="Short",
+                    )
+                )
+            )
+
+        results = asyncio.run(
+            service.create_bookings_bulk(
+                "user-1", [self.request("room-1", start + 600, start + 1800)]
+            )
+        )
+
+        assert [r.status for r in results] == ["invalid"]
+
+    def test_rejects_bookings_longer_than_the_cap(self, service, start):
+        with pytest.raises(TimeRangeInvalidError):
+            asyncio.run(
+                service.create_booking(
+                    Booking(
+                        user_id="user-1",
+                        room_id="room-1",
+                        start_time=start,
+                        end_time=start
+                        + settings.MAX_BOOKING_DURATION_HOURS * 3600
+                        + 900,
+                        purpose="Offsite",
+                    )
+                )
+            )
+
+    def test_write_race_is_reported_as_conflict(self, service, start):
+        service.booking_repo.get_by_room_and_time = AsyncMock(return_value=[])
+        asyncio.run(
+            service.create_bookings_bulk(
+                "user-1", [self.request("room-1", start, start + 3600)]
+            )
+        )
+
+        results = asyncio.run(
+            service.create_bookings_bulk(
+                "user-1",
+                [
+                    self.request("room-1", start, start + 1800),
+                    self.request("room-1", start + 3600, start + 7200),
+                ],
+            )
+        )
+
+        assert [r.status for r in results] == ["conflict", "created"]
+
+    def test_schedule_grid_reads_room_days_in_one_batch(
+        self, service, dynamodb, start
+    ):
+        asyncio.run(
+            service.create_bookings_bulk(
+                "user-1",
+                [
+                    self.request(
+                        "room-1",
+                        start,
+                        start + 3600,
+                        Recurrence(frequency="daily", count=3),
+                    ),
+                    self.request("room-2", start + 3600, start + 5400),
+                ],
+            )
+        )
+        day = (start // 86400) * 86400
+        dynamodb.calls.clear()
+
+        grid = asyncio.run(service.get_schedule_grid(day, 7, floor=1))
+
+        assert dynamodb.calls == {"Query": 1, "BatchGetItem": 1}
+        assert [room.room_id for room in grid.rooms] == ["room-1", "room-2"]
+        assert grid.rooms[0].starts == [
+            start - day + i * 86400 for i in range(3)
+        ]
+        assert grid.rooms[1].ends == [start + 5400 - day]
+        assert grid.rooms[1].user_names == ["John"]
+        assert len(grid.versions) == 14
@@ -0,0 +1,282 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from app.models.models import Booking, User
+from app.repositories.bookings_repo import BookingRepository
+from app.repositories.jobs_repo import JobRepository
+from app.repositories.memory_dynamodb import MemoryDynamoDB
+from app.repositories.users_repo import UserRepository
+from app.services.jobs_service import DELETE_USER_BOOKINGS, JobService
+from app.services.users_service import UserService
+from app.utils.availability_index import AvailabilityIndex
+from app.utils.errors import NotFoundError
+from app.utils.request_trace import RequestTrace, current_trace
+
+TABLE = "MeetingRoomSystem"
+
+
+class TestJobService:
+
+    @pytest.fixture
+    def dynamodb(self):
+        return MemoryDynamoDB()
+
+    @pytest.fixture
+    def booking_repo(self, dynamodb):
+        repo = BookingRepository(dynamodb, TABLE, shard_count=2)
+        day = 1704672000
+        for i in range(5):
+            asyncio.run(
+                repo.create(
+                    Booking(
+                        id=f"b-{i}",
+                        user_id="user-1",
+                        user_name="John",
+                        room_id="room-1",
+                        room_number=101,
+                        start_time=day + i * 3600,
+                        end_time=day + i * 3600 + 1800,
+                        purpose="Sync",
+                        status="confirmed",
+                    )
+                )
+            )
+        return repo
+
+    @pytest.fixture
+    def service(self, dynamodb, booking_repo):
+        return JobService(
+            JobRepository(dynamodb, TABLE),
+            booking_repo,
+            UserRepository(dynamodb, TABLE),
+            page_size=2,
+        )
+
+    def remaining_bookings(self, dynamodb):
+        return [
+            item for item in dynamodb.items(TABLE) if item["SK"].startswith("BOOKING#")
+        ]
+
+    def test_deletes_every_page_and_checkpoints(self, service, dynamodb):
+        save_progress = service.job_repo.save_progress
+        checkpoints = []
+
+        async def record(job, owner, lease_seconds):
+            checkpoints.append((job.status, job.processed, job.checkpoint))
+            await save_progress(job, owner, lease_seconds)
+
+        service.job_repo.save_progress = record
+
+        async def run():
+            job = await service.create_user_bookings_deletion("user-1")
+            return await service.run(job)
+
+        job = asyncio.run(run())
+
+        assert job.status == "completed" and job.processed == 5
+        assert self.remaining_bookings(dynamodb) == []
+        assert [c[0] for c in checkpoints] == ["running", "running", "completed"]
+        assert all(c[2] for c in checkpoints[:-1]) and checkpoints[-1][2] is None
+        stored = asyncio.run(service.get_job(job.id))
+        assert stored.status == "completed" and stored.processed == 5
+
+    def test_deleted_bookings_leave_the_availability_index(
+        self, service, booking_repo
+    ):
+        day = 1704672000
+        service.availability_index = AvailabilityIndex(booking_repo.get_by_date_range)
+
+        async def run():
+            view = await service.availability_index.prepare(day, day + 86400)
+            assert not view.is_free("room-1", day, day + 86400)
+            job = await service.create_user_bookings_deletion("user-1")
+            await service.run(job)
+            return view
+
+        view = asyncio.run(run())
+
+        assert view.is_free("room-1", day, day + 86400)
+
+    def test_user_check_reads_consistently(self, service):
+        service.user_repo.get_by_id = AsyncMock(side_effect=NotFoundError("gone"))
+
+        async def run():
+            job = await service.create_user_bookings_deletion("user-1")
+            return await service.run(job)
+
+        assert asyncio.run(run()).status == "completed"
+        service.user_repo.get_by_id.assert_awaited_once_with(
+            "user-1", consistent_read=True
+        )
+
+    def test_started_job_does_not_join_the_request_trace(self, service, dynamodb):
+        trace = RequestTrace()
+
+        async def run():
+            token = current_trace.set(trace)
+            try:
+                job = await service.create_user_bookings_deletion("user-1")
+                calls = len(trace.calls)
+                service.start(job)
+            finally:
+                current_trace.reset(token)
+            await asyncio.gather(*service._tasks.values())
+            return calls
+
+        calls = asyncio.run(run())
+
+        assert len(trace.calls) == calls
+        assert self.remaining_bookings(dynamodb) == []
+
+    def test_resumes_from_checkpoint_after_lease_expires(
+        self, service, dynamodb, booking_repo
+    ):
+        async def crash_after_first_page():
+            job = await service.create_user_bookings_deletion("user-1")
+            await service.job_repo.claim(job.id, "dead-worker", 0)
+            deleted, job.checkpoint = await booking_repo.delete_by_user_id_page(
+                "user-1", None, 2
+            )
+            job.processed = len(deleted)
+            job.status = "running"
+            await service.job_repo.save_progress(job, "dead-worker", -1)
+
+        asyncio.run(crash_after_first_page())
+        assert len(self.remaining_bookings(dynamodb)) == 3
+
+        async def restart():
+            assert await service.resume_unfinished() == 1
+            await asyncio.gather(*service._tasks.values())
+
+        asyncio.run(restart())
+
+        assert asyncio.run(service.job_repo.get_unfinished()) == []
+        assert self.remaining_bookings(dynamodb) == []
+
+    def test_restart_within_the_lease_resumes_the_job(
+        self, service, dynamodb, booking_repo
+    ):
+        delete_page = booking_repo.delete_by_user_id_page
+
+        async def run():
+            release = asyncio.Event()
+
+            async def stalled(*args):
+                await release.wait()
+                return await delete_page(*args)
+
+            booking_repo.delete_by_user_id_page = stalled
+            job = await service.create_user_bookings_deletion("user-1")
+            service.start(job)
+            await asyncio.sleep(0.01)
+            await service.shutdown()
+            booking_repo.delete_by_user_id_page = delete_page
+
+            replacement = JobService(
+                JobRepository(dynamodb, TABLE),
+                booking_repo,
+                UserRepository(dynamodb, TABLE),
+                page_size=2,
+            )
+            assert await replacement.resume_unfinished() == 1
+            await asyncio.gather(*replacement._tasks.values())
+            return await replacement.get_job(job.id)
+
+        job = asyncio.run(run())
+
+        assert job.status == "completed" and job.processed == 5
+        assert self.remaining_bookings(dynamodb) == []
+
+    def test_sweep_resumes_unfinished_jobs(self, service, dynamodb):
+        service.lease_seconds = 0.01
+
+        async def run():
+            job = await service.create_user_bookings_deletion("user-1")
+            service.start_sweeping()
+            await asyncio.sleep(0.05)
+            await service.shutdown()
+            return await service.get_job(job.id)
+
+        job = asyncio.run(run())
+
+        assert job.status == "completed" and job.processed == 5
+        assert self.remaining_bookings(dynamodb) == []
+
+    def test_finished_jobs_expire(self, service, dynamodb):
+        async def run():
+            job = await service.create_user_bookings_deletion("user-1")
+            return await service.run(job)
+
+        job = asyncio.run(run())
+
+        (item,) = [i for i in dynamodb.items(TABLE) if i["PK"] == "JOB"]
+        assert item["ExpiresAt"] == job.updated_at + 7 * 86400
+
+    def test_leased_job_is_left_to_its_owner(self, service, dynamodb):
+        async def run():
+            job = await service.create_user_bookings_deletion("user-1")
+            await service.job_repo.claim(job.id, "other-worker", 60)
+            return await service.run(job)
+
+        asyncio.run(run())
+
+        assert len(self.remaining_bookings(dynamodb)) == 5
+
+    def test_pending_job_fails_if_user_still_exists(self, service, dynamodb):
+        asyncio.run(
+            service.user_repo.create(
+                User(
+                    id="user-1",
+                    name="John",
+                    email="j@example.com",
+                    password="x",
+                    role="user",
+                )
+            )
+        )
+
+        async def run():
+            job = await service.create_user_bookings_deletion("user-1")
+            return await service.run(job)
+
+        job = asyncio.run(run())
+
+        assert job.status == "failed" and job.error == "User still exists"
+        assert len(self.remaining_bookings(dynamodb)) == 5
+
+    def test_user_deletion_returns_a_job(self, service, dynamodb):
+        user_repo = service.user_repo
+        asyncio.run(
+            user_repo.create(
+                User(
+                    id="user-1",
+                    name="John",
+                    email="j@example.com",
+                    password="x",
+                    role="user",
+                )
+            )
+        )
+        user_service = UserService(user_repo, job_service=service)
+
+        async def run():
+            job = await user_service.delete_user_by_id("user-1", "admin-1")
+            await asyncio.gather(*service._tasks.values())
+            return job
+
+        job = asyncio.run(run())
+
+        assert job.type == DELETE_USER_BOOKINGS
+        stored = asyncio.run(service.get_job(job.id))
+        assert stored.status == "completed" and stored.processed == 5
+        assert self.remaining_bookings(dynamodb) == []
+
+    def test_failed_user_deletion_abandons_the_job(self, service):
+        user_service = UserService(AsyncMock(), job_service=service)
+        user_service.user_repo.delete_by_id.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(user_service.delete_user_by_id("user-1234567", "admin-1"))
+
+        jobs = asyncio.run(service.job_repo.get_unfinished())
+        assert jobs == []
@@ -0,0 +1,124 @@
+import asyncio
+import pytest
+from app.models.models import Booking, Room
+from app.repositories.bookings_repo import BookingRepository
+from app.repositories.memory_dynamodb import MemoryDynamoDB
+from app.repositories.rooms_repo import RoomRepository
+from app.services.rooms_service import RoomService
+from app.utils.availability_index import AvailabilityIndex
+from app.utils.errors import ConflictError, InvalidInputError
+
+DAY = 1704672000
+
+
+class TestRoomService:
+
+    @pytest.fixture
+    def dynamodb(self):
+        return MemoryDynamoDB()
+
+    @pytest.fixture
+    def booking_repo(self, dynamodb):
+        return BookingRepository(dynamodb, "MeetingRoomSystem")
+
+    @pytest.fixture
+    def service(self, dynamodb, booking_repo):
+        return RoomService(
+            RoomRepository(dynamodb, "MeetingRoomSystem"),
+            AvailabilityIndex(booking_repo.get_by_date_range),
+        )
+
+    def room(self, number, floor=1, capacity=6, amenities=None):
+        return Room(
+            name=f"Room {number}",
+            room_number=number,
+            capacity=capacity,
+            floor=floor,
+            amenities=amenities or [],
+            location="North wing",
+        )
+
+    def test_add_room_rejects_duplicate_number_on_floor(self, service):
+        asyncio.run(service.add_room(self.room(101)))
+        asyncio.run(service.add_room(self.room(101, floor=2)))
+
+        with pytest.raises(ConflictError):
+            asyncio.run(service.add_room(self.room(101)))
+
+    def test_get_all_rooms_pages(self, service):
+        for number in range(101, 106):
+            asyncio.run(service.add_room(self.room(number)))
+
+        first = asyncio.run(service.get_all_rooms(limit=3))
+        second = asyncio.run(service.get_all_rooms(limit=3, next_token=first.next_token))
+
+        assert len(first.items) == 3
+        assert len(second.items) == 2
+        assert second.next_token is None
+
+    def test_search_available_rooms(self, service, booking_repo, dynamodb):
+        asyncio.run(service.add_room(self.room(101, capacity=4)))
+        asyncio.run(service.add_room(self.room(102, capacity=10, amenities=["tv"])))
+        asyncio.run(service.add_room(self.room(103, capacity=10, amenities=["tv"])))
+        rooms = {r.room_number: r for r in asyncio.run(service.get_all_rooms()).items}
+        asyncio.run(
+            booking_repo.create(
+                Booking(
+                    id="b-1",
+                    user_id="user-1",
+                    room_id=rooms[102].id,
+                    start_time=DAY + 9 * 3600,
+                    end_time=DAY + 17 * 3600,
+                    purpose="Offsite",
+                )
+            )
+        )
+        dynamodb.calls.clear()
+
+        free = asyncio.run(
+            service.search_available_rooms(
+                start_time=DAY + 10 * 3600,
+                end_time=DAY + 11 * 3600,
+                min_capacity=8,
+                amenities=["tv"],
+            )
+        )
+        assert [r.room.room_number for r in free] == [103]
+
+        long_gaps = asyncio.run(
+            service.search_available_rooms(date=DAY, duration=10 * 3600)
+        )
+        assert sorted(r.room.room_number for r in long_gaps) == [101, 103]
+        # Two room listings and a single DateIndex read for the day.
+        assert dynamodb.calls == {"Query": 3}
+
+    def test_search_requires_a_time_window(self, service):
+        with pytest.raises(InvalidInputError):
+            asyncio.run(service.search_available_rooms(min_capacity=4))
+
+    def test_get_all_rooms_filters_on_indexes(self, service, dynamodb):
+        asyncio.run(service.add_room(self.room(101, floor=0, capacity=4)))
+        asyncio.run(
+            service.add_room(self.room(102, floor=0, capacity=12, amenities=["tv"]))
+        )
+        asyncio.run(
+            service.add_room(self.room(201, floor=2, capacity=20, amenities=["tv"]))
+        )
+        asyncio.run(service.add_room(self.room(202, floor=2, capacity=8)))
+
+        def numbers(**filters):
+            page = asyncio.run(service.get_all_rooms(**filters))
+            return sorted(r.room_number for r in page.items)
+
+        assert numbers(floor=0) == [101, 102]
+        assert numbers(min_capacity=10) == [102, 201]
+        assert numbers(floor=2, min_capacity=10) == [201]
+        assert numbers(amenities=["tv"]) == [102, 201]
+        assert numbers(status="available", floor=2) == [201, 202]
+
+        first = asyncio.run(service.get_all_rooms(limit=1, min_capacity=8))
+        second = asyncio.run(
+            service.get_all_rooms(limit=5, next_token=first.next_token, min_capacity=8)
+        )
+        assert len(first.items) == 1
+        assert len(second.items) == 2
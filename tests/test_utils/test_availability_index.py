@@ -0,0 +1,143 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from app.models.models import Booking
+from app.utils.errors import InvalidInputError
+from app.utils.availability_index import AvailabilityIndex
+
+DAY = 1704672000
+
+
+def booking(booking_id, room_id, start, end):
+    return Booking(
+        id=booking_id,
+        user_id="user-1",
+        room_id=room_id,
+        start_time=start,
+        end_time=end,
+        purpose="Sync",
+    )
+
+
+class TestAvailabilityIndex:
+
+    @pytest.fixture
+    def loader(self):
+        return AsyncMock(
+            return_value=[
+                booking("b-1", "room-1", DAY + 3600, DAY + 7200),
+                booking("b-2", "room-1", DAY + 10800, DAY + 14400),
+                # Starts the previous evening and spills into DAY.
+                booking("b-3", "room-2", DAY - 3600, DAY + 1800),
+            ]
+        )
+
+    def test_one_load_per_day(self, loader):
+        index = AvailabilityIndex(loader)
+
+        async def run():
+            await asyncio.gather(
+                index.prepare(DAY, DAY + 86400), index.prepare(DAY, DAY + 86400)
+            )
+            await index.prepare(DAY + 3600, DAY + 7200)
+
+        asyncio.run(run())
+
+        loader.assert_awaited_once_with(DAY - 86400, DAY)
+
+    def test_cancelled_caller_does_not_cancel_the_shared_load(self, loader):
+        index = AvailabilityIndex(loader)
+
+        async def run():
+            started, release = asyncio.Event(), asyncio.Event()
+            bookings = loader.return_value
+
+            async def slow_load(start, end):
+                started.set()
+                await release.wait()
+                return bookings
+
+            loader.side_effect = slow_load
+            first = asyncio.create_task(index.prepare(DAY, DAY + 86400))
+            await started.wait()
+            second = asyncio.create_task(index.prepare(DAY, DAY + 86400))
+            await asyncio.sleep(0)
+            first.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        view = asyncio.run(run())
+
+        assert not view.is_free("room-1", DAY + 3600, DAY + 7200)
+        assert index.loads == 1
+
+    def test_free_windows(self, loader):
+        view = asyncio.run(AvailabilityIndex(loader).prepare(DAY, DAY + 86400))
+
+        assert view.free_windows("room-1", DAY, DAY + 86400, 3600) == [
+            (DAY, DAY + 3600),
+            (DAY + 7200, DAY + 10800),
+            (DAY + 14400, DAY + 86400),
+        ]
+        assert view.free_windows("room-1", DAY, DAY + 86400, 4000) == [
+            (DAY + 14400, DAY + 86400)
+        ]
+        assert not view.is_free("room-2", DAY, DAY + 900)
+        assert view.is_free("room-2", DAY + 1800, DAY + 3600)
+
+    def test_incremental_updates(self, loader):
+        index = AvailabilityIndex(loader)
+        view = asyncio.run(index.prepare(DAY, DAY + 86400))
+        added = booking("b-4", "room-3", DAY + 600, DAY + 1200)
+
+        index.add(added)
+        assert not view.is_free("room-3", DAY, DAY + 3600)
+
+        index.remove(added)
+        assert view.is_free("room-3", DAY, DAY + 3600)
+
+    def test_writes_during_load_are_kept(self):
+        index = AvailabilityIndex(None)
+        added = booking("b-5", "room-1", DAY + 600, DAY + 1200)
+
+        async def load(start, end):
+            index.add(added)
+            return []
+
+        index._load_bookings = load
+        view = asyncio.run(index.prepare(DAY, DAY + 86400))
+
+        assert not view.is_free("room-1", DAY, DAY + 3600)
+
+    def test_expired_day_is_reloaded(self, loader):
+        index = AvailabilityIndex(loader, ttl_seconds=0)
+
+        asyncio.run(index.prepare(DAY, DAY + 86400))
+        asyncio.run(index.prepare(DAY, DAY + 86400))
+
+        assert loader.await_count == 2
+
+    def test_window_longer_than_capacity_is_rejected(self, loader):
+        index = AvailabilityIndex(loader, max_days=12)
+
+        with pytest.raises(InvalidInputError):
+            asyncio.run(index.prepare(DAY, DAY + 20 * 86400))
+        loader.assert_not_awaited()
+
+    def test_view_survives_eviction_by_another_search(self, loader):
+        index = AvailabilityIndex(loader, max_days=1)
+
+        async def run():
+            first = await index.prepare(DAY, DAY + 86400)
+            await index.prepare(DAY + 86400, DAY + 2 * 86400)
+            return first
+
+        view = asyncio.run(run())
+
+        assert list(index._days) == [DAY + 86400]
+        assert not view.is_free("room-1", DAY + 3600, DAY + 7200)
+        with pytest.raises(InvalidInputError):
+            view.is_free("room-1", DAY + 86400, DAY + 86400 + 60)
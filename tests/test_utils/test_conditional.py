@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock
+from app.utils.conditional import make_etag, not_modified
+
+
+def request_with(headers):
+    request = MagicMock()
+    request.headers = {key.lower(): value for key, value in headers.items()}
+    return request
+
+
+class TestConditional:
+
+    def test_make_etag_is_strong_and_stable(self):
+        etag = make_etag("rooms", 3, "floor=1")
+
+        assert etag == make_etag("rooms", 3, "floor=1")
+        assert etag != make_etag("rooms", 4, "floor=1")
+        assert etag.startswith('"') and not etag.startswith("W/")
+
+    def test_if_none_match_lists_and_wildcard(self):
+        etag = make_etag("rooms", 3)
+
+        assert not_modified(request_with({"If-None-Match": f'"x", {etag}'}), etag)
+        assert not_modified(request_with({"If-None-Match": "*"}), etag)
+        assert not_modified(request_with({"If-None-Match": '"x"'}), etag) is None
+
+    def test_if_none_match_takes_precedence_over_if_modified_since(self):
+        request = request_with(
+            {
+                "If-None-Match": '"x"',
+                "If-Modified-Since": "Mon, 08 Jan 2024 07:46:40 GMT",
+            }
+        )
+
+        assert not_modified(request, make_etag("rooms"), 1704700000) is None
+
+    def test_if_modified_since(self):
+        etag = make_etag("room")
+        since = {"If-Modified-Since": "Mon, 08 Jan 2024 07:46:40 GMT"}
+
+        response = not_modified(request_with(since), etag, 1704700000)
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert not_modified(request_with(since), etag, 1704700001) is None
+        assert not_modified(request_with(since), etag, None) is None
+        assert not_modified(
+            request_with({"If-Modified-Since": "garbage"}), etag, 1704700000
+        ) is None
@@ -0,0 +1,120 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+from app.utils.dynamo_batch import batch_get_items, batch_write_items
+from app.utils.dynamo_executor import DynamoExecutor
+from app.utils.errors import ServiceUnavailableError
+
+
+def delete(i):
+    return {"DeleteRequest": {"Key": {"PK": f"P#{i}", "SK": "S"}}}
+
+
+def key(i):
+    return {"PK": f"P#{i}", "SK": "S"}
+
+
+class TestBatchGetItems:
+
+    @pytest.fixture
+    def executor(self):
+        executor = DynamoExecutor(max_workers=4)
+        yield executor
+        executor.shutdown()
+
+    def test_chunks_and_retries_unprocessed_keys(self, executor):
+        dynamodb = MagicMock()
+        sent = []
+
+        def batch_get_item(RequestItems):
+            request = RequestItems["T"]
+            sent.append((len(request["Keys"]), request["ConsistentRead"]))
+            # Throttle the last key of every first attempt.
+            if len(request["Keys"]) > 1:
+                return {
+                    "Responses": {"T": request["Keys"][:-1]},
+                    "UnprocessedKeys": {"T": {**request, "Keys": request["Keys"][-1:]}},
+                }
+            return {"Responses": {"T": request["Keys"]}}
+
+        dynamodb.meta.client.batch_get_item.side_effect = batch_get_item
+
+        items = asyncio.run(
+            batch_get_items(
+                executor,
+                dynamodb,
+                "T",
+                [key(i) for i in range(150)],
+                consistent_read=True,
+                base_delay=0,
+            )
+        )
+
+        assert sorted(item["PK"] for item in items) == sorted(
+            key(i)["PK"] for i in range(150)
+        )
+        assert sorted(sent) == [(1, True), (1, True), (50, True), (100, True)]
+
+    def test_gives_up_after_max_attempts(self, executor):
+        dynamodb = MagicMock()
+        dynamodb.meta.client.batch_get_item.side_effect = lambda RequestItems: {
+            "UnprocessedKeys": RequestItems
+        }
+
+        with pytest.raises(ServiceUnavailableError):
+            asyncio.run(
+                batch_get_items(
+                    executor, dynamodb, "T", [key(0)], max_attempts=3, base_delay=0
+                )
+            )
+        assert dynamodb.meta.client.batch_get_item.call_count == 3
+
+
+class TestBatchWriteItems:
+
+    @pytest.fixture
+    def executor(self):
+        executor = DynamoExecutor(max_workers=4)
+        yield executor
+        executor.shutdown()
+
+    def test_chunks_and_retries_unprocessed_items(self, executor):
+        dynamodb = MagicMock()
+        sent = []
+
+        def batch_write_item(RequestItems):
+            chunk = RequestItems["T"]
+            sent.append(len(chunk))
+            # Throttle the last item of every first attempt.
+            if len(chunk) > 1:
+                return {"UnprocessedItems": {"T": chunk[-1:]}}
+            return {}
+
+        dynamodb.meta.client.batch_write_item.side_effect = batch_write_item
+
+        asyncio.run(
+            batch_write_items(
+                executor, dynamodb, "T", [delete(i) for i in range(30)], base_delay=0
+            )
+        )
+
+        assert sorted(sent) == [1, 1, 5, 25]
+
+    def test_gives_up_after_max_attempts(self, executor):
+        dynamodb = MagicMock()
+        dynamodb.meta.client.batch_write_item.side_effect = lambda RequestItems: {
+            "UnprocessedItems": RequestItems
+        }
+
+        with pytest.raises(ServiceUnavailableError):
+            asyncio.run(
+                batch_write_items(
+                    executor,
+                    dynamodb,
+                    "T",
+                    [delete(0)],
+                    max_attempts=3,
+                    base_delay=0,
+                )
+            )
+        assert dynamodb.meta.client.batch_write_item.call_count == 3
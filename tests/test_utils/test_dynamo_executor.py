@@ -0,0 +1,27 @@
+import asyncio
+import threading
+from app.utils.dynamo_executor import DynamoExecutor
+
+
+class TestDynamoExecutor:
+
+    def test_tracks_in_flight_and_queued_calls(self):
+        executor = DynamoExecutor(max_workers=1)
+        release = threading.Event()
+
+        async def run():
+            calls = [
+                asyncio.ensure_future(executor.run(release.wait, 5)) for _ in range(3)
+            ]
+            await asyncio.sleep(0.05)
+            busy = (executor.in_flight, executor.queue_depth)
+            release.set()
+            await asyncio.gather(*calls)
+            return busy
+
+        busy = asyncio.run(run())
+        executor.shutdown()
+
+        assert busy == (1, 2)
+        assert executor.in_flight == 0
+        assert executor.queue_depth == 0
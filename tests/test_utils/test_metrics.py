@@ -0,0 +1,58 @@
+import asyncio
+from app.repositories.instrumented_repos import InstrumentedRepository
+from app.repositories.memory_dynamodb import MemoryDynamoDB
+from app.repositories.rooms_repo import RoomRepository
+from app.utils.dynamo_executor import DynamoExecutor
+from app.utils.errors import NotFoundError
+from app.utils.metrics import Histogram, Metrics
+
+
+class TestMetrics:
+
+    def test_histogram_renders_cumulative_buckets(self):
+        histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+        histogram.observe(0.05, "/a")
+        histogram.observe(0.5, "/a")
+        histogram.observe(5, "/a")
+
+        assert histogram.render()[2:] == [
+            'latency_seconds_bucket{route="/a",le="0.1"} 1',
+            'latency_seconds_bucket{route="/a",le="1"} 2',
+            'latency_seconds_bucket{route="/a",le="+Inf"} 3',
+            'latency_seconds_sum{route="/a"} 5.55',
+            'latency_seconds_count{route="/a"} 3',
+        ]
+
+    def test_collectors_are_read_at_render_time(self):
+        metrics = Metrics()
+        depth = [0]
+        metrics.collector("queue_depth", "Queued calls.", lambda: [((), depth[0])])
+
+        depth[0] = 3
+
+        assert "queue_depth 3\n" in metrics.render()
+
+    def test_repository_calls_record_latency_and_capacity(self):
+        metrics = Metrics()
+        executor = DynamoExecutor(max_workers=2, metrics=metrics)
+        repo = InstrumentedRepository(
+            RoomRepository(MemoryDynamoDB(), "T", executor=executor),
+            "RoomRepository",
+            metrics,
+        )
+
+        async def run():
+            await repo.get_watermark()
+            try:
+                await repo.get_by_id("missing")
+            except NotFoundError:
+                pass
+
+        asyncio.run(run())
+        executor.shutdown()
+
+        assert metrics.repository_seconds.count("RoomRepository", "get_watermark") == 1
+        assert metrics.repository_seconds.count("RoomRepository", "get_by_id") == 1
+        assert metrics.consumed_capacity.value("RoomRepository", "get_watermark", "T") > 0
+        assert repo.shard_count == 1
@@ -0,0 +1,99 @@
+import asyncio
+import pytest
+from decimal import Decimal
+from app.utils.errors import InvalidInputError
+from app.utils.pagination import (
+    decode_next_token,
+    encode_next_token,
+    query_all,
+    query_partitions_page,
+)
+
+
+class TestPagination:
+
+    @pytest.fixture
+    def pages(self):
+        return [
+            {"Items": [{"ID": "1"}, {"ID": "2"}], "LastEvaluatedKey": {"SK": "2"}},
+            {"Items": [{"ID": "3"}], "LastEvaluatedKey": {"SK": "3"}},
+            {"Items": [{"ID": "4"}]},
+        ]
+
+    @pytest.fixture
+    def fake_query(self, pages):
+        calls = []
+
+        async def query(**kwargs):
+            calls.append(kwargs)
+            start = kwargs.get("ExclusiveStartKey")
+            index = {"2": 1, "3": 2}[start["SK"]] if start else 0
+            return pages[index]
+
+        query.calls = calls
+        return query
+
+    def test_query_all_follows_last_evaluated_key(self, fake_query):
+        items = asyncio.run(query_all(fake_query, KeyConditionExpression="x"))
+
+        assert [i["ID"] for i in items] == ["1", "2", "3", "4"]
+        assert len(fake_query.calls) == 3
+        assert fake_query.calls[1]["ExclusiveStartKey"] == {"SK": "2"}
+
+    def test_single_partition_page_returns_cursor(self, fake_query):
+        items, token = asyncio.run(query_partitions_page(fake_query, [{}], 2, None))
+
+        assert [i["ID"] for i in items] == ["1", "2"]
+        assert decode_next_token(token) == {"p": 0, "k": {"SK": "2"}}
+
+        items, token = asyncio.run(query_partitions_page(fake_query, [{}], 5, token))
+
+        assert [i["ID"] for i in items] == ["3", "4"]
+        assert token is None
+
+    def test_single_partition_without_limit_returns_everything(self, fake_query):
+        items, token = asyncio.run(query_partitions_page(fake_query, [{}]))
+
+        assert len(items) == 4
+        assert token is None
+
+    def test_query_partitions_page_walks_partitions(self):
+        async def query(**kwargs):
+            items = [{"PK": kwargs["PK"], "n": i} for i in range(2)]
+            if "ExclusiveStartKey" in kwargs:
+                items = items[kwargs["ExclusiveStartKey"]["n"] + 1 :]
+            limit = kwargs.get("Limit", len(items))
+            if limit < len(items):
+                return {"Items": items[:limit], "LastEvaluatedKey": items[limit - 1]}
+            return {"Items": items}
+
+        partitions = [{"PK": "BOOKING#0"}, {"PK": "BOOKING#1"}]
+
+        items, token = asyncio.run(query_partitions_page(query, partitions, 3))
+
+        assert [i["PK"] for i in items] == ["BOOKING#0", "BOOKING#0", "BOOKING#1"]
+        assert decode_next_token(token) == {"p": 1, "k": {"PK": "BOOKING#1", "n": 0}}
+
+        items, token = asyncio.run(query_partitions_page(query, partitions, 3, token))
+
+        assert items == [{"PK": "BOOKING#1", "n": 1}]
+        assert token is None
+
+        items, token = asyncio.run(query_partitions_page(query, partitions))
+
+        assert len(items) == 4
+        assert token is None
+
+    def test_token_round_trip_with_decimals(self):
+        key = {"PK": "ROOM", "SK": "ROOM#1", "LSI1": Decimal("3")}
+
+        assert decode_next_token(encode_next_token(key)) == {
+            "PK": "ROOM",
+            "SK": "ROOM#1",
+            "LSI1": 3,
+        }
+
+    @pytest.mark.parametrize("token", ["not-base64!!", "bnVsbA==", "W10="])
+    def test_invalid_token(self, token):
+        with pytest.raises(InvalidInputError):
+            decode_next_token(token)
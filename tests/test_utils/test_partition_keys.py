@@ -0,0 +1,16 @@
+from app.utils.partition_keys import partition_key, partition_keys, shard_for
+
+
+class TestPartitionKeys:
+
+    def test_single_shard_keeps_legacy_key(self):
+        assert partition_key("BOOKING", "abc", 1) == "BOOKING"
+        assert partition_keys("BOOKING", 1) == ["BOOKING"]
+
+    def test_sharded_key_is_stable(self):
+        shard = shard_for("abc", 8)
+
+        assert 0 <= shard < 8
+        assert partition_key("BOOKING", "abc", 8) == f"BOOKING#{shard}"
+        assert partition_key("BOOKING", "abc", 8) in partition_keys("BOOKING", 8)
+        assert len(partition_keys("ROOM", 8)) == 8
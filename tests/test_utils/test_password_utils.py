@@ -0,0 +1,39 @@
+import asyncio
+import pytest
+from app.utils.errors import ServiceUnavailableError
+from app.utils.password_utils import PasswordHasher, get_rounds, hash_password
+
+
+class TestPasswordHasher:
+
+    @pytest.fixture
+    def hasher(self):
+        hasher = PasswordHasher(rounds=4, max_workers=1, max_pending=1)
+        yield hasher
+        hasher.shutdown()
+
+    def test_hash_and_verify(self, hasher):
+        async def run():
+            hashed = await hasher.hash("secret123")
+            return hashed, await hasher.verify(hashed, "secret123")
+
+        hashed, verified = asyncio.run(run())
+
+        assert verified is True
+        assert get_rounds(hashed) == 4
+        assert hasher.needs_rehash(hashed) is False
+        assert hasher.needs_rehash(hash_password("secret123", rounds=5)) is True
+
+    def test_saturated_pool_fails_fast(self, hasher):
+        async def run():
+            return await asyncio.gather(
+                hasher.hash("secret123"),
+                hasher.hash("secret123"),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+
+        assert isinstance(results[0], str)
+        assert isinstance(results[1], ServiceUnavailableError)
+        assert hasher.pending == 0
@@ -0,0 +1,71 @@
+import asyncio
+import threading
+import pytest
+from app.utils.errors import ConflictError, InvalidInputError
+from app.utils.profiler import SamplingProfiler
+
+
+def spin_until(stop):
+    while not stop.is_set():
+        pass
+
+
+async def sleepy_query():
+    await asyncio.sleep(1)
+
+
+async def sleepy_service():
+    await sleepy_query()
+
+
+async def sleepy_handler():
+    await sleepy_service()
+
+
+class TestSamplingProfiler:
+
+    def test_samples_threads_and_tasks_as_collapsed_stacks(self):
+        profiler = SamplingProfiler()
+        stop = threading.Event()
+        worker = threading.Thread(target=spin_until, args=(stop,), name="worker_3")
+
+        async def run():
+            task = asyncio.ensure_future(sleepy_handler())
+            try:
+                return await profiler.profile(0.2, interval=0.005)
+            finally:
+                task.cancel()
+
+        worker.start()
+        try:
+            collapsed = asyncio.run(run())
+        finally:
+            stop.set()
+            worker.join()
+
+        lines = collapsed.splitlines()
+        assert any(
+            line.startswith("thread worker;") and "spin_until (" in line for line in lines
+        )
+        assert any(
+            line.startswith("asyncio tasks;sleepy_handler (")
+            and ";sleepy_service (" in line
+            and ";sleepy_query (" in line
+            for line in lines
+        )
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+        assert not profiler.running
+
+    def test_rejects_concurrent_and_unbounded_profiles(self):
+        profiler = SamplingProfiler(max_seconds=1)
+
+        async def run():
+            first = asyncio.ensure_future(profiler.profile(0.1, interval=0.01))
+            await asyncio.sleep(0)
+            with pytest.raises(ConflictError):
+                await profiler.profile(0.1)
+            await first
+
+        asyncio.run(run())
+        with pytest.raises(InvalidInputError):
+            asyncio.run(profiler.profile(5))
@@ -0,0 +1,85 @@
+import asyncio
+from app.models.models import Room
+from app.repositories.instrumented_repos import InstrumentedRepository
+from app.repositories.memory_dynamodb import MemoryDynamoDB
+from app.repositories.rooms_repo import RoomRepository
+from app.utils.dynamo_executor import DynamoExecutor
+from app.utils.request_trace import RequestTrace, current_trace
+
+
+class TestRequestTrace:
+
+    def test_records_filtered_query_and_formats_it(self):
+        trace = RequestTrace()
+
+        trace.record(
+            "query",
+            {"IndexName": "RoomStartTimeIndex"},
+            {
+                "Items": [{}, {}],
+                "Count": 2,
+                "ScannedCount": 150,
+                "ConsumedCapacity": {"TableName": "T", "CapacityUnits": 2.5},
+            },
+            0.004,
+            "BookingRepository",
+            "get_by_room_and_time",
+        )
+        trace.record(
+            "transact_write_items",
+            {},
+            {"ConsumedCapacity": [{"TableName": "T", "CapacityUnits": 4.0}]},
+            0.002,
+        )
+
+        assert trace.summary() == {
+            "calls": 2,
+            "items": 2,
+            "scanned": 150,
+            "rcu": 2.5,
+            "wcu": 4.0,
+            "seconds": 0.006,
+        }
+        assert (
+            'db1;dur=4.0;desc="BookingRepository.get_by_room_and_time query '
+            'RoomStartTimeIndex 2/150 items 2.5 CU"'
+        ) in trace.server_timing()
+        assert trace.log_fields().endswith(
+            "ops=BookingRepository.get_by_room_and_time:1,transact_write_items:1"
+        )
+
+    def test_executor_records_calls_of_the_active_trace(self):
+        executor = DynamoExecutor(max_workers=2)
+        repo = InstrumentedRepository(
+            RoomRepository(MemoryDynamoDB(), "T", executor=executor), "RoomRepository"
+        )
+        room = Room(
+            id="room-1",
+            name="Everest",
+            room_number=101,
+            capacity=8,
+            floor=1,
+            amenities=["tv"],
+            location="North wing",
+        )
+
+        async def run():
+            await repo.create(room)
+            trace = RequestTrace()
+            token = current_trace.set(trace)
+            try:
+                await repo.get_by_id("room-1")
+                await repo.get_all()
+            finally:
+                current_trace.reset(token)
+            return trace
+
+        trace = asyncio.run(run())
+        executor.shutdown()
+
+        assert [(c.method, c.operation) for c in trace.calls] == [
+            ("get_by_id", "get_item"),
+            ("get_all", "query"),
+        ]
+        assert [c.count for c in trace.calls] == [1, 1]
+        assert all(c.read_units > 0 and c.write_units == 0 for c in trace.calls)
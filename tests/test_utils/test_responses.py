@@ -0,0 +1,45 @@
+import json
+from app.models.models import Booking
+from app.models.pydantic_models import BookingDTO
+from app.utils.responses import trusted_list_response
+
+
+class TestTrustedListResponse:
+
+    def test_matches_validated_serialization(self):
+        bookings = [
+            Booking.model_construct(
+                id=f"booking-{i}",
+                user_id="user-1",
+                user_name="John Doe",
+                room_id="room-1",
+                room_number=101,
+                start_time=1704700800 + i * 3600,
+                end_time=1704700800 + i * 3600 + 1800,
+                purpose="Sync",
+                status="Confirmed",
+                created_at=1704700000,
+                updated_at=1704700000,
+            )
+            for i in range(3)
+        ]
+
+        response = trusted_list_response(
+            BookingDTO,
+            ({**b.__dict__, "status": b.status.lower()} for b in bookings),
+            "next",
+        )
+
+        expected = [
+            BookingDTO(**{**b.model_dump(), "status": b.status.lower()}).model_dump()
+            for b in bookings
+        ]
+        assert json.loads(response.body) == expected
+        assert response.headers["X-Next-Token"] == "next"
+        assert response.media_type == "application/json"
+
+    def test_no_token_header_on_last_page(self):
+        response = trusted_list_response(BookingDTO, [])
+
+        assert response.body == b"[]"
+        assert "X-Next-Token" not in response.headers
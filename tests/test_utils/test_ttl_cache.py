@@ -0,0 +1,39 @@
+from unittest.mock import patch
+from app.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+
+    def test_hit_and_miss_counters(self):
+        cache = TTLCache(max_entries=10, ttl_seconds=60)
+
+        assert cache.get("a") is None
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 1, "evictions": 0}
+
+    def test_expired_entries_are_dropped(self):
+        cache = TTLCache(max_entries=10, ttl_seconds=5)
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=106.0):
+            assert cache.get("a") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidate(self):
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.invalidate("a", "missing")
+
+        assert cache.get("a") is None